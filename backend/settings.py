@@ -2,6 +2,7 @@ from pathlib import Path
 import os
 import dj_database_url
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -12,12 +13,63 @@ DEBUG = config('DEBUG', default=False, cast=bool)
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1').split(',')
 
 # --- DATABASE ---
+# DB_CONNECTION_MODE picks how each worker holds its Postgres connections:
+#   persistent - every thread keeps one connection for DB_CONN_MAX_AGE seconds and
+#                checks it is alive before reuse, so a failover costs no 500s
+#   pool       - psycopg's connection pool, DB_POOL_MIN_SIZE..DB_POOL_MAX_SIZE per worker
+#   pgbouncer  - DATABASE_URL points at PgBouncer in transaction mode, which can't
+#                keep server-side cursors or prepared statements across transactions
+DB_CONNECTION_MODE = config('DB_CONNECTION_MODE', default='persistent')
 DATABASES = {
     'default': dj_database_url.config(
         default=f'sqlite:///{BASE_DIR / "db.sqlite3"}',
-        conn_max_age=600
+        conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
+        conn_health_checks=True,
     )
 }
+if DB_CONNECTION_MODE not in ('persistent', 'pool', 'pgbouncer'):
+    raise ImproperlyConfigured("DB_CONNECTION_MODE must be 'persistent', 'pool' or 'pgbouncer'")
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    if DB_CONNECTION_MODE == 'pool':
+        # The pool owns connection lifetime, so Django must not keep its own.
+        # CONN_HEALTH_CHECKS makes the pool check each connection it hands out.
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            # Match GUNICORN_THREADS so no request waits for a connection
+            'max_size': config('DB_POOL_MAX_SIZE', default=4, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+        }
+    elif DB_CONNECTION_MODE == 'pgbouncer':
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+        DATABASES['default'].setdefault('OPTIONS', {})['prepare_threshold'] = None
+
+# --- CACHE ---
+# Local memory is per-process; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# backend (database, redis, memcached) so cache invalidation reaches every worker.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default=''),
+    }
+}
+# Throttle counters for the public endpoints. The LocMem default is per process,
+# so every gunicorn worker (and dyno) enforces the limits on its own. Set
+# THROTTLE_CACHE_BACKEND to redis or memcached for one limit across all of them;
+# the database backend's incr isn't atomic and undercounts concurrent requests.
+CACHES['throttle'] = {
+    'BACKEND': config('THROTTLE_CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+    'LOCATION': config('THROTTLE_CACHE_LOCATION', default='throttle'),
+}
+# Upper bound on how long a cached event feed can be served without revalidation.
+# With the per-process LocMem default, also how long other workers may keep
+# serving the feed after an event write (see core.cache.events_version_timeout)
+EVENT_FEED_CACHE_TIMEOUT = config('EVENT_FEED_CACHE_TIMEOUT', default=300, cast=int)
+
+# --- SERVING ---
+# Route the checkout, webhook and form endpoints to core.async_views.
+# backend/asgi.py turns this on, so it only needs setting by hand for tests.
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
 
 # --- APPS & MIDDLEWARE ---
 INSTALLED_APPS = [
@@ -45,6 +97,26 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# --- REST FRAMEWORK ---
+REST_FRAMEWORK = {
+    # Proxies in front of the app that append to X-Forwarded-For (the platform router),
+    # so throttles count the client's address rather than a spoofable header value
+    'NUM_PROXIES': config('NUM_PROXIES', default=1, cast=int),
+    # Per-form limits, each counted per client IP and per submitted email
+    'DEFAULT_THROTTLE_RATES': {
+        'contact.ip': config('THROTTLE_CONTACT_IP', default='10/hour'),
+        'contact.email': config('THROTTLE_CONTACT_EMAIL', default='3/hour'),
+        'partner_inquiry.ip': config('THROTTLE_PARTNER_INQUIRY_IP', default='10/hour'),
+        'partner_inquiry.email': config('THROTTLE_PARTNER_INQUIRY_EMAIL', default='3/hour'),
+        'volunteer_signup.ip': config('THROTTLE_VOLUNTEER_SIGNUP_IP', default='10/hour'),
+        'volunteer_signup.email': config('THROTTLE_VOLUNTEER_SIGNUP_EMAIL', default='3/hour'),
+        'newsletter.ip': config('THROTTLE_NEWSLETTER_IP', default='20/hour'),
+        'newsletter.email': config('THROTTLE_NEWSLETTER_EMAIL', default='3/hour'),
+        # Public site search, per client IP
+        'search.ip': config('THROTTLE_SEARCH_IP', default='60/min'),
+    },
+}
+
 # --- CORS ---
 CORS_ALLOW_ALL_ORIGINS = config('CORS_ALLOW_ALL_ORIGINS', default=False, cast=bool)
 CORS_ALLOWED_ORIGINS = config('CORS_ALLOWED_ORIGINS', default='').split(',') if config('CORS_ALLOWED_ORIGINS', default='') else []
@@ -53,6 +125,13 @@ CSRF_TRUSTED_ORIGINS = config('CSRF_TRUSTED_ORIGINS', default='').split(',') if
 # --- STRIPE & EMAIL ---
 STRIPE_SECRET_KEY = config("STRIPE_SECRET_KEY", default="")
 STRIPE_WEBHOOK_SECRET = config("STRIPE_WEBHOOK_SECRET", default="")
+STRIPE_CONNECT_TIMEOUT = config("STRIPE_CONNECT_TIMEOUT", default=3.0, cast=float)
+STRIPE_READ_TIMEOUT = config("STRIPE_READ_TIMEOUT", default=10.0, cast=float)
+STRIPE_MAX_NETWORK_RETRIES = config("STRIPE_MAX_NETWORK_RETRIES", default=2, cast=int)
+# Match the number of threads per worker so concurrent Stripe calls never wait on the pool
+STRIPE_HTTP_POOL_SIZE = config("STRIPE_HTTP_POOL_SIZE", default=10, cast=int)
+# Seconds to remember a Stripe customer's email when it is not on a Person yet
+STRIPE_CUSTOMER_CACHE_TTL = config("STRIPE_CUSTOMER_CACHE_TTL", default=3600, cast=int)
 EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
@@ -60,6 +139,14 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = config("EMAIL_HOST_USER", default="noreply@nourishlaredo.com")
 EMAIL_HOST_PASSWORD = config("GMAIL_APP_PASSWORD", default="")
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="Nourish Laredo <noreply@nourishlaredo.com>")
+# Newsletter campaigns use their own connection settings so bulk mail can go through a
+# provider sized for it, e.g. SendGrid's SMTP relay (smtp.sendgrid.net, user "apikey")
+CAMPAIGN_EMAIL_BACKEND = config('CAMPAIGN_EMAIL_BACKEND', default=EMAIL_BACKEND)
+CAMPAIGN_EMAIL_HOST = config('CAMPAIGN_EMAIL_HOST', default=EMAIL_HOST)
+CAMPAIGN_EMAIL_PORT = config('CAMPAIGN_EMAIL_PORT', default=EMAIL_PORT, cast=int)
+CAMPAIGN_EMAIL_USE_TLS = config('CAMPAIGN_EMAIL_USE_TLS', default=EMAIL_USE_TLS, cast=bool)
+CAMPAIGN_EMAIL_HOST_USER = config('CAMPAIGN_EMAIL_HOST_USER', default=EMAIL_HOST_USER)
+CAMPAIGN_EMAIL_HOST_PASSWORD = config('CAMPAIGN_EMAIL_HOST_PASSWORD', default=EMAIL_HOST_PASSWORD)
 
 # --- STATIC FILES ---
 STATIC_URL = '/static/'
@@ -86,6 +173,11 @@ AWS_S3_OBJECT_PARAMETERS = {
 # Storage backend
 DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
 
+# --- ADMIN ---
+# Changelists above this many rows (by the Postgres planner's estimate) show the
+# estimate instead of running an exact COUNT(*)
+ADMIN_EXACT_COUNT_LIMIT = config('ADMIN_EXACT_COUNT_LIMIT', default=10000, cast=int)
+
 # --- DJANGO CONFIG ---
 ROOT_URLCONF = 'backend.urls'
 
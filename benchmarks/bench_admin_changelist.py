@@ -0,0 +1,102 @@
+"""Time admin changelist pages on million-row donation and contact tables.
+
+Needs Postgres (planner estimates and full-text search are Postgres-only).
+Seeds rows with generate_series into the database at DATABASE_URL, so point
+it at a scratch database:
+
+    DATABASE_URL=postgres://... python benchmarks/bench_admin_changelist.py [rows]
+
+Each page is timed with exact counts (ADMIN_EXACT_COUNT_LIMIT raised past
+the table size) and with planner estimates.
+"""
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django
+
+django.setup()
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, override_settings
+
+from core.models import ContactMessage, Donation
+
+PAGES = [
+    ("donations", "/admin/core/donation/"),
+    ("donations ?currency", "/admin/core/donation/?currency=MXN"),
+    ("donations ?processor", "/admin/core/donation/?payment_processor=check"),
+    ("contacts search", "/admin/core/contactmessage/?q=volunteer+schedule"),
+]
+REPEAT = 3
+
+
+def seed(rows):
+    if Donation.objects.count() >= rows:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_donation (id, amount, currency, status, payment_processor,
+                                       processor_reference_id, kind, created_at)
+            SELECT gen_random_uuid(), 500 + i %% 5000, CASE WHEN i %% 50 = 0 THEN 'MXN' ELSE 'USD' END,
+                   CASE WHEN i %% 10 = 0 THEN 'pending' ELSE 'succeeded' END,
+                   CASE WHEN i %% 100 = 0 THEN 'check' ELSE 'stripe' END,
+                   'bench_' || i, 'one_time', now() - (i || ' minutes')::interval
+            FROM generate_series(1, %s) AS i
+            """,
+            [rows],
+        )
+        cursor.execute(
+            """
+            INSERT INTO core_contactmessage (name, email, subject, message, created_at)
+            SELECT 'Sender ' || i, 'sender' || i || '@example.com', 'Question ' || i,
+                   CASE WHEN i %% 1000 = 0 THEN 'Can I change my volunteer schedule?'
+                        ELSE 'Thanks for everything you do for the food bank.' END,
+                   now() - (i || ' minutes')::interval
+            FROM generate_series(1, %s) AS i
+            """,
+            [rows],
+        )
+        cursor.execute("ANALYZE core_donation; ANALYZE core_contactmessage")
+
+
+def best_of(client, url):
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        response = client.get(url)
+        timings.append(time.perf_counter() - started)
+        assert response.status_code == 200, (url, response.status_code)
+    return min(timings)
+
+
+def main():
+    if connection.vendor != "postgresql":
+        sys.exit("Set DATABASE_URL to a Postgres database")
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    call_command("migrate", verbosity=0)
+    seed(rows)
+    print(f"{ContactMessage.objects.count():,} contact messages, {Donation.objects.count():,} donations")
+
+    User = get_user_model()
+    user = User.objects.filter(username="bench-admin").first() or User.objects.create_superuser("bench-admin", password="x")
+    client = Client(SERVER_NAME="localhost")
+    client.force_login(user)
+
+    print(f"{'page':<24} {'exact ms':>9} {'estimated ms':>13}")
+    for label, url in PAGES:
+        with override_settings(ADMIN_EXACT_COUNT_LIMIT=10**12):
+            exact = best_of(client, url)
+        estimated = best_of(client, url)
+        print(f"{label:<24} {exact * 1000:>9.0f} {estimated * 1000:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Concurrent checkout requests handled by one worker, sync vs async views.
+
+Stripe is replaced by a stub that sleeps for UPSTREAM_LATENCY, so the numbers
+show how many requests a single worker can keep in flight while it waits on
+the network. The sync rows model a gunicorn sync/gthread worker, the async row
+a uvicorn worker running core.async_views.
+
+    python benchmarks/bench_async_checkout.py
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+# A file database, because the async views reach it from more than one thread
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncRequestFactory, RequestFactory
+
+from core import async_views, views
+
+REQUESTS = 50
+UPSTREAM_LATENCY = 0.5
+
+
+def slow_session_create(**options):
+    time.sleep(UPSTREAM_LATENCY)
+    session_id = f"cs_bench_{uuid.uuid4().hex}"
+    return SimpleNamespace(id=session_id, url=f"https://checkout.stripe.com/{session_id}")
+
+
+def body(i):
+    return json.dumps({"amount": 1000 + i, "email": f"donor{i}@example.com", "name": "Bench Donor"})
+
+
+def run_sync(threads):
+    factory = RequestFactory()
+
+    def one(i):
+        try:
+            request = factory.post("/api/donations/checkout/", data=body(i), content_type="application/json")
+            return views.create_checkout_session(request).status_code
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(one, range(REQUESTS)))
+
+
+def run_async():
+    factory = AsyncRequestFactory()
+
+    async def all_requests():
+        responses = await asyncio.gather(*(
+            async_views.create_checkout_session(
+                factory.post("/api/donations/checkout/", data=body(i), content_type="application/json")
+            )
+            for i in range(REQUESTS)
+        ))
+        return [response.status_code for response in responses]
+
+    return asyncio.run(all_requests())
+
+
+def main():
+    call_command("migrate", verbosity=0)
+    print(f"{REQUESTS} checkout requests, {UPSTREAM_LATENCY * 1000:.0f} ms simulated Stripe latency, one worker\n")
+    print(f"{'worker':<28}{'wall time':>12}{'req/s':>10}{'in flight':>12}")
+
+    cases = [
+        ("sync (1 thread)", lambda: run_sync(1)),
+        ("gthread (4 threads)", lambda: run_sync(4)),
+        ("async (uvicorn)", run_async),
+    ]
+    with patch("stripe.checkout.Session.create", side_effect=slow_session_create):
+        for label, run in cases:
+            started = time.perf_counter()
+            codes = run()
+            elapsed = time.perf_counter() - started
+            assert codes == [200] * REQUESTS, codes
+            in_flight = REQUESTS * UPSTREAM_LATENCY / elapsed
+            print(f"{label:<28}{elapsed:>11.2f}s{REQUESTS / elapsed:>10.1f}{in_flight:>12.1f}")
+
+    print(
+        f"\nThe async worker keeps up to STRIPE_HTTP_POOL_SIZE={settings.STRIPE_HTTP_POOL_SIZE} "
+        f"Stripe calls in flight; raise it to serve more concurrent checkouts."
+    )
+
+
+if __name__ == "__main__":
+    main()
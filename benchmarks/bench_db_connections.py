@@ -0,0 +1,131 @@
+"""Requests/sec for event_list under each DB_CONNECTION_MODE.
+
+Needs DATABASE_URL pointing at a Postgres database it may migrate and write
+to. Each mode runs in its own interpreter, because the connection settings
+are read when Django starts. The feed cache is switched off so every request
+reaches the database, and Django's request signals open and release
+connections exactly as they do in a gunicorn worker.
+
+"pgbouncer" only applies the PgBouncer-safe settings here; point DATABASE_URL
+at a PgBouncer in transaction mode to measure the pooler itself.
+
+    DATABASE_URL=postgres://... python benchmarks/bench_db_connections.py
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+os.environ.setdefault("ALLOWED_HOSTS", "testserver")
+os.environ.setdefault("CACHE_BACKEND", "django.core.cache.backends.dummy.DummyCache")
+
+THREADS = 4
+REQUESTS_PER_THREAD = 250
+EVENTS = 200
+
+CASES = [
+    ("new connection per request", {"DB_CONNECTION_MODE": "persistent", "DB_CONN_MAX_AGE": "0"}),
+    ("persistent + health checks", {"DB_CONNECTION_MODE": "persistent"}),
+    ("psycopg pool", {"DB_CONNECTION_MODE": "pool", "DB_POOL_MAX_SIZE": str(THREADS)}),
+    ("pgbouncer settings", {"DB_CONNECTION_MODE": "pgbouncer"}),
+]
+
+
+def setup_database():
+    import django
+
+    django.setup()
+    from datetime import date, timedelta
+
+    from django.core.management import call_command
+
+    from core.models import Event
+
+    call_command("migrate", verbosity=0)
+    Event.objects.filter(title__startswith="Bench event").delete()
+    Event.objects.bulk_create(
+        Event(title=f"Bench event {i}", description="x" * 200, date=date(2025, 1, 1) + timedelta(days=i), location="Laredo")
+        for i in range(EVENTS)
+    )
+
+
+def teardown_database():
+    import django
+
+    django.setup()
+    from core.models import Event
+
+    Event.objects.filter(title__startswith="Bench event").delete()
+
+
+def run_worker():
+    """Serve THREADS x REQUESTS_PER_THREAD feed requests and print the rate as JSON."""
+    import django
+
+    django.setup()
+    from wsgiref.util import setup_testing_defaults
+
+    from django.core.handlers.wsgi import WSGIHandler
+
+    # The real handler, not the test Client: the Client keeps each thread's
+    # connection open across requests, which hides what the pool does.
+    application = WSGIHandler()
+    statuses = []
+
+    def get_feed():
+        environ = {"PATH_INFO": "/api/events/", "QUERY_STRING": "limit=20", "HTTP_HOST": "testserver"}
+        setup_testing_defaults(environ)
+        response = application(environ, lambda status, headers: statuses.append(status))
+        b"".join(response)
+        response.close()
+
+    def hammer():
+        for _ in range(REQUESTS_PER_THREAD):
+            get_feed()
+
+    # One warm-up request so imports and URL resolution aren't timed
+    get_feed()
+    threads = [threading.Thread(target=hammer) for _ in range(THREADS)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    errors = sum(1 for status in statuses if not status.startswith("200"))
+    print(json.dumps({"rps": THREADS * REQUESTS_PER_THREAD / elapsed, "errors": errors}))
+
+
+def main():
+    if not os.environ.get("DATABASE_URL", "").startswith("postgres"):
+        sys.exit("Set DATABASE_URL to a Postgres database to run this benchmark.")
+
+    subprocess.run([sys.executable, __file__, "--setup"], check=True)
+    print(f"GET /api/events/?limit=20, {THREADS} threads x {REQUESTS_PER_THREAD} requests, feed cache off\n")
+    try:
+        for label, env in CASES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker"], env={**os.environ, **env},
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            errors = f"  ({result['errors']} errors)" if result["errors"] else ""
+            print(f"{label:<30}{result['rps']:>10.0f} req/s{errors}")
+    finally:
+        subprocess.run([sys.executable, __file__, "--teardown"], check=True)
+
+
+if __name__ == "__main__":
+    if "--setup" in sys.argv:
+        setup_database()
+    elif "--teardown" in sys.argv:
+        teardown_database()
+    elif "--worker" in sys.argv:
+        run_worker()
+    else:
+        main()
@@ -0,0 +1,74 @@
+"""Compare full vs sparse (?fields=) event serialization at 1k and 10k rows.
+
+Runs against a throwaway in-memory SQLite database:
+
+    python benchmarks/bench_event_serialization.py
+"""
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ["DATABASE_URL"] = "sqlite://:memory:"
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django
+
+django.setup()
+
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Event
+from core.serializers import EventSerializer
+
+CARD_FIELDS = ["id", "title", "date", "image"]
+REPEAT = 5
+
+
+def seed(count):
+    Event.objects.all().delete()
+    start = date(2015, 1, 1)
+    Event.objects.bulk_create(
+        Event(
+            title=f"Community Event {i}",
+            description="Lorem ipsum dolor sit amet. " * 40,
+            date=start + timedelta(days=i % 3650),
+            location="Laredo, TX",
+            image=f"events/event_{i}.jpg",
+        )
+        for i in range(count)
+    )
+
+
+def render(fields):
+    events = Event.objects.order_by("-date", "-id")
+    if fields:
+        events = events.only(*EventSerializer.only_columns(fields, always=("id", "date")))
+    data = EventSerializer(events, many=True, context={"fields": fields}).data
+    return JSONRenderer().render(data)
+
+
+def best_of(fields):
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        body = render(fields)
+        timings.append(time.perf_counter() - started)
+    return min(timings), len(body)
+
+
+def main():
+    call_command("migrate", verbosity=0)
+    print(f"{'rows':>6} {'variant':>7} {'bytes':>12} {'ms':>9}")
+    for count in (1_000, 10_000):
+        seed(count)
+        for label, fields in (("full", None), ("sparse", CARD_FIELDS)):
+            seconds, size = best_of(fields)
+            print(f"{count:>6} {label:>7} {size:>12,} {seconds * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
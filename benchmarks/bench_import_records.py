@@ -0,0 +1,54 @@
+"""Import a generated donations CSV twice (insert, then upsert) and report rows/sec.
+
+Runs against a throwaway SQLite database file by default; set DATABASE_URL
+to time Postgres instead:
+
+    python benchmarks/bench_import_records.py [rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+TMP_DIR = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(TMP_DIR, 'import.sqlite3')}")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django
+
+django.setup()
+
+from django.core.management import call_command
+
+from core.imports import import_records
+
+
+def write_csv(path, count):
+    with open(path, "w", newline="") as f:
+        f.write("email,first_name,last_name,amount,currency,status,kind,payment_processor,processor_reference_id,created_at\n")
+        for i in range(count):
+            donor = i % 20_000
+            f.write(
+                f"donor{donor}@example.com,Donor,{donor},{500 + i % 5000},USD,succeeded,one_time,"
+                f"check,{i},2015-{1 + i % 12:02d}-{1 + i % 28:02d}\n"
+            )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    call_command("migrate", verbosity=0)
+    path = os.path.join(TMP_DIR, "donations.csv")
+    write_csv(path, count)
+
+    for label in ("insert", "upsert"):
+        with open(path, newline="") as f:
+            started = time.perf_counter()
+            counts = import_records("donations", f)
+            seconds = time.perf_counter() - started
+        print(f"{label:>6}: {counts['imported']:,} rows in {seconds:.1f}s ({count / seconds:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
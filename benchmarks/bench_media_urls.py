@@ -0,0 +1,52 @@
+"""Time URL generation for 5k media keys with the stock S3 storage vs MediaStorage.
+
+No network is involved: the stock presigned path runs against a local stub
+endpoint and only exercises boto3's client-side machinery.
+
+    python benchmarks/bench_media_urls.py
+"""
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+
+import django
+
+django.setup()
+
+from storages.backends.s3 import S3Storage
+
+from core.s3 import MediaStorage
+
+ROWS = 5_000
+STUB_ENDPOINT = "http://127.0.0.1:9"
+KEYS = [f"events/community_event_{i}.jpg" for i in range(ROWS)]
+
+
+def time_urls(storage):
+    started = time.perf_counter()
+    for key in KEYS:
+        storage.url(key)
+    return time.perf_counter() - started
+
+
+def main():
+    cases = [
+        ("S3Storage, custom domain", S3Storage(), MediaStorage()),
+        ("S3Storage, bucket URL (no custom domain)",
+         S3Storage(custom_domain=None, endpoint_url=STUB_ENDPOINT),
+         MediaStorage(custom_domain=None)),
+    ]
+    print(f"{ROWS} URLs per run")
+    for label, before, after in cases:
+        before_s, after_s = time_urls(before), time_urls(after)
+        print(f"{label:<42} before {before_s * 1000:8.1f} ms   after {after_s * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
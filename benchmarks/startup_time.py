@@ -0,0 +1,98 @@
+"""Measure cold-start time: Django setup, URLconf import, and gunicorn boot to first response.
+
+Each phase runs in a fresh interpreter so nothing is already imported. Run it
+on a dyno (``heroku run python benchmarks/startup_time.py``) to compare sizes,
+or locally before and after a change. ``--json`` prints one line for log tracking.
+
+    python benchmarks/startup_time.py [--skip-gunicorn] [--json]
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a child interpreter and prints the cumulative time after each phase
+PHASES_SCRIPT = """
+import json, os, time
+started = time.perf_counter()
+marks = {}
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+import django
+django.setup()
+marks["django.setup"] = time.perf_counter() - started
+from backend.wsgi import application
+marks["wsgi application"] = time.perf_counter() - started
+from django.urls import get_resolver
+get_resolver().url_patterns
+marks["urlconf (views)"] = time.perf_counter() - started
+print(json.dumps(marks))
+"""
+
+
+def time_phases():
+    output = subprocess.run(
+        [sys.executable, "-c", PHASES_SCRIPT], cwd=BASE_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_gunicorn_boot(timeout=60):
+    """Seconds from launching gunicorn to the first HTTP response of any status."""
+    port = free_port()
+    env = dict(os.environ, WEB_CONCURRENCY="1")
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "backend.wsgi", "--bind", f"127.0.0.1:{port}"],
+        cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    request = urllib.request.Request(f"http://127.0.0.1:{port}/api/events/", headers={"Host": "localhost"})
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                urllib.request.urlopen(request, timeout=timeout)
+            except urllib.error.HTTPError:
+                pass
+            except (urllib.error.URLError, ConnectionError):
+                if server.poll() is not None:
+                    raise RuntimeError(f"gunicorn exited with status {server.returncode}")
+                time.sleep(0.02)
+                continue
+            return time.perf_counter() - started
+        raise RuntimeError(f"gunicorn did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skip-gunicorn", action="store_true", help="Only time the in-process phases")
+    parser.add_argument("--json", action="store_true", help="Print a single JSON line")
+    args = parser.parse_args()
+
+    timings = time_phases()
+    if not args.skip_gunicorn:
+        timings["gunicorn first response"] = time_gunicorn_boot()
+
+    if args.json:
+        print(json.dumps({"dyno": os.environ.get("DYNO", socket.gethostname()), **timings}))
+        return
+    for phase, seconds in timings.items():
+        print(f"{phase:<28}{seconds * 1000:>10.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
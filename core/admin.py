@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.db import connections
+from .exports import export_response
+from .pagination import EstimatedCountPaginator
 from .models import (
     Event, 
     VolunteerProfile, 
@@ -7,50 +10,188 @@ from .models import (
     Partner,
     ContactMessage,
     PartnerInquiry,
+    NewsletterSubscriber,
+    OutboundEmail,
+    WebhookEvent,
+    Campaign,
+    CampaignDelivery,
 )
 
 
+class LargeTableAdmin(admin.ModelAdmin):
+    """Changelist settings for tables that grow without bound."""
+
+    paginator = EstimatedCountPaginator
+    # Skips the second, unfiltered COUNT(*) behind "N results (M total)"
+    show_full_result_count = False
+
+
+class FullTextSearchAdmin(LargeTableAdmin):
+    """Searches ``search_vector`` with Postgres full-text search instead of icontains.
+
+    The vector must match the GIN expression index created for the model in
+    migration 0027, or Postgres falls back to a sequential scan. Other
+    databases keep the default ``search_fields`` behaviour.
+    """
+
+    search_vector = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term or connections[queryset.db].vendor != "postgresql":
+            return super().get_search_results(request, queryset, search_term)
+
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        queryset = queryset.alias(
+            search=SearchVector(*self.search_vector, config="english"),
+        ).filter(search=SearchQuery(search_term, config="english", search_type="websearch"))
+        return queryset, False
+
+
+# Hops from one value to the next through a btree index leading with the column,
+# touching one index entry per distinct value instead of every row
+DISTINCT_VALUES_SQL = """
+    WITH RECURSIVE distinct_values(value) AS (
+        (SELECT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY {column} LIMIT 1)
+        UNION ALL
+        SELECT (SELECT {column} FROM {table} WHERE {column} > value ORDER BY {column} LIMIT 1)
+        FROM distinct_values WHERE value IS NOT NULL
+    )
+    SELECT value FROM distinct_values WHERE value IS NOT NULL
+"""
+
+
+class IndexedValuesFilter(admin.AllValuesFieldListFilter):
+    """list_filter for a low-cardinality indexed column on a large table.
+
+    The stock filter lists choices with SELECT DISTINCT, which reads the
+    whole table on every changelist load. On Postgres this walks the index
+    instead; the column needs an index that it leads.
+    """
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        connection = connections[model_admin.get_queryset(request).db]
+        if connection.vendor != "postgresql" or field.model is not model:
+            return
+        sql = DISTINCT_VALUES_SQL.format(
+            column=connection.ops.quote_name(field.column),
+            table=connection.ops.quote_name(model._meta.db_table),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            self.lookup_choices = [row[0] for row in cursor.fetchall()]
+
+
+@admin.action(description="Export selected rows as CSV", permissions=["view"])
+def export_csv(modeladmin, request, queryset):
+    return export_response(modeladmin.export_name, queryset, "csv")
+
+
+@admin.action(description="Export selected rows as NDJSON", permissions=["view"])
+def export_ndjson(modeladmin, request, queryset):
+    return export_response(modeladmin.export_name, queryset, "ndjson")
+
+
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(FullTextSearchAdmin):
     list_display = ("title", "date", "location", "created_at")
     list_filter = ("date",)
     search_fields = ("title", "description", "location")
+    search_vector = ("title", "description", "location")
 
 
 @admin.register(VolunteerProfile)
-class VolunteerProfileAdmin(admin.ModelAdmin):
+class VolunteerProfileAdmin(LargeTableAdmin):
     list_display = ("full_name", "email", "phone", "created_at")
     search_fields = ("full_name", "email")
     list_filter = ("created_at",)
+    raw_id_fields = ("person",)
+    actions = [export_csv, export_ndjson]
+    export_name = "volunteers"
 
 @admin.register(Person)
-class PersonAdmin(admin.ModelAdmin):
+class PersonAdmin(LargeTableAdmin):
     list_display = ("email", "first_name", "last_name", "created_at")
     search_fields = ("email", "first_name", "last_name")
+    actions = [export_csv, export_ndjson]
+    export_name = "people"
 
 @admin.register(Donation)
-class DonationAdmin(admin.ModelAdmin):
+class DonationAdmin(LargeTableAdmin):
     list_display = (
         "amount",
         "currency",
         "status",
         "payment_processor",
+        "person",
+        "event",
         "created_at",
     )
-    list_filter = ("status", "currency", "payment_processor")
+    list_select_related = ("person", "event")
+    ordering = ("-created_at",)
+    raw_id_fields = ("person", "event")
+    list_filter = (
+        ("status", IndexedValuesFilter),
+        ("currency", IndexedValuesFilter),
+        ("payment_processor", IndexedValuesFilter),
+    )
     search_fields = ("processor_reference_id",)
+    actions = [export_csv, export_ndjson]
+    export_name = "donations"
 
 @admin.register(Partner)
 class PartnerAdmin(admin.ModelAdmin):
     list_display = ('name', 'website')
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(FullTextSearchAdmin):
     list_display = ('name', 'email', 'subject', 'created_at')
     readonly_fields = ('created_at',) # Keep the timestamp uneditable
+    raw_id_fields = ('person',)
     search_fields = ('name', 'email', 'message')
+    search_vector = ('name', 'email', 'subject', 'message')
 
 @admin.register(PartnerInquiry)
-class PartnerInquiryAdmin(admin.ModelAdmin):
+class PartnerInquiryAdmin(LargeTableAdmin):
     list_display = ('organization_name', 'contact_name', 'partnership_type', 'created_at')
-    list_filter = ('partnership_type',)
\ No newline at end of file
+    list_filter = ('partnership_type',)
+    raw_id_fields = ('person',)
+    actions = [export_csv, export_ndjson]
+    export_name = "inquiries"
+
+@admin.register(NewsletterSubscriber)
+class NewsletterSubscriberAdmin(LargeTableAdmin):
+    list_display = ('email', 'is_active', 'created_at')
+    list_filter = ('is_active',)
+    search_fields = ('email',)
+    raw_id_fields = ('person',)
+    actions = [export_csv, export_ndjson]
+    export_name = "subscribers"
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(LargeTableAdmin):
+    list_display = ('subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
+
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(LargeTableAdmin):
+    list_display = ('event_id', 'event_type', 'status', 'attempts', 'received_at', 'processed_at')
+    list_filter = ('status', 'event_type')
+    search_fields = ('event_id',)
+    readonly_fields = ('received_at', 'processed_at', 'last_error')
+
+@admin.register(Campaign)
+class CampaignAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'created_at', 'started_at', 'finished_at')
+    list_filter = ('status',)
+    readonly_fields = ('status', 'created_at', 'started_at', 'finished_at')
+
+@admin.register(CampaignDelivery)
+class CampaignDeliveryAdmin(LargeTableAdmin):
+    list_display = ('email', 'campaign', 'status', 'sent_at')
+    list_filter = ('status', 'campaign')
+    search_fields = ('email',)
+    raw_id_fields = ('subscriber',)
+    readonly_fields = ('sent_at', 'last_error')
@@ -0,0 +1,153 @@
+"""Async variants of the I/O-bound endpoints, routed when ASYNC_VIEWS is on.
+
+DRF's api_view is sync-only, so these are plain Django async views that
+return the same payloads and status codes as their counterparts in views.py.
+"""
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from rest_framework.exceptions import Throttled
+
+from .models import Donation, WebhookEvent
+from .serializers import (
+    ContactMessageSerializer, NewsletterSubscriberSerializer,
+    PartnerInquirySerializer, VolunteerProfileSerializer,
+)
+from .views import (
+    checkout_session_options, notify_contact_message, notify_newsletter_subscriber,
+    notify_partner_inquiry, notify_volunteer_signup, open_checkout_session,
+    save_submission, verified_webhook_event,
+)
+from .throttling import check_throttles, form_throttles
+
+logger = logging.getLogger(__name__)
+
+# One thread per pooled Stripe connection, so in-flight calls never wait on the pool
+stripe_executor = ThreadPoolExecutor(
+    max_workers=settings.STRIPE_HTTP_POOL_SIZE, thread_name_prefix="stripe"
+)
+
+
+def request_data(request):
+    """The request body as a dict (JSON or form-encoded), or None if it can't be parsed."""
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+    return request.POST.dict()
+
+
+def throttled_response(wait):
+    """The 429 DRF sends for a throttled request."""
+    exc = Throttled(wait)
+    return JsonResponse(
+        {"detail": str(exc.detail)}, status=exc.status_code, headers={"Retry-After": str(exc.wait)},
+    )
+
+
+async def submit_form(request, serializer_class, notify, scope, message=None):
+    data = request_data(request)
+    if data is None:
+        return JsonResponse({"error": "Invalid JSON body"}, status=400)
+
+    # Rejected before any validation, database or email work
+    wait = await sync_to_async(check_throttles)(form_throttles(scope), request, data)
+    if wait is not None:
+        return throttled_response(wait)
+
+    # Validation may query the database and the row and its outbox emails
+    # must commit together, so all of it runs in one sync_to_async hop.
+    def submit():
+        serializer = serializer_class(data=data)
+        if not serializer.is_valid():
+            return serializer.errors, 400
+        save_submission(serializer, notify)
+        return ({"message": message} if message else serializer.data), 201
+
+    body, status = await sync_to_async(submit)()
+    return JsonResponse(body, status=status)
+
+# ========================
+# EVENTS & VOLUNTEERS
+# ========================
+@csrf_exempt
+@require_POST
+async def volunteer_signup(request):
+    return await submit_form(request, VolunteerProfileSerializer, notify_volunteer_signup, "volunteer_signup")
+
+# ========================
+# STRIPE CHECKOUT SESSION
+# ========================
+@csrf_exempt
+@require_POST
+async def create_checkout_session(request):
+    data = request_data(request)
+    if data is None:
+        return JsonResponse({"error": "Invalid JSON body"}, status=400)
+
+    amount = data.get("amount")
+    is_recurring = data.get("is_recurring", False)
+    if not amount:
+        return JsonResponse({"error": "Amount required"}, status=400)
+
+    try:
+        # The pooled Stripe client is blocking; running it on stripe_executor
+        # keeps concurrent checkouts from queueing behind each other.
+        options = checkout_session_options(request, data)
+        session = await sync_to_async(
+            open_checkout_session, thread_sensitive=False, executor=stripe_executor
+        )(options)
+
+        if not is_recurring:
+            await Donation.objects.aget_or_create(
+                payment_processor="stripe",
+                processor_reference_id=session.id,
+                defaults={"amount": amount, "currency": "USD", "status": "pending"},
+            )
+
+        return JsonResponse({"url": session.url})
+    except Exception as e:
+        logger.error(f"Error creating session: {str(e)}")
+        return JsonResponse({"error": str(e)}, status=500)
+
+# ========================
+# STRIPE WEBHOOK
+# ========================
+@csrf_exempt
+@require_POST
+async def stripe_webhook(request):
+    webhook_event = verified_webhook_event(request)
+    if webhook_event is None:
+        return HttpResponse(status=400)
+
+    await WebhookEvent.objects.abulk_create([webhook_event], ignore_conflicts=True)
+    return HttpResponse(status=200)
+
+# ========================
+# PARTNERS & CONTACT
+# ========================
+@csrf_exempt
+@require_POST
+async def contact_submit(request):
+    return await submit_form(request, ContactMessageSerializer, notify_contact_message, "contact", "Message sent!")
+
+
+@csrf_exempt
+@require_POST
+async def partner_inquiry_submit(request):
+    return await submit_form(request, PartnerInquirySerializer, notify_partner_inquiry, "partner_inquiry", "Inquiry received!")
+
+
+@csrf_exempt
+@require_POST
+async def newsletter_subscribe(request):
+    return await submit_form(request, NewsletterSubscriberSerializer, notify_newsletter_subscriber, "newsletter", "Subscribed!")
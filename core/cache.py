@@ -0,0 +1,35 @@
+import time
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+EVENTS_VERSION_KEY = "events:version"
+
+
+def events_version_timeout(backend):
+    """How long the events version may live in ``backend``.
+
+    A shared cache sees every bump, so the version lives until the next
+    write. A per-process LocMemCache only sees bumps made by its own worker,
+    so there the version expires with the feed cache to bound how long other
+    workers keep serving (and 304-ing) stale events.
+    """
+    return settings.EVENT_FEED_CACHE_TIMEOUT if isinstance(backend, LocMemCache) else None
+
+
+def get_events_version():
+    """Current version of the Event table, in nanoseconds since the epoch of its last write."""
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    version = backend.get(EVENTS_VERSION_KEY)
+    if version is None:
+        # Cold, expired or evicted cache: start a new version rather than guess the old one
+        version = time.time_ns()
+        backend.add(EVENTS_VERSION_KEY, version, events_version_timeout(backend))
+        version = backend.get(EVENTS_VERSION_KEY, version)
+    return version
+
+
+def bump_events_version():
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    backend.set(EVENTS_VERSION_KEY, time.time_ns(), events_version_timeout(backend))
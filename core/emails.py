@@ -0,0 +1,110 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+RETRY_BASE_DELAY = timedelta(minutes=1)
+RETRY_MAX_DELAY = timedelta(hours=1)
+# How long a claimed batch stays reserved for the dispatcher sending it
+SEND_LEASE = timedelta(minutes=10)
+
+
+def queue_email(subject, body, recipients, from_email=None):
+    """Add a message to the outbox. Call this inside the transaction that saves the form row."""
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipients),
+    )
+
+
+def retry_delay(attempts):
+    return min(RETRY_BASE_DELAY * (2 ** (attempts - 1)), RETRY_MAX_DELAY)
+
+
+def _record_failure(email, error, now, max_attempts):
+    email.last_error = str(error)
+    if email.attempts >= max_attempts:
+        email.status = "failed"
+        logger.error(f"Giving up on outbound email {email.id} after {email.attempts} attempts: {error}")
+    else:
+        email.status = "pending"
+        email.next_attempt_at = now + retry_delay(email.attempts)
+
+
+def claim_batch(batch_size, max_attempts, now):
+    """Lease up to ``batch_size`` due messages to this dispatcher in one short transaction.
+
+    Claimed rows are marked "sending" with ``next_attempt_at`` as the lease
+    expiry, so other dispatchers skip them. A row still "sending" after its
+    lease ran out belongs to a dispatcher that died mid-send and is claimed
+    again, which may resend that one message.
+    """
+    with transaction.atomic():
+        batch = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status__in=["pending", "sending"], next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        claimed = []
+        for email in batch:
+            if email.status == "sending" and email.attempts >= max_attempts:
+                email.status = "failed"
+                email.last_error = "Dispatcher stopped while sending; not retried"
+                logger.error(f"Giving up on outbound email {email.id} after {email.attempts} attempts")
+            else:
+                email.status = "sending"
+                email.attempts += 1
+                email.next_attempt_at = now + SEND_LEASE
+                claimed.append(email)
+        OutboundEmail.objects.bulk_update(batch, ["status", "attempts", "next_attempt_at", "last_error"])
+    return claimed
+
+
+def dispatch_pending(batch_size=50, max_attempts=5):
+    """Send one batch of due messages over a single connection. Returns the batch size.
+
+    The batch is claimed in its own transaction and each message's outcome is
+    committed as soon as it is sent, so no lock is held during SMTP and a
+    crash part-way never resends the messages already delivered.
+    """
+    now = timezone.now()
+    batch = claim_batch(batch_size, max_attempts, now)
+    if not batch:
+        return 0
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        logger.error(f"Could not open mail connection: {e}")
+        for email in batch:
+            _record_failure(email, e, now, max_attempts)
+        OutboundEmail.objects.bulk_update(batch, ["status", "next_attempt_at", "last_error"])
+        return len(batch)
+
+    try:
+        for email in batch:
+            message = EmailMessage(
+                email.subject, email.body, email.from_email, email.recipients,
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as e:
+                _record_failure(email, e, timezone.now(), max_attempts)
+            else:
+                email.status = "sent"
+                email.sent_at = timezone.now()
+            email.save(update_fields=["status", "next_attempt_at", "last_error", "sent_at"])
+    finally:
+        connection.close()
+    return len(batch)
@@ -0,0 +1,115 @@
+import csv
+import json
+from io import StringIO
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .models import Donation, NewsletterSubscriber, PartnerInquiry, Person, VolunteerProfile
+
+CHUNK_SIZE = 2000
+
+# Dataset name -> (model, exported columns). Related columns are fetched in the
+# same query through values_list joins, so no model instances are built.
+EXPORTS = {
+    "volunteers": (
+        VolunteerProfile,
+        ("id", "full_name", "email", "phone", "availability", "motivation", "created_at"),
+    ),
+    "people": (
+        Person,
+        ("id", "email", "first_name", "last_name", "phone", "created_at"),
+    ),
+    "donations": (
+        Donation,
+        (
+            "id", "created_at", "amount", "currency", "status", "kind",
+            "payment_processor", "processor_reference_id",
+            "person__email", "person__first_name", "person__last_name",
+            "event_id", "event__title",
+        ),
+    ),
+    "inquiries": (
+        PartnerInquiry,
+        (
+            "id", "organization_name", "contact_name", "email", "phone", "website",
+            "partnership_type", "message", "created_at",
+        ),
+    ),
+    "subscribers": (
+        NewsletterSubscriber,
+        ("id", "email", "is_active", "created_at"),
+    ),
+}
+
+FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Leading characters that make Excel and Sheets evaluate a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def export_rows(queryset, columns, chunk_size=CHUNK_SIZE):
+    """Yield value tuples in primary key order, holding at most one chunk in memory."""
+    rows = queryset.order_by("pk").values_list("pk", *columns)
+    if not connections[queryset.db].settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+        for row in rows.iterator(chunk_size=chunk_size):
+            yield row[1:]
+        return
+
+    # Behind a transaction-mode pooler a client-side cursor would buffer the whole
+    # result, so seek through it by primary key one chunk at a time instead
+    last_pk = None
+    while True:
+        page = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+        chunk = list(page[:chunk_size])
+        for row in chunk:
+            yield row[1:]
+        if len(chunk) < chunk_size:
+            return
+        last_pk = chunk[-1][0]
+
+
+def csv_cell(value):
+    """Quote text a spreadsheet would run as a formula; form fields are public input."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_chunks(rows, columns, chunk_size=CHUNK_SIZE):
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, 1):
+        writer.writerow([csv_cell(value) for value in row])
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def ndjson_chunks(rows, columns, chunk_size=CHUNK_SIZE):
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder))
+        if len(lines) == chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_response(name, queryset, fmt="csv"):
+    """Stream ``queryset`` as the ``name`` dataset in CSV or NDJSON, one chunk of rows per write."""
+    columns = EXPORTS[name][1]
+    encode = csv_chunks if fmt == "csv" else ndjson_chunks
+    response = StreamingHttpResponse(
+        encode(export_rows(queryset, columns), columns),
+        content_type=FORMATS[fmt],
+    )
+    filename = f"{name}-{timezone.localdate().isoformat()}.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
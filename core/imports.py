@@ -0,0 +1,166 @@
+import csv
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .models import Donation, Event, VolunteerProfile
+from .people import normalize_email, resolve_people, split_name
+from .rollups import rebuild_rollups
+from .serializers import DonationImportSerializer, VolunteerImportSerializer
+
+CHUNK_SIZE = 2000
+
+
+class RecordImport:
+    """How one kind of CSV row is validated, resolved and upserted."""
+
+    model = None
+    serializer_class = None
+    unique_fields = ()
+    update_fields = ()
+
+    def resolve(self, rows):
+        """Bulk lookups for a chunk of validated rows. Returns {index: error} for rows that fail them."""
+        return {}
+
+    def build(self, data):
+        return self.model(**data)
+
+    def key(self, instance):
+        return tuple(getattr(instance, field) for field in self.unique_fields)
+
+    def written(self, instances):
+        """Called with each chunk's upserted instances, inside its transaction."""
+
+    def finish(self):
+        """Called once after every chunk was written."""
+
+
+class DonationImport(RecordImport):
+    model = Donation
+    serializer_class = DonationImportSerializer
+    unique_fields = ("payment_processor", "processor_reference_id")
+    update_fields = ("person", "event", "amount", "currency", "status", "kind", "created_at")
+
+    def __init__(self):
+        self.earliest = None
+
+    def resolve(self, rows):
+        errors = {}
+        event_ids = {data["event_id"] for data in rows.values() if data.get("event_id")}
+        known_events = set(Event.objects.filter(pk__in=event_ids).values_list("pk", flat=True))
+        for index, data in rows.items():
+            if data.get("event_id") and data["event_id"] not in known_events:
+                errors[index] = {"event": [f"Event {data['event_id']} does not exist."]}
+
+        people = resolve_people(data for index, data in rows.items() if index not in errors)
+        for data in rows.values():
+            email = normalize_email(data.pop("email", ""))
+            data.pop("first_name", None)
+            data.pop("last_name", None)
+            data["person"] = people.get(email)
+        return errors
+
+    def written(self, instances):
+        for donation in instances:
+            if donation.status == "succeeded":
+                day = timezone.localdate(donation.created_at)
+                self.earliest = min(day, self.earliest or day)
+
+    def finish(self):
+        if self.earliest:
+            # bulk_create skips the per-donation rollup increment
+            rebuild_rollups(self.earliest)
+
+
+class VolunteerImport(RecordImport):
+    model = VolunteerProfile
+    serializer_class = VolunteerImportSerializer
+    unique_fields = ("email", "created_at")
+    update_fields = ("person", "full_name", "phone", "availability", "motivation")
+
+    def resolve(self, rows):
+        people = resolve_people(
+            dict(zip(("first_name", "last_name"), split_name(data["full_name"])), email=data["email"])
+            for data in rows.values()
+        )
+        for data in rows.values():
+            data["email"] = normalize_email(data["email"])
+            data["person"] = people[data["email"]]
+        return {}
+
+
+IMPORTS = {"donations": DonationImport, "volunteers": VolunteerImport}
+
+
+def csv_chunks(file, chunk_size):
+    """Yield lists of (line number, row) from a CSV file, blank cells dropped."""
+    reader = csv.DictReader(file)
+    rows = (
+        (reader.line_num, {name: value for name, value in row.items() if name and value not in ("", None)})
+        for row in reader
+    )
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def import_records(kind, file, chunk_size=CHUNK_SIZE, dry_run=False, on_error=None):
+    """Validate and upsert CSV rows of ``kind`` chunk by chunk, each chunk in its own transaction.
+
+    Rows that fail validation, or are superseded by a later row with the same
+    key in their chunk, are skipped and passed to ``on_error(line, row,
+    errors)``. With ``dry_run`` every chunk is rolled back after writing, so
+    database-level failures still surface. Returns imported/invalid counts.
+    """
+    importer = IMPORTS[kind]()
+    # One serializer validates every row: run_validation skips building a
+    # serializer (and its fields) per row, and nothing is ever saved through it
+    serializer = importer.serializer_class()
+    counts = {"imported": 0, "invalid": 0}
+
+    for chunk in csv_chunks(file, chunk_size):
+        valid, errors = {}, {}
+        for index, (line, row) in enumerate(chunk):
+            try:
+                valid[index] = serializer.run_validation(row)
+            except ValidationError as e:
+                errors[index] = e.detail
+
+        with transaction.atomic():
+            errors.update(importer.resolve(valid))
+            instances = {}
+            for index, data in valid.items():
+                if index not in errors:
+                    instance = importer.build(data)
+                    key = importer.key(instance)
+                    # A later row for the same key wins, as it would across chunks. The
+                    # earlier one is reported: one upsert can't write a key twice.
+                    if key in instances:
+                        earlier, _ = instances[key]
+                        errors[earlier] = {
+                            "non_field_errors": [f"Superseded by line {chunk[index][0]}, which has the same key."]
+                        }
+                    instances[key] = (index, instance)
+            importer.model.objects.bulk_create(
+                [instance for _, instance in instances.values()],
+                update_conflicts=True,
+                unique_fields=importer.unique_fields,
+                update_fields=importer.update_fields,
+            )
+            if dry_run:
+                transaction.set_rollback(True)
+            else:
+                importer.written(instance for _, instance in instances.values())
+
+        if on_error:
+            for index in sorted(errors):
+                line, row = chunk[index]
+                on_error(line, row, errors[index])
+        counts["invalid"] += len(errors)
+        counts["imported"] += len(instances)
+
+    if not dry_run:
+        importer.finish()
+    return counts
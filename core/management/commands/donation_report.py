@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from core.reports import GROUPS, donation_totals, parse_groups
+
+
+class Command(BaseCommand):
+    help = "Print donation totals grouped by period, status, kind and/or event."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--group", default="month", help=f"Comma-separated groups from: {', '.join(GROUPS)}")
+        parser.add_argument("--status", help="Only count donations with this status (e.g. succeeded)")
+        parser.add_argument("--from", dest="start", type=parse_date, help="First day to include (YYYY-MM-DD)")
+        parser.add_argument("--to", dest="end", type=parse_date, help="Last day to include (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        try:
+            groups = parse_groups(options["group"])
+        except ValueError as e:
+            raise CommandError(e)
+
+        rows = donation_totals(groups, options["status"], options["start"], options["end"])
+        for index, row in enumerate(rows):
+            if index == 0:
+                self.stdout.write("\t".join(row.keys()))
+            self.stdout.write("\t".join(str(value) for value in row.values()))
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.cache import bump_events_version
+from core.models import Event, Partner
+from core.renditions import generate_pending
+
+
+class Command(BaseCommand):
+    help = "Build responsive WebP/AVIF renditions for Event images and Partner logos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Rebuild every image (backfill) instead of only new uploads")
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument("--loop", action="store_true", help="Keep polling for new uploads")
+        parser.add_argument("--interval", type=float, default=30.0, help="Seconds to sleep between polls in --loop mode")
+
+    def handle(self, *args, **options):
+        force = options["force"]
+        batch_size = options["batch_size"]
+        total = 0
+        while True:
+            events = generate_pending(Event, "image", "image_renditions", force, batch_size)
+            partners = generate_pending(Partner, "logo", "logo_renditions", force, batch_size)
+            if events:
+                # Manifests are written with update(), which skips the feed's save signals
+                bump_events_version()
+            total += events + partners
+            force = False
+            if events or partners:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(f"Built renditions for {total} image(s).")
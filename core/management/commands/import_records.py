@@ -0,0 +1,62 @@
+import csv
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.imports import CHUNK_SIZE, IMPORTS, import_records
+
+
+class Command(BaseCommand):
+    help = "Import historical donations or volunteer sign-ups from a CSV file, upserting on their natural keys."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(IMPORTS))
+        parser.add_argument("path", help="CSV file with a header row named after the import serializer's fields")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows validated and written per transaction")
+        parser.add_argument("--dry-run", action="store_true", help="Validate and write each chunk, then roll it back")
+        parser.add_argument("--errors", help="Write rejected rows, with their line number and errors, to this CSV file")
+
+    def handle(self, *args, **options):
+        try:
+            source = open(options["path"], newline="", encoding="utf-8-sig")
+        except OSError as e:
+            raise CommandError(f"Could not open {options['path']}: {e}")
+
+        report = writer = None
+        with source:
+            header = next(csv.reader(source), None)
+            if not header:
+                raise CommandError(f"{options['path']} is empty")
+            source.seek(0)
+
+            if options["errors"]:
+                report = open(options["errors"], "w", newline="", encoding="utf-8")
+                writer = csv.writer(report)
+                writer.writerow(["line", "errors", *header])
+
+            def on_error(line, row, errors):
+                if writer:
+                    writer.writerow([line, json.dumps(errors), *(row.get(name, "") for name in header)])
+                else:
+                    self.stderr.write(f"Line {line}: {json.dumps(errors)}")
+
+            started = time.perf_counter()
+            try:
+                counts = import_records(
+                    options["kind"], source,
+                    chunk_size=options["chunk_size"],
+                    dry_run=options["dry_run"],
+                    on_error=on_error,
+                )
+            finally:
+                if report:
+                    report.close()
+            seconds = time.perf_counter() - started
+
+        rows = counts["imported"] + counts["invalid"]
+        note = " (dry run, nothing written)" if options["dry_run"] else ""
+        self.stdout.write(
+            f"Imported {counts['imported']} and rejected {counts['invalid']} of {rows} {options['kind']} row(s) "
+            f"in {seconds:.1f}s ({rows / max(seconds, 1e-6):,.0f} rows/s){note}."
+        )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.people import LINK_BATCH_SIZE, LINKED_MODELS, link_people
+
+
+class Command(BaseCommand):
+    help = "Link volunteers, contacts, inquiries and subscribers saved before person links to Person by email."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kinds", nargs="*", help=f"Any of {', '.join(LINKED_MODELS)}; defaults to all of them")
+        parser.add_argument("--batch-size", type=int, default=LINK_BATCH_SIZE, help="Rows linked per batch")
+
+    def handle(self, *args, **options):
+        unknown = set(options["kinds"]) - set(LINKED_MODELS)
+        if unknown:
+            raise CommandError(f"Unknown kind: {', '.join(sorted(unknown))}")
+        for kind in options["kinds"] or LINKED_MODELS:
+            model, name_field = LINKED_MODELS[kind]
+            linked = link_people(model, name_field, batch_size=options["batch_size"])
+            self.stdout.write(f"Linked {linked} {kind} row(s).")
@@ -0,0 +1,47 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.webhooks import process_next_event
+
+
+def drain(max_attempts):
+    processed = 0
+    while process_next_event(max_attempts):
+        processed += 1
+    return processed
+
+
+def drain_in_thread(max_attempts):
+    try:
+        return drain(max_attempts)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Process pending Stripe WebhookEvent rows with a pool of worker threads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--max-attempts", type=int, default=5)
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of exiting when the queue is empty")
+        parser.add_argument("--interval", type=float, default=2.0, help="Seconds to sleep between polls in --loop mode")
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        max_attempts = options["max_attempts"]
+        total = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while True:
+                if workers == 1:
+                    total += drain(max_attempts)
+                else:
+                    futures = [pool.submit(drain_in_thread, max_attempts) for _ in range(workers)]
+                    total += sum(future.result() for future in futures)
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+        self.stdout.write(f"Processed {total} webhook event(s).")
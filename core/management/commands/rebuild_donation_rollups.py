@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.utils.dateparse import parse_date
+
+from core.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute DonationDailyRollup rows from succeeded donations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="start", type=parse_date, help="Only rebuild days from this date (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        written = rebuild_rollups(options["start"])
+        self.stdout.write(f"Wrote {written} rollup row(s).")
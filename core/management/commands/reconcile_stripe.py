@@ -0,0 +1,49 @@
+from datetime import datetime, time, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from core.models import SyncWatermark
+from core.reconcile import (
+    list_checkout_sessions, list_paid_invoices, pages, reconcile_invoices, reconcile_sessions,
+)
+
+WATERMARK = "stripe_reconcile"
+# Re-read a little before the watermark so objects created during the last run are not missed
+OVERLAP = timedelta(hours=1)
+
+
+class Command(BaseCommand):
+    help = "Backfill and repair Donation rows from Stripe Checkout Sessions and Invoices."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", type=parse_date, help="Reconcile objects created on or after this date (YYYY-MM-DD) instead of the stored watermark")
+        parser.add_argument("--page-size", type=int, default=100, help="Objects per Stripe page and per database batch (max 100)")
+        parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+
+    def handle(self, *args, **options):
+        started = timezone.now()
+        page_size = min(options["page_size"], 100)
+        dry_run = options["dry_run"]
+
+        if options["since"]:
+            since = timezone.make_aware(datetime.combine(options["since"], time.min))
+        else:
+            watermark = SyncWatermark.objects.filter(name=WATERMARK).first()
+            since = watermark.value - OVERLAP if watermark else started - timedelta(days=30)
+
+        updated = created = 0
+        for page in pages(list_checkout_sessions(since, page_size), page_size):
+            page_updated, page_created = reconcile_sessions(page, dry_run)
+            updated += page_updated
+            created += page_created
+        for page in pages(list_paid_invoices(since, page_size), page_size):
+            created += reconcile_invoices(page, dry_run)
+
+        if not dry_run:
+            # Repaired donations were added to their rollups as they were written
+            SyncWatermark.objects.update_or_create(name=WATERMARK, defaults={"value": started})
+
+        note = " (dry run)" if dry_run else ""
+        self.stdout.write(f"Since {since:%Y-%m-%d %H:%M}: {updated} donation(s) updated, {created} created{note}.")
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from core.campaigns import send_campaign
+from core.models import Campaign
+
+
+class Command(BaseCommand):
+    help = "Send a newsletter Campaign to active subscribers, resuming where an interrupted run stopped."
+
+    def add_arguments(self, parser):
+        parser.add_argument("campaign_id", type=int)
+        parser.add_argument("--batch-size", type=int, default=500, help="Recipients checkpointed and sent per batch")
+        parser.add_argument("--connections", type=int, default=4, help="Mail connections kept open in parallel")
+        parser.add_argument("--retry-failed", action="store_true", help="Resend to recipients whose delivery failed")
+
+    def handle(self, *args, **options):
+        try:
+            campaign = Campaign.objects.get(pk=options["campaign_id"])
+        except Campaign.DoesNotExist:
+            raise CommandError(f"Campaign {options['campaign_id']} does not exist")
+        if campaign.status == "sent" and not options["retry_failed"]:
+            raise CommandError(f"Campaign {campaign.id} was already sent; use --retry-failed to resend failures")
+
+        try:
+            counts = send_campaign(
+                campaign,
+                batch_size=options["batch_size"],
+                connections=options["connections"],
+                retry_failed=options["retry_failed"],
+            )
+        except IntegrityError:
+            raise CommandError(f"Another send_campaign run is delivering campaign {campaign.id}")
+
+        unconfirmed = campaign.deliveries.filter(status="sending").count()
+        self.stdout.write(f"Sent {counts['sent']}, failed {counts['failed']} for campaign {campaign.id}.")
+        if unconfirmed:
+            self.stdout.write(
+                f"{unconfirmed} recipient(s) were left unconfirmed by an earlier interrupted run and were not resent."
+            )
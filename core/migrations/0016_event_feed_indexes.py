@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-18 00:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_webhookevent'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date', 'id'], name='core_event_date_e1c64a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['is_highlight', 'date', 'id'], name='core_event_is_high_ac8253_idx'),
+        ),
+    ]
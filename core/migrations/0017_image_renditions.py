@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 00:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_event_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Manifest of resized WebP/AVIF copies, filled in by generate_renditions'),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='logo_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Manifest of resized WebP/AVIF copies, filled in by generate_renditions'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-18 00:51
+
+import core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_image_renditions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.get_media_storage, upload_to='events/'),
+        ),
+        migrations.AlterField(
+            model_name='partner',
+            name='logo',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.get_media_storage, upload_to='partners/'),
+        ),
+    ]
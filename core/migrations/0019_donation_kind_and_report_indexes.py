@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-18 00:52
+
+from django.db import migrations, models
+
+
+def mark_recurring_donations(apps, schema_editor):
+    # Recurring donations are recorded from Stripe invoices (in_...),
+    # one-time donations from Checkout Sessions (cs_...)
+    Donation = apps.get_model('core', 'Donation')
+    Donation.objects.filter(processor_reference_id__startswith='in_').update(kind='recurring')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_shared_media_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='donation',
+            name='kind',
+            field=models.CharField(choices=[('one_time', 'One-time'), ('recurring', 'Recurring')], default='one_time', help_text='One-time checkout or recurring (subscription invoice) payment', max_length=20),
+        ),
+        migrations.RunPython(mark_recurring_donations, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['status', 'created_at'], name='core_donati_status_ec857f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['event', 'created_at'], name='core_donati_event_i_f72f6d_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-18 00:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_donation_kind_and_report_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DonationDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('kind', models.CharField(choices=[('one_time', 'One-time'), ('recurring', 'Recurring')], max_length=20)),
+                ('currency', models.CharField(max_length=10)),
+                ('total_amount', models.PositiveBigIntegerField(default=0, help_text='Sum of succeeded donations in smallest currency unit')),
+                ('donation_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='donation_rollups', to='core.event')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('date', 'event', 'kind', 'currency'), name='unique_donation_rollup'), models.UniqueConstraint(condition=models.Q(('event__isnull', True)), fields=('date', 'kind', 'currency'), name='unique_donation_rollup_without_event')],
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-18 00:54
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_references(apps, schema_editor):
+    # Duplicate invoice deliveries could record the same payment twice; keep the first row
+    Donation = apps.get_model('core', 'Donation')
+    duplicates = (
+        Donation.objects.values('payment_processor', 'processor_reference_id')
+        .annotate(rows=Count('id'))
+        .filter(rows__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        rows = Donation.objects.filter(
+            payment_processor=duplicate['payment_processor'],
+            processor_reference_id=duplicate['processor_reference_id'],
+        ).order_by('created_at')
+        Donation.objects.filter(pk__in=list(rows.values_list('pk', flat=True)[1:])).delete()
+
+
+def add_reference_trigram_index(apps, schema_editor):
+    # Backs DonationAdmin's icontains search, which Postgres runs as UPPER(col::text) LIKE ...
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS core_donation_reference_trgm_idx ON core_donation '
+        'USING gin (UPPER(processor_reference_id::text) gin_trgm_ops)'
+    )
+
+
+def drop_reference_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS core_donation_reference_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_donationdailyrollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_references, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='donation',
+            constraint=models.UniqueConstraint(fields=('payment_processor', 'processor_reference_id'), name='unique_processor_reference'),
+        ),
+        migrations.RunPython(add_reference_trigram_index, drop_reference_trigram_index),
+    ]
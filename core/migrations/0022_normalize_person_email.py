@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-18 01:02
+
+from django.db import migrations
+from django.db.models import F
+from django.db.models.functions import Lower, Trim
+
+
+def normalize_person_emails(apps, schema_editor):
+    # Fold emails to trimmed lower case, merging people that only differed by case or
+    # surrounding spaces into the oldest record
+    Person = apps.get_model('core', 'Person')
+    Donation = apps.get_model('core', 'Donation')
+
+    people = Person.objects.annotate(normalized=Lower(Trim('email')))
+    unnormalized = people.exclude(email=F('normalized')).order_by().values_list('normalized', flat=True).distinct()
+    for normalized in list(unnormalized):
+        survivor, *duplicates = people.filter(normalized=normalized).order_by('created_at', 'pk')
+        Donation.objects.filter(person__in=duplicates).update(person=survivor)
+        Person.objects.filter(pk__in=[person.pk for person in duplicates]).delete()
+        Person.objects.filter(pk=survivor.pk).update(email=normalized)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_unique_processor_reference'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_person_emails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-18 00:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_normalize_person_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncWatermark',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('value', models.DateTimeField(help_text='Objects created before this time have been reconciled')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
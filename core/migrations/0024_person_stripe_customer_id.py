@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 00:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_syncwatermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='person',
+            name='stripe_customer_id',
+            field=models.CharField(blank=True, db_index=True, help_text='Stripe Customer ID (cus_...), recorded from payment webhooks', max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-18 01:43
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_signups(apps, schema_editor):
+    # Double-submitted sign-ups can share an email and timestamp; keep the first row
+    VolunteerProfile = apps.get_model('core', 'VolunteerProfile')
+    duplicates = (
+        VolunteerProfile.objects.values('email', 'created_at')
+        .annotate(rows=Count('id'))
+        .filter(rows__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        rows = VolunteerProfile.objects.filter(
+            email=duplicate['email'],
+            created_at=duplicate['created_at'],
+        ).order_by('id')
+        VolunteerProfile.objects.filter(pk__in=list(rows.values_list('pk', flat=True)[1:])).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_campaign'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='donation',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='volunteerprofile',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(remove_duplicate_signups, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='volunteerprofile',
+            constraint=models.UniqueConstraint(fields=('email', 'created_at'), name='unique_volunteer_signup'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0 on 2026-10-18 01:51
+
+from django.db import migrations, models
+
+# Must match FullTextSearchAdmin.search_vector on each model's admin, or the
+# admin search expression won't match the index
+SEARCH_INDEXES = {
+    'ContactMessage': ('core_contactmessage_search_idx', ('name', 'email', 'subject', 'message')),
+    'Event': ('core_event_search_idx', ('title', 'description', 'location')),
+}
+
+
+def add_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    for model_name, (name, fields) in SEARCH_INDEXES.items():
+        index = GinIndex(SearchVector(*fields, config='english'), name=name)
+        schema_editor.add_index(apps.get_model('core', model_name), index)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, fields in SEARCH_INDEXES.values():
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_import_records'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['created_at'], name='core_donati_created_b3c808_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['currency', 'created_at'], name='core_donati_currenc_94fc90_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['payment_processor', 'created_at'], name='core_donati_payment_e41c91_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='volunteerprofile',
+            index=models.Index(fields=['created_at'], name='core_volunt_created_1b7e3f_idx'),
+        ),
+        migrations.RunPython(add_search_indexes, drop_search_indexes),
+    ]
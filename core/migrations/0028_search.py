@@ -0,0 +1,113 @@
+# Generated by Django 6.0 on 2026-10-18 01:56
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# table -> ((column, weight), ...); weights order Postgres ranking (A highest),
+# and the column order is the FTS5 column order core.search relies on
+SEARCH_COLUMNS = {
+    'core_event': (('title', 'A'), ('description', 'C'), ('location', 'B')),
+    'core_partner': (('name', 'A'), ('description', 'C')),
+}
+
+
+def postgres_trigger_sql(table, columns):
+    vector = ' || '.join(
+        f"setweight(to_tsvector('pg_catalog.english', coalesce(NEW.{column}, '')), '{weight}')"
+        for column, weight in columns
+    )
+    names = ', '.join(column for column, weight in columns)
+    return [
+        f"""
+        CREATE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {vector};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        f"""
+        CREATE TRIGGER {table}_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF {names}, search_vector ON {table}
+        FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+        """,
+        f'CREATE INDEX {table}_search_vector_idx ON {table} USING gin (search_vector)',
+        # Fire the trigger once for existing rows
+        f'UPDATE {table} SET search_vector = NULL',
+    ]
+
+
+def sqlite_fts_sql(table, columns):
+    # External-content FTS5 table kept in step with the base table by triggers,
+    # as in https://sqlite.org/fts5.html#external_content_tables
+    names = ', '.join(column for column, weight in columns)
+    new = ', '.join(f'new.{column}' for column, weight in columns)
+    old = ', '.join(f'old.{column}' for column, weight in columns)
+    return [
+        f"CREATE VIRTUAL TABLE {table}_fts USING fts5({names}, content='{table}', content_rowid='id', "
+        f"tokenize='porter unicode61 remove_diacritics 2')",
+        f"""
+        CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table} BEGIN
+            INSERT INTO {table}_fts(rowid, {names}) VALUES (new.id, {new});
+        END
+        """,
+        f"""
+        CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table} BEGIN
+            INSERT INTO {table}_fts({table}_fts, rowid, {names}) VALUES ('delete', old.id, {old});
+        END
+        """,
+        f"""
+        CREATE TRIGGER {table}_fts_update AFTER UPDATE ON {table} BEGIN
+            INSERT INTO {table}_fts({table}_fts, rowid, {names}) VALUES ('delete', old.id, {old});
+            INSERT INTO {table}_fts(rowid, {names}) VALUES (new.id, {new});
+        END
+        """,
+        f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')",
+    ]
+
+
+def add_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table, columns in SEARCH_COLUMNS.items():
+        if vendor == 'postgresql':
+            statements = postgres_trigger_sql(table, columns)
+        elif vendor == 'sqlite':
+            statements = sqlite_fts_sql(table, columns)
+        else:
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table in SEARCH_COLUMNS:
+        if vendor == 'postgresql':
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}')
+            schema_editor.execute(f'DROP FUNCTION IF EXISTS {table}_search_vector_update()')
+            schema_editor.execute(f'DROP INDEX IF EXISTS {table}_search_vector_idx')
+        elif vendor == 'sqlite':
+            for action in ('insert', 'delete', 'update'):
+                schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_fts_{action}')
+            schema_editor.execute(f'DROP TABLE IF EXISTS {table}_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_admin_changelist_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(add_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-18 01:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactmessage',
+            name='person',
+            field=models.ForeignKey(blank=True, help_text='Linked by normalized email; see core.people.upsert_person', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='contact_messages', to='core.person'),
+        ),
+        migrations.AddField(
+            model_name='newslettersubscriber',
+            name='person',
+            field=models.ForeignKey(blank=True, help_text='Linked by normalized email; see core.people.upsert_person', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='newsletter_subscriptions', to='core.person'),
+        ),
+        migrations.AddField(
+            model_name='partnerinquiry',
+            name='person',
+            field=models.ForeignKey(blank=True, help_text='Linked by normalized email; see core.people.upsert_person', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='partner_inquiries', to='core.person'),
+        ),
+        migrations.AddField(
+            model_name='volunteerprofile',
+            name='person',
+            field=models.ForeignKey(blank=True, help_text='Linked by normalized email; see core.people.upsert_person', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='volunteer_profiles', to='core.person'),
+        ),
+    ]
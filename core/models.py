@@ -1,6 +1,9 @@
 import uuid
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from storages.backends.s3boto3 import S3Boto3Storage
+from django.utils import timezone
+
+from .storage import get_media_storage
 
 class Event(models.Model):
     title = models.CharField(max_length=255)
@@ -12,7 +15,14 @@ class Event(models.Model):
         upload_to='events/', 
         blank=True, 
         null=True,
-        storage=S3Boto3Storage(),
+        storage=get_media_storage,
+    )
+
+    image_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Manifest of resized WebP/AVIF copies, filled in by generate_renditions"
     )
 
     # NEW: Link to news articles or social media posts
@@ -30,17 +40,46 @@ class Event(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Maintained by a database trigger on Postgres (see core.search); always null elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination and date-window filters on the event feed
+            models.Index(fields=['date', 'id']),
+            models.Index(fields=['is_highlight', 'date', 'id']),
+        ]
+
     def __str__(self):
         return self.title
 
 class VolunteerProfile(models.Model):
     full_name = models.CharField(max_length=255)
     email = models.EmailField()
+    person = models.ForeignKey(
+        "Person",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="volunteer_profiles",
+        help_text="Linked by normalized email; see core.people.upsert_person"
+    )
     phone = models.CharField(max_length=20)
     availability = models.CharField(max_length=255, blank=True)
     motivation = models.TextField(blank=True)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add, so import_records can keep historical sign-up dates
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        constraints = [
+            # Natural key that import_records upserts on, so re-running an import is harmless
+            models.UniqueConstraint(fields=["email", "created_at"], name="unique_volunteer_signup"),
+        ]
+        indexes = [
+            # VolunteerProfileAdmin's date filter and default ordering
+            models.Index(fields=["created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.full_name} ({self.email})"
@@ -56,6 +95,13 @@ class Person(models.Model):
     first_name = models.CharField(max_length=100, blank=True)
     last_name = models.CharField(max_length=100, blank=True)
     phone = models.CharField(max_length=20, blank=True)
+    stripe_customer_id = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Stripe Customer ID (cus_...), recorded from payment webhooks"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -64,6 +110,11 @@ class Person(models.Model):
         return self.email
 
 class Donation(models.Model):
+    KIND_CHOICES = [
+        ("one_time", "One-time"),
+        ("recurring", "Recurring"),
+    ]
+
     id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
@@ -111,24 +162,105 @@ class Donation(models.Model):
         help_text="PaymentIntent or transaction ID"
     )
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    kind = models.CharField(
+        max_length=20,
+        choices=KIND_CHOICES,
+        default="one_time",
+        help_text="One-time checkout or recurring (subscription invoice) payment"
+    )
+
+    # Not auto_now_add, so import_records can keep historical donation dates
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        constraints = [
+            # Webhook lookups and upserts go through this index; it also stops
+            # duplicate invoice deliveries from recording a donation twice
+            models.UniqueConstraint(
+                fields=["payment_processor", "processor_reference_id"],
+                name="unique_processor_reference",
+            ),
+        ]
+        indexes = [
+            # Donation reports filter by status/event and bucket by created_at
+            models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["event", "created_at"]),
+            # DonationAdmin lists newest first and filters on currency and processor
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["currency", "created_at"]),
+            models.Index(fields=["payment_processor", "created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.amount} {self.currency} ({self.status})"
 
+class DonationDailyRollup(models.Model):
+    date = models.DateField()
+    event = models.ForeignKey(
+        "Event",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="donation_rollups"
+    )
+    kind = models.CharField(max_length=20, choices=Donation.KIND_CHOICES)
+    currency = models.CharField(max_length=10)
+
+    total_amount = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Sum of succeeded donations in smallest currency unit"
+    )
+    donation_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "event", "kind", "currency"],
+                name="unique_donation_rollup",
+            ),
+            # NULLs are distinct in unique indexes, so rows without an event need their own
+            models.UniqueConstraint(
+                fields=["date", "kind", "currency"],
+                condition=models.Q(event__isnull=True),
+                name="unique_donation_rollup_without_event",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.kind}: {self.total_amount} {self.currency}"
+
 class Partner(models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField()
     website = models.URLField(blank=True, null=True)
-    logo = models.ImageField(upload_to='partners/', blank=True, null=True, storage=S3Boto3Storage())
+    logo = models.ImageField(upload_to='partners/', blank=True, null=True, storage=get_media_storage)
+    logo_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Manifest of resized WebP/AVIF copies, filled in by generate_renditions"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Maintained by a database trigger on Postgres (see core.search); always null elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
+
     def __str__(self):
         return self.name
 
 class ContactMessage(models.Model):
     name = models.CharField(max_length=255)
     email = models.EmailField()
+    person = models.ForeignKey(
+        "Person",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="contact_messages",
+        help_text="Linked by normalized email; see core.people.upsert_person"
+    )
     subject = models.CharField(max_length=255, blank=True)
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
@@ -148,6 +280,14 @@ class PartnerInquiry(models.Model):
     organization_name = models.CharField(max_length=255)
     contact_name = models.CharField(max_length=255)
     email = models.EmailField()
+    person = models.ForeignKey(
+        "Person",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="partner_inquiries",
+        help_text="Linked by normalized email; see core.people.upsert_person"
+    )
     phone = models.CharField(max_length=20, blank=True)
     website = models.URLField(blank=True, null=True)
     partnership_type = models.CharField(max_length=50, choices=PARTNERSHIP_CHOICES)
@@ -159,8 +299,139 @@ class PartnerInquiry(models.Model):
 
 class NewsletterSubscriber(models.Model):
     email = models.EmailField(unique=True) 
+    person = models.ForeignKey(
+        "Person",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="newsletter_subscriptions",
+        help_text="Linked by normalized email; see core.people.upsert_person"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True) 
 
     def __str__(self):
-        return self.email
\ No newline at end of file
+        return self.email
+
+class OutboundEmail(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    recipients = models.JSONField(help_text="List of recipient email addresses")
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Earliest time the dispatcher may (re)try this message; while sending, when its lease expires"
+    )
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
+
+class WebhookEvent(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processed', 'Processed'),
+        ('failed', 'Failed'),
+    ]
+
+    event_id = models.CharField(
+        max_length=255,
+        primary_key=True,
+        help_text="Stripe event ID (evt_...); duplicate deliveries collide here"
+    )
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField()
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} {self.event_id} ({self.status})"
+
+class SyncWatermark(models.Model):
+    name = models.CharField(max_length=100, primary_key=True)
+    value = models.DateTimeField(help_text="Objects created before this time have been reconciled")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.value}"
+
+class Campaign(models.Model):
+    STATUS_CHOICES = [
+        ('draft', 'Draft'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField(help_text="Plain-text Django template; {{ email }} is the recipient's address")
+    from_email = models.CharField(max_length=255, blank=True, help_text="Defaults to DEFAULT_FROM_EMAIL")
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.subject} ({self.status})"
+
+class CampaignDelivery(models.Model):
+    STATUS_CHOICES = [
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name='deliveries')
+    subscriber = models.ForeignKey(
+        NewsletterSubscriber, on_delete=models.SET_NULL, null=True, related_name='campaign_deliveries'
+    )
+    email = models.EmailField()
+
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='sending',
+        help_text="Recorded before the send; a row left in 'sending' may or may not have been delivered"
+    )
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'subscriber'], name='unique_campaign_delivery'),
+        ]
+        indexes = [
+            models.Index(fields=['campaign', 'status']),
+        ]
+
+    def __str__(self):
+        return f"{self.campaign_id} -> {self.email} ({self.status})"
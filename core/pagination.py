@@ -0,0 +1,76 @@
+import base64
+import json
+from datetime import date
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(event):
+    raw = f"{event.date.isoformat()}|{event.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return (date, pk) from a cursor string, raising ValueError when it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        day, pk = raw.split("|")
+        return date.fromisoformat(day), int(pk)
+    except (UnicodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def keyset_page(queryset, cursor=None, limit=DEFAULT_PAGE_SIZE, descending=True):
+    """Slice one page ordered by (date, id) starting after ``cursor``.
+
+    Seeking on the key instead of using OFFSET keeps every page a single
+    index range scan regardless of how deep into the archive it is.
+    """
+    if cursor:
+        day, pk = decode_cursor(cursor)
+        if descending:
+            queryset = queryset.filter(Q(date__lt=day) | Q(date=day, id__lt=pk))
+        else:
+            queryset = queryset.filter(Q(date__gt=day) | Q(date=day, id__gt=pk))
+
+    ordering = ("-date", "-id") if descending else ("date", "id")
+    rows = list(queryset.order_by(*ordering)[:limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def planner_estimate(queryset):
+    """Row count the Postgres planner expects ``queryset`` to return, without running it."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that skips the exact COUNT(*) on large Postgres result sets.
+
+    COUNT(*) has to visit every matching row, which takes seconds on a table
+    with millions of rows. Above ``ADMIN_EXACT_COUNT_LIMIT`` the planner's
+    estimate is close enough for page links; the last page may come up
+    short or empty when the estimate runs high.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connections[queryset.db].vendor == "postgresql":
+            estimate = planner_estimate(queryset)
+            if estimate > settings.ADMIN_EXACT_COUNT_LIMIT:
+                return estimate
+        return super().count
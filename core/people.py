@@ -0,0 +1,195 @@
+import uuid
+
+from django.db import connection
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from .models import ContactMessage, Donation, NewsletterSubscriber, PartnerInquiry, Person, VolunteerProfile
+
+LINK_BATCH_SIZE = 2000
+
+# Models linked to Person by email, with the field holding the submitter's full name
+LINKED_MODELS = {
+    "volunteers": (VolunteerProfile, "full_name"),
+    "contacts": (ContactMessage, "name"),
+    "inquiries": (PartnerInquiry, "contact_name"),
+    "subscribers": (NewsletterSubscriber, None),
+}
+
+# One statement: insert, or refresh the names only when a non-blank value differs.
+# A conflicting row that needs no change returns nothing and is read back instead.
+UPSERT_PERSON_SQL = """
+    INSERT INTO core_person (id, email, first_name, last_name, phone, stripe_customer_id, created_at, updated_at)
+    VALUES (%s, %s, %s, %s, '', %s, %s, %s)
+    ON CONFLICT (email) DO UPDATE SET
+        first_name = CASE WHEN EXCLUDED.first_name <> '' THEN EXCLUDED.first_name ELSE core_person.first_name END,
+        last_name = CASE WHEN EXCLUDED.last_name <> '' THEN EXCLUDED.last_name ELSE core_person.last_name END,
+        stripe_customer_id = COALESCE(EXCLUDED.stripe_customer_id, core_person.stripe_customer_id),
+        updated_at = EXCLUDED.updated_at
+    WHERE (EXCLUDED.first_name <> '' AND EXCLUDED.first_name <> core_person.first_name)
+       OR (EXCLUDED.last_name <> '' AND EXCLUDED.last_name <> core_person.last_name)
+       OR (EXCLUDED.stripe_customer_id IS NOT NULL
+           AND (core_person.stripe_customer_id IS NULL OR EXCLUDED.stripe_customer_id <> core_person.stripe_customer_id))
+    RETURNING id, email, first_name, last_name, phone, stripe_customer_id, created_at, updated_at
+"""
+
+# Insert-or-select for unauthenticated submissions: an existing person is left untouched
+LINK_PERSON_SQL = """
+    INSERT INTO core_person (id, email, first_name, last_name, phone, stripe_customer_id, created_at, updated_at)
+    VALUES (%s, %s, %s, %s, '', NULL, %s, %s)
+    ON CONFLICT (email) DO NOTHING
+    RETURNING id, email, first_name, last_name, phone, stripe_customer_id, created_at, updated_at
+"""
+
+def normalize_email(email):
+    return email.strip().lower() if email else ""
+
+
+def split_name(name):
+    parts = (name or "").strip().split(" ", 1)
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+def upsert_person(email, first_name="", last_name="", stripe_customer_id=None):
+    """Insert or update the Person for ``email`` without a read-modify-write race.
+
+    Blank names never overwrite known ones, and an unchanged row is not
+    rewritten, so ``updated_at`` only moves when something changed.
+    """
+    email = normalize_email(email)
+    if not email:
+        return None
+
+    fields = {field.name: field for field in Person._meta.concrete_fields}
+    now = fields["created_at"].get_db_prep_value(timezone.now(), connection)
+    params = [
+        fields["id"].get_db_prep_value(uuid.uuid4(), connection),
+        email, first_name, last_name, stripe_customer_id or None, now, now,
+    ]
+    people = list(Person.objects.raw(UPSERT_PERSON_SQL, params))
+    return people[0] if people else Person.objects.get(email=email)
+
+
+def link_person(email, first_name="", last_name=""):
+    """Return the Person for ``email``, creating it with the given names if missing.
+
+    Used for public form submissions, so anyone typing a known address
+    can't rename that person; existing people keep their names, as with
+    ``link_people``.
+    """
+    email = normalize_email(email)
+    if not email:
+        return None
+
+    fields = {field.name: field for field in Person._meta.concrete_fields}
+    now = fields["created_at"].get_db_prep_value(timezone.now(), connection)
+    params = [fields["id"].get_db_prep_value(uuid.uuid4(), connection), email, first_name, last_name, now, now]
+    people = list(Person.objects.raw(LINK_PERSON_SQL, params))
+    return people[0] if people else Person.objects.get(email=email)
+
+
+def get_or_create_person(email, name, stripe_customer_id=None):
+    return upsert_person(email, *split_name(name), stripe_customer_id=stripe_customer_id)
+
+
+def resolve_people(rows):
+    """Map normalized email -> Person for the rows' emails, creating missing people in one insert."""
+    names = {}
+    for data in rows:
+        email = normalize_email(data.get("email"))
+        if email:
+            names[email] = (data.get("first_name", ""), data.get("last_name", ""))
+
+    people = Person.objects.in_bulk(names, field_name="email")
+    missing = names.keys() - people.keys()
+    if missing:
+        # ignore_conflicts: a concurrent signup may create the same person meanwhile
+        Person.objects.bulk_create(
+            [Person(email=email, first_name=names[email][0], last_name=names[email][1]) for email in missing],
+            ignore_conflicts=True,
+        )
+        people.update(Person.objects.in_bulk(missing, field_name="email"))
+    return people
+
+
+def link_people(model, name_field=None, batch_size=LINK_BATCH_SIZE):
+    """Point unlinked ``model`` rows at the Person for their normalized email, creating missing people.
+
+    Walks the rows in primary-key order, ``batch_size`` at a time, with a
+    fixed number of queries per batch; existing people keep their names.
+    Returns the number of rows linked.
+    """
+    columns = ("pk", "email", name_field) if name_field else ("pk", "email")
+    unlinked = model.objects.filter(person__isnull=True).order_by("pk")
+    linked, last_pk = 0, None
+    while True:
+        batch = unlinked.filter(pk__gt=last_pk) if last_pk is not None else unlinked
+        rows = list(batch.values_list(*columns)[:batch_size])
+        if not rows:
+            return linked
+        last_pk = rows[-1][0]
+
+        people = resolve_people(
+            dict(zip(("first_name", "last_name"), split_name(row[2] if name_field else "")), email=row[1])
+            for row in rows
+        )
+        instances = [model(pk=row[0], person=people[normalize_email(row[1])]) for row in rows if normalize_email(row[1])]
+        model.objects.bulk_update(instances, ["person"])
+        linked += len(instances)
+
+
+def timeline_entry(entry_type, instance, **details):
+    return {"type": entry_type, "id": instance.pk, "created_at": instance.created_at, **details}
+
+
+def person_timeline_data(person_id):
+    """Everything linked to one person, newest first, in one query per related table.
+
+    Returns None if there is no such person.
+    """
+    person = (
+        Person.objects.prefetch_related(
+            Prefetch("donations", queryset=Donation.objects.select_related("event")),
+            "volunteer_profiles", "contact_messages", "partner_inquiries", "newsletter_subscriptions",
+        )
+        .filter(pk=person_id)
+        .first()
+    )
+    if person is None:
+        return None
+
+    entries = [
+        timeline_entry(
+            "donation", donation, amount=donation.amount, currency=donation.currency, status=donation.status,
+            kind=donation.kind, event=donation.event.title if donation.event else None,
+        )
+        for donation in person.donations.all()
+    ]
+    entries += [
+        timeline_entry("volunteer_signup", volunteer, availability=volunteer.availability, motivation=volunteer.motivation)
+        for volunteer in person.volunteer_profiles.all()
+    ]
+    entries += [
+        timeline_entry("contact_message", contact, subject=contact.subject, message=contact.message)
+        for contact in person.contact_messages.all()
+    ]
+    entries += [
+        timeline_entry(
+            "partner_inquiry", inquiry, organization_name=inquiry.organization_name,
+            partnership_type=inquiry.partnership_type, message=inquiry.message,
+        )
+        for inquiry in person.partner_inquiries.all()
+    ]
+    entries += [
+        timeline_entry("newsletter_subscription", subscriber, is_active=subscriber.is_active)
+        for subscriber in person.newsletter_subscriptions.all()
+    ]
+    entries.sort(key=lambda entry: entry["created_at"], reverse=True)
+
+    return {
+        "person": {
+            "id": person.pk, "email": person.email, "first_name": person.first_name,
+            "last_name": person.last_name, "phone": person.phone, "created_at": person.created_at,
+        },
+        "timeline": entries,
+    }
@@ -0,0 +1,141 @@
+import logging
+from datetime import datetime, timezone as dt_timezone
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Donation
+from .people import get_or_create_person
+from .rollups import record_succeeded_donation
+from .stripe_client import get_stripe
+
+logger = logging.getLogger(__name__)
+
+
+def pages(objects, size):
+    """Group an auto-paging iterator into lists of ``size`` so memory stays bounded."""
+    iterator = iter(objects)
+    while page := list(islice(iterator, size)):
+        yield page
+
+
+def existing_donations(references):
+    """One IN query for a page of Stripe ids, keyed by processor_reference_id."""
+    donations = Donation.objects.filter(payment_processor="stripe", processor_reference_id__in=references)
+    return {donation.processor_reference_id: donation for donation in donations}
+
+
+def paid_at(stripe_object):
+    """When Stripe took the payment: an invoice's paid_at transition, else the object's creation time."""
+    timestamp = (stripe_object.get("status_transitions") or {}).get("paid_at") or stripe_object.get("created")
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc) if timestamp else timezone.now()
+
+
+def session_donor(session):
+    """The Person for a paid session's customer, as handle_one_time_payment resolves it."""
+    customer_details = session.get("customer_details") or {}
+    return get_or_create_person(customer_details.get("email"), customer_details.get("name"), session.get("customer"))
+
+
+def create_missing(donations):
+    """Insert backfilled donations, skipping ones a webhook created meanwhile, and roll up the new ones.
+
+    Returns how many were inserted.
+    """
+    Donation.objects.bulk_create(donations, ignore_conflicts=True)
+    # ids are generated client-side, so the rows that kept theirs are the ones this insert wrote
+    inserted = Donation.objects.filter(pk__in=[donation.pk for donation in donations])
+    for donation in inserted:
+        record_succeeded_donation(donation)
+    return len(inserted)
+
+
+def reconcile_sessions(sessions, dry_run=False):
+    """Fix one-time donations whose checkout.session.completed webhook never arrived.
+
+    Repairs are conditional UPDATEs on status="pending", like
+    handle_one_time_payment's, so a webhook that lands after the page was
+    read wins, and only rows this call moves to succeeded are rolled up.
+    """
+    sessions = [session for session in sessions if session.get("mode") == "payment"]
+    known = existing_donations([session["id"] for session in sessions])
+    to_succeed, to_fail, to_create = [], [], []
+
+    for session in sessions:
+        donation = known.get(session["id"])
+        paid = session.get("payment_status") == "paid"
+        person = None
+        if paid and not dry_run and (donation is None or donation.status == "pending"):
+            # Repairs are the exception, so resolving their donor one by one is fine
+            person = session_donor(session)
+        if donation is None:
+            if paid:
+                to_create.append(Donation(
+                    amount=session.get("amount_total") or 0,
+                    currency=(session.get("currency") or "usd").upper(),
+                    status="succeeded",
+                    kind="one_time",
+                    payment_processor="stripe",
+                    processor_reference_id=session["id"],
+                    person=person,
+                    created_at=paid_at(session),
+                ))
+        elif donation.status == "pending" and paid:
+            if person:
+                donation.person = person
+            to_succeed.append(donation)
+        elif donation.status == "pending" and session.get("status") == "expired":
+            to_fail.append(donation)
+
+    if dry_run:
+        return len(to_succeed) + len(to_fail), len(to_create)
+
+    updated = 0
+    with transaction.atomic():
+        for donation in to_succeed:
+            pending = Donation.objects.filter(pk=donation.pk, status="pending")
+            if pending.update(status="succeeded", person=donation.person):
+                donation.status = "succeeded"
+                record_succeeded_donation(donation)
+                updated += 1
+        for donation in to_fail:
+            updated += Donation.objects.filter(pk=donation.pk, status="pending").update(status="failed")
+        created = create_missing(to_create)
+    return updated, created
+
+
+def reconcile_invoices(invoices, dry_run=False):
+    """Record paid subscription invoices that have no Donation row."""
+    invoices = [invoice for invoice in invoices if invoice.get("subscription")]
+    known = existing_donations([invoice["id"] for invoice in invoices])
+    to_create = []
+
+    for invoice in invoices:
+        if invoice["id"] in known:
+            continue
+        # Missing invoices are the exception, so resolving their donor one by one is fine
+        person = None if dry_run else get_or_create_person(invoice.get("customer_email"), invoice.get("customer_name"))
+        to_create.append(Donation(
+            amount=invoice.get("amount_paid") or 0,
+            currency=(invoice.get("currency") or "usd").upper(),
+            status="succeeded",
+            kind="recurring",
+            payment_processor="stripe",
+            processor_reference_id=invoice["id"],
+            person=person,
+            created_at=paid_at(invoice),
+        ))
+
+    if dry_run:
+        return len(to_create)
+    with transaction.atomic():
+        return create_missing(to_create)
+
+
+def list_checkout_sessions(since, page_size):
+    return get_stripe().checkout.Session.list(created={"gte": int(since.timestamp())}, limit=page_size).auto_paging_iter()
+
+
+def list_paid_invoices(since, page_size):
+    return get_stripe().Invoice.list(created={"gte": int(since.timestamp())}, status="paid", limit=page_size).auto_paging_iter()
@@ -0,0 +1,110 @@
+import logging
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+
+logger = logging.getLogger(__name__)
+
+RENDITION_WIDTHS = (320, 640, 1024, 1600)
+RENDITION_QUALITY = 80
+
+
+def rendition_formats():
+    from PIL import features
+
+    # AVIF needs a Pillow build with libavif; WebP is always available in the wheels
+    return ("avif", "webp") if features.check("avif") else ("webp",)
+
+
+def target_widths(original_width):
+    widths = [width for width in RENDITION_WIDTHS if width < original_width]
+    return widths + [original_width] if original_width <= RENDITION_WIDTHS[-1] else widths
+
+
+def build_renditions(field_file):
+    """Write resized WebP/AVIF copies next to ``field_file`` and return their manifest.
+
+    The manifest records the source name so a later upload can be detected
+    as stale, and maps format -> width -> storage key.
+    """
+    # Pillow is only needed by the rendition job, not by web workers serving srcsets
+    from PIL import Image, ImageOps
+
+    storage = field_file.storage
+    base, _ = os.path.splitext(field_file.name)
+
+    with storage.open(field_file.name, "rb") as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+    manifest = {"source": field_file.name, "width": image.width, "height": image.height, "formats": {}}
+    for fmt in rendition_formats():
+        keys = {}
+        for width in target_widths(image.width):
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            resized.save(buffer, format=fmt.upper(), quality=RENDITION_QUALITY)
+            keys[str(width)] = storage.save(f"{base}_{width}w.{fmt}", ContentFile(buffer.getvalue()))
+        manifest["formats"][fmt] = keys
+    return manifest
+
+
+def rendition_keys(manifest):
+    return {key for keys in manifest.get("formats", {}).values() for key in keys.values()}
+
+
+def delete_renditions(storage, manifest, keep=()):
+    """Delete the manifest's rendition files from ``storage``, except the keys in ``keep``."""
+    for key in rendition_keys(manifest) - set(keep):
+        try:
+            storage.delete(key)
+        except Exception as e:
+            logger.warning(f"Could not delete rendition {key}: {e}")
+
+
+def srcset(field_file, manifest):
+    """Map each rendition format to an HTML ``srcset`` string, or None when none exist."""
+    if not field_file or manifest.get("source") != field_file.name or not manifest.get("formats"):
+        return None
+    storage = field_file.storage
+    return {
+        fmt: ", ".join(f"{storage.url(key)} {width}w" for width, key in sorted(keys.items(), key=lambda item: int(item[0])))
+        for fmt, keys in manifest["formats"].items()
+    }
+
+
+def generate_pending(model, image_field, manifest_field, force=False, batch_size=20):
+    """Build renditions for rows whose manifest is empty, or for every row with ``force``.
+
+    Returns the number of rows handled.
+    """
+    rows = (
+        model.objects.exclude(**{image_field: ""})
+        .exclude(**{f"{image_field}__isnull": True})
+        .only("pk", image_field, manifest_field)
+        .order_by("pk")
+    )
+    if not force:
+        rows = rows.filter(**{manifest_field: {}})[:batch_size]
+
+    handled = 0
+    for row in rows.iterator():
+        field_file = getattr(row, image_field)
+        try:
+            manifest = build_renditions(field_file)
+        except Exception as e:
+            logger.error(f"Could not build renditions for {model.__name__} {row.pk} ({field_file.name}): {e}")
+            manifest = {"source": field_file.name, "error": str(e)}
+        # Only store the manifest if the image was not replaced while we worked
+        stored = model.objects.filter(pk=row.pk, **{image_field: field_file.name}).update(**{manifest_field: manifest})
+        if stored:
+            # A forced rebuild writes new keys; drop the ones it replaced
+            delete_renditions(field_file.storage, getattr(row, manifest_field), keep=rendition_keys(manifest))
+        else:
+            delete_renditions(field_file.storage, manifest)
+        handled += 1
+    return handled
@@ -0,0 +1,62 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+
+from .models import Donation
+
+PERIODS = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+DIMENSIONS = {"status": ("status",), "kind": ("kind",), "event": ("event_id", "event__title")}
+GROUPS = tuple(PERIODS) + tuple(DIMENSIONS)
+
+
+def parse_groups(value):
+    """Split ``group`` (e.g. "month,kind"), raising ValueError for unknown or clashing names."""
+    groups = [name.strip() for name in (value or "month").split(",") if name.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown group: {', '.join(sorted(unknown))}. Choose from {', '.join(GROUPS)}")
+    if len([name for name in groups if name in PERIODS]) > 1:
+        raise ValueError("Group by at most one of day, week, month")
+    return groups
+
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def created_between(start=None, end=None):
+    """Filters for rows created on local days ``start`` through ``end``.
+
+    Compares ``created_at`` with datetime bounds rather than casting it with
+    ``__date``, so indexes on the column serve the range.
+    """
+    filters = {}
+    if start:
+        filters["created_at__gte"] = start_of_day(start)
+    if end:
+        filters["created_at__lt"] = start_of_day(end + timedelta(days=1))
+    return filters
+
+
+def donation_totals(groups, status=None, start=None, end=None):
+    """Donation totals per group and currency, computed in a single aggregate query."""
+    donations = Donation.objects.filter(**created_between(start, end))
+    if status:
+        donations = donations.filter(status=status)
+
+    columns = []
+    for name in groups:
+        if name in PERIODS:
+            donations = donations.annotate(period=PERIODS[name]("created_at"))
+            columns.append("period")
+        else:
+            columns.extend(DIMENSIONS[name])
+    columns.append("currency")
+
+    return (
+        donations.values(*columns)
+        .annotate(total_amount=Sum("amount"), donation_count=Count("id"))
+        .order_by(*columns)
+    )
@@ -0,0 +1,69 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Donation, DonationDailyRollup
+
+
+def record_succeeded_donation(donation):
+    """Add a newly succeeded donation to its daily rollup row with an atomic increment."""
+    key = {
+        "date": timezone.localdate(donation.created_at),
+        "event_id": donation.event_id,
+        "kind": donation.kind,
+        "currency": donation.currency,
+    }
+    increment = {
+        "total_amount": F("total_amount") + donation.amount,
+        "donation_count": F("donation_count") + 1,
+    }
+    if DonationDailyRollup.objects.filter(**key).update(**increment):
+        return
+    try:
+        with transaction.atomic():
+            DonationDailyRollup.objects.create(**key, total_amount=donation.amount, donation_count=1)
+    except IntegrityError:
+        # Another worker created the row first
+        DonationDailyRollup.objects.filter(**key).update(**increment)
+
+
+def rebuild_rollups(start=None):
+    """Recompute rollup rows from Donation, from ``start`` onwards or entirely. Returns rows written."""
+    donations = Donation.objects.filter(status="succeeded").annotate(day=TruncDate("created_at"))
+    rollups = DonationDailyRollup.objects.all()
+    if start:
+        donations = donations.filter(day__gte=start)
+        rollups = rollups.filter(date__gte=start)
+
+    rows = (
+        donations.values("day", "event_id", "kind", "currency")
+        .annotate(total=Sum("amount"), count=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        rollups.delete()
+        created = DonationDailyRollup.objects.bulk_create(
+            DonationDailyRollup(
+                date=row["day"], event_id=row["event_id"], kind=row["kind"],
+                currency=row["currency"], total_amount=row["total"], donation_count=row["count"],
+            )
+            for row in rows.iterator()
+        )
+    return len(created)
+
+
+def campaign_totals(event_id=None, start=None, end=None):
+    """Totals per currency read from the rollup table (one row per day, not per donation)."""
+    rollups = DonationDailyRollup.objects.all()
+    if event_id is not None:
+        rollups = rollups.filter(event_id=event_id)
+    if start:
+        rollups = rollups.filter(date__gte=start)
+    if end:
+        rollups = rollups.filter(date__lte=end)
+    return (
+        rollups.values("currency")
+        .annotate(total_amount=Sum("total_amount"), donation_count=Sum("donation_count"))
+        .order_by("currency")
+    )
@@ -0,0 +1,68 @@
+"""S3 media storage. Importing this module loads boto3; go through core.storage instead."""
+import threading
+
+import boto3
+from django.conf import settings
+from django.utils.encoding import filepath_to_uri
+from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+_session = None
+_session_lock = threading.RLock()
+
+
+def shared_session():
+    """One boto3 session per process, created on first use and reused by every storage."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = boto3.Session(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+                )
+    return _session
+
+
+class MediaStorage(S3Storage):
+    """S3 storage for uploaded media with a boto3-free path for public URLs.
+
+    With ``AWS_QUERYSTRING_AUTH = False`` a URL is just the public base plus
+    the object key, so ``url()`` builds it with string formatting instead of
+    going through boto3's presigner.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.custom_domain:
+            self.public_base_url = f"{self.url_protocol}//{self.custom_domain}/"
+        elif not self.endpoint_url:
+            self.public_base_url = f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/"
+        else:
+            self.public_base_url = None
+
+    def _create_session(self):
+        return shared_session()
+
+    @property
+    def connection(self):
+        # boto3 sessions are not thread-safe, so build each thread's resource under the lock
+        if getattr(self._connections, "connection", None) is None:
+            with _session_lock:
+                return super().connection
+        return self._connections.connection
+
+    @property
+    def unsigned_connection(self):
+        if getattr(self._unsigned_connections, "connection", None) is None:
+            with _session_lock:
+                return super().unsigned_connection
+        return self._unsigned_connections.connection
+
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        if self.querystring_auth or parameters or http_method or self.public_base_url is None:
+            return super().url(name, parameters, expire, http_method)
+        name = clean_name(name)
+        if self.location:
+            name = self._normalize_name(name)
+        return self.public_base_url + filepath_to_uri(name)
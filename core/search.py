@@ -0,0 +1,133 @@
+"""Public full-text search over events and partners.
+
+On Postgres each table has a ``search_vector`` column kept current by a
+trigger and a GIN index over it (migration 0028). On SQLite the same
+migration creates an external-content FTS5 table per model, kept in step by
+triggers, so tests and local development search without Postgres. SQLite
+drops triggers when Django rebuilds a table, so a migration that alters
+Event or Partner there has to recreate them.
+"""
+import logging
+
+from django.db import connection
+from django.db.models import F, Q
+from django.utils.html import escape
+from django.utils.text import Truncator
+
+from .models import Event, Partner
+
+logger = logging.getLogger(__name__)
+
+MAX_QUERY_LENGTH = 200
+SNIPPET_WORDS = 24
+
+# Highlight markers that can't occur in text; they become <mark> after escaping
+START, STOP = "\x02", "\x03"
+
+
+class SearchSpec:
+    def __init__(self, model, title, body, extra, fts_weights):
+        self.model = model
+        self.title = title              # highlighted in full
+        self.body = body                # highlighted as a snippet
+        self.extra = extra              # returned as-is
+        self.fts_weights = fts_weights  # bm25 weight per FTS5 column
+
+    @property
+    def table(self):
+        return self.model._meta.db_table
+
+
+# FTS5 columns are (title, body, ...) as created in migration 0028; the weights
+# mirror the Postgres setweight() classes there
+SPECS = {
+    "events": SearchSpec(Event, "title", "description", ("date", "location"), (10.0, 1.0, 5.0)),
+    "partners": SearchSpec(Partner, "name", "description", ("website",), (10.0, 1.0)),
+}
+
+
+def mark(text):
+    """Escape ``text`` for HTML and turn the highlight markers into <mark> tags."""
+    return escape(text or "").replace(START, "<mark>").replace(STOP, "</mark>")
+
+
+def fts5_query(q):
+    """Quote every term so user input can't use (or break) FTS5 query syntax; terms are ANDed."""
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in q.split())
+
+
+def postgres_search(spec, q, limit):
+    from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+
+    query = SearchQuery(q, config="english", search_type="websearch")
+    rows = (
+        spec.model.objects.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            highlight=SearchHeadline(
+                spec.title, query, config="english", start_sel=START, stop_sel=STOP, highlight_all=True,
+            ),
+            snippet=SearchHeadline(
+                spec.body, query, config="english", start_sel=START, stop_sel=STOP,
+                max_words=SNIPPET_WORDS, min_words=SNIPPET_WORDS // 2,
+            ),
+        )
+        .order_by("-rank", "id")
+        .values("id", spec.title, *spec.extra, "highlight", "snippet", "rank")[:limit]
+    )
+    return list(rows)
+
+
+def sqlite_search(spec, q, limit):
+    fts = f"{spec.table}_fts"
+    columns = ", ".join(f"t.{name}" for name in ("id", spec.title, *spec.extra))
+    weights = ", ".join(str(weight) for weight in spec.fts_weights)
+    sql = f"""
+        SELECT {columns},
+               highlight({fts}, 0, %s, %s) AS highlight,
+               snippet({fts}, 1, %s, %s, '…', %s) AS snippet,
+               -bm25({fts}, {weights}) AS rank
+        FROM {fts} JOIN {spec.table} t ON t.id = {fts}.rowid
+        WHERE {fts} MATCH %s
+        ORDER BY rank DESC, t.id
+        LIMIT %s
+    """
+    params = [START, STOP, START, STOP, SNIPPET_WORDS, fts5_query(q), limit]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def basic_search(spec, q, limit):
+    """Unranked substring matches, for backends without a full-text index."""
+    matches = Q(**{f"{spec.title}__icontains": q}) | Q(**{f"{spec.body}__icontains": q})
+    rows = spec.model.objects.filter(matches).order_by("id").values("id", spec.title, spec.body, *spec.extra)[:limit]
+    results = []
+    for row in rows:
+        body = row.pop(spec.body)
+        results.append({**row, "highlight": row[spec.title], "snippet": Truncator(body).words(SNIPPET_WORDS), "rank": 0})
+    return results
+
+
+def search(kind, q, limit):
+    """Ranked matches for ``q`` among ``kind`` ("events" or "partners"), best first.
+
+    Raises ValueError for an unknown ``kind``.
+    """
+    spec = SPECS.get(kind)
+    if spec is None:
+        raise ValueError(f"Unknown search type: {kind}")
+    q = q.strip()[:MAX_QUERY_LENGTH]
+    if connection.vendor == "postgresql":
+        rows = postgres_search(spec, q, limit)
+    elif connection.vendor == "sqlite":
+        rows = sqlite_search(spec, q, limit)
+    else:
+        logger.warning("No full-text search on %s; falling back to substring matches", connection.vendor)
+        rows = basic_search(spec, q, limit)
+
+    for row in rows:
+        row["highlight"] = mark(row["highlight"])
+        row["snippet"] = mark(row["snippet"])
+    return rows
@@ -1,18 +1,91 @@
 from rest_framework import serializers
 from .models import VolunteerProfile, Event, Donation, Partner, PartnerInquiry, NewsletterSubscriber
+from .people import link_person, split_name
+from .renditions import srcset
 
-class EventSerializer(serializers.ModelSerializer):
+
+class SparseFieldsMixin:
+    """Drop every field not listed in ``context["fields"]`` (from ``?fields=a,b``)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get("fields")
+        if requested:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fields(cls, value):
+        """Split a ``fields`` query value, raising ValueError for unknown names."""
+        if not value:
+            return None
+        requested = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = set(requested) - set(cls().fields)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        return requested
+
+    # Columns read by fields that are not model fields themselves
+    sparse_field_columns = {}
+
+    @classmethod
+    def only_columns(cls, requested, always=("id",)):
+        """Model columns needed to render ``requested``, for ``QuerySet.only()``."""
+        concrete = {field.name for field in cls.Meta.model._meta.concrete_fields}
+        columns = (set(requested) & concrete) | set(always)
+        for name in requested:
+            columns.update(cls.sparse_field_columns.get(name, ()))
+        return sorted(columns)
+
+
+class PersonLinkMixin:
+    """Link each created row to the Person for its email; submitted names never overwrite a known person's."""
+
+    # Field holding the submitter's full name, if the form asks for one
+    person_name_field = None
+
+    def create(self, validated_data):
+        name = validated_data.get(self.person_name_field, "") if self.person_name_field else ""
+        validated_data["person"] = link_person(validated_data["email"], *split_name(name))
+        return super().create(validated_data)
+
+
+class EventSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     image = serializers.ImageField(use_url=True)
-    
+    image_srcset = serializers.SerializerMethodField()
+
+    sparse_field_columns = {"image_srcset": ("image", "image_renditions")}
+
     class Meta:
         model = Event
-        fields = "__all__"
+        exclude = ["image_renditions", "search_vector"]
+
+    def get_image_srcset(self, obj):
+        return srcset(obj.image, obj.image_renditions)
 
 
-class VolunteerProfileSerializer(serializers.ModelSerializer):
+class VolunteerProfileSerializer(PersonLinkMixin, serializers.ModelSerializer):
+    person_name_field = "full_name"
+
     class Meta:
         model = VolunteerProfile
-        fields = "__all__"
+        exclude = ["person"]
+        # created_at is always "now" for a sign-up, so the (email, created_at) check can't fail
+        validators = []
+
+class VolunteerImportSerializer(VolunteerProfileSerializer):
+    """Validates one paper sign-up row for import_records without touching the database.
+
+    ``created_at`` is required: together with the email it is the row's
+    upsert key, so a dateless row would be inserted again on every re-run.
+    """
+
+    created_at = serializers.DateTimeField(input_formats=["iso-8601", "%Y-%m-%d"])
+
+    class Meta(VolunteerProfileSerializer.Meta):
+        fields = ["full_name", "email", "phone", "availability", "motivation", "created_at"]
+        exclude = None
+        validators = []
 
 class DonationSerializer(serializers.ModelSerializer):
       class Meta:
@@ -25,24 +98,58 @@ class DonationSerializer(serializers.ModelSerializer):
             "created_at",
         )
 
-class PartnerSerializer(serializers.ModelSerializer):
+class DonationImportSerializer(DonationSerializer):
+    """Validates one historical donation row for import_records without touching the database.
+
+    The donor is given by email/name columns and the event by id; both are
+    resolved in bulk per chunk instead of per-row related-field lookups.
+    """
+
+    email = serializers.EmailField(required=False, allow_blank=True)
+    first_name = serializers.CharField(required=False, allow_blank=True, max_length=100)
+    last_name = serializers.CharField(required=False, allow_blank=True, max_length=100)
+    event = serializers.IntegerField(required=False, allow_null=True, min_value=1, source="event_id")
+    created_at = serializers.DateTimeField(required=False, input_formats=["iso-8601", "%Y-%m-%d"])
+
+    class Meta(DonationSerializer.Meta):
+        fields = [
+            "email", "first_name", "last_name", "amount", "currency", "status", "kind",
+            "payment_processor", "processor_reference_id", "event", "created_at",
+        ]
+        read_only_fields = ()
+        extra_kwargs = {"payment_processor": {"required": True}}
+        # Per-row uniqueness queries; the import upserts on the unique key instead
+        validators = []
+
+class PartnerSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    logo_srcset = serializers.SerializerMethodField()
+
+    sparse_field_columns = {"logo_srcset": ("logo", "logo_renditions")}
+
     class Meta:
         model = Partner
-        fields = ['id', 'name', 'description', 'website', 'logo']
+        fields = ['id', 'name', 'description', 'website', 'logo', 'logo_srcset']
+
+    def get_logo_srcset(self, obj):
+        return srcset(obj.logo, obj.logo_renditions)
 
 from .models import ContactMessage
 
-class ContactMessageSerializer(serializers.ModelSerializer):
+class ContactMessageSerializer(PersonLinkMixin, serializers.ModelSerializer):
+    person_name_field = "name"
+
     class Meta:
         model = ContactMessage
         fields = ['id', 'name', 'email', 'subject', 'message', 'created_at']
 
-class PartnerInquirySerializer(serializers.ModelSerializer):
+class PartnerInquirySerializer(PersonLinkMixin, serializers.ModelSerializer):
+    person_name_field = "contact_name"
+
     class Meta:
         model = PartnerInquiry
-        fields = '__all__'
+        exclude = ['person']
 
-class NewsletterSubscriberSerializer(serializers.ModelSerializer):
+class NewsletterSubscriberSerializer(PersonLinkMixin, serializers.ModelSerializer):
     class Meta:
         model = NewsletterSubscriber
         fields = ['email']
\ No newline at end of file
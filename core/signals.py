@@ -0,0 +1,39 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_events_version
+from .models import Event, Partner
+from .renditions import delete_renditions
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_event_feed(sender, **kwargs):
+    # After commit, so a reader can't cache pre-commit rows under the new version
+    transaction.on_commit(bump_events_version)
+
+
+def drop_stale_renditions(instance, image_field, manifest_field):
+    """Delete renditions built from an image the row no longer has, and empty its manifest.
+
+    Runs after the save, when the field holds the stored file name, so
+    generate_renditions picks the row up again.
+    """
+    field_file = getattr(instance, image_field)
+    manifest = getattr(instance, manifest_field)
+    if not manifest or manifest.get("source") == field_file.name:
+        return
+    delete_renditions(field_file.storage, manifest)
+    type(instance).objects.filter(pk=instance.pk).update(**{manifest_field: {}})
+    setattr(instance, manifest_field, {})
+
+
+@receiver(post_save, sender=Event)
+def reset_event_renditions(sender, instance, **kwargs):
+    drop_stale_renditions(instance, "image", "image_renditions")
+
+
+@receiver(post_save, sender=Partner)
+def reset_partner_renditions(sender, instance, **kwargs):
+    drop_stale_renditions(instance, "logo", "logo_renditions")
@@ -0,0 +1,55 @@
+import threading
+
+from django.core.files.storage import Storage
+
+_media_storage = None
+_media_storage_lock = threading.Lock()
+
+
+class LazyMediaStorage(Storage):
+    """Stands in for core.s3.MediaStorage until a file is actually touched.
+
+    FileField calls its storage callable while the model class is built, so
+    returning the S3 storage directly would import boto3 at django.setup().
+    Every Storage method and attribute is forwarded to the real backend,
+    which is created on first use.
+    """
+
+    def __init__(self):
+        self._backend = None
+
+    def _get_backend(self):
+        if self._backend is None:
+            with _media_storage_lock:
+                if self._backend is None:
+                    from .s3 import MediaStorage
+
+                    self._backend = MediaStorage()
+        return self._backend
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name == "_backend":
+            raise AttributeError(name)
+        return getattr(self._get_backend(), name)
+
+
+def _forward(name):
+    def method(self, *args, **kwargs):
+        return getattr(self._get_backend(), name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+# Storage implements these itself, so __getattr__ would never see them
+for _name, _value in vars(Storage).items():
+    if callable(_value) and not _name.startswith("_"):
+        setattr(LazyMediaStorage, _name, _forward(_name))
+
+
+def get_media_storage():
+    """Storage callable for media fields; every field shares the same instance."""
+    global _media_storage
+    if _media_storage is None:
+        _media_storage = LazyMediaStorage()
+    return _media_storage
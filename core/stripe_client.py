@@ -0,0 +1,62 @@
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def get_stripe():
+    """Return the stripe module, configured once per process with a pooled HTTP client.
+
+    Every Stripe call in the process shares one keep-alive ``requests.Session``
+    whose pool is sized to the worker's threads, with strict connect/read
+    timeouts and a bounded retry budget.
+    """
+    # Imported here so processes that never call Stripe don't pay for the SDK
+    import requests
+    import stripe
+    from requests.adapters import HTTPAdapter
+
+    global _configured
+    if not _configured:
+        with _configure_lock:
+            if not _configured:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.STRIPE_HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                stripe.api_key = settings.STRIPE_SECRET_KEY
+                stripe.default_http_client = stripe.RequestsClient(
+                    timeout=(settings.STRIPE_CONNECT_TIMEOUT, settings.STRIPE_READ_TIMEOUT),
+                    session=session,
+                )
+                # Safe for POSTs: the SDK sends an idempotency key with every retried request
+                stripe.max_network_retries = settings.STRIPE_MAX_NETWORK_RETRIES
+                _configured = True
+    return stripe
+
+
+@contextmanager
+def stripe_call(operation):
+    """Log the latency and outcome of one Stripe API call."""
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield get_stripe()
+    except Exception as e:
+        outcome = type(e).__name__
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"stripe_call operation={operation} outcome={outcome} duration_ms={elapsed_ms:.1f}")
+
+
+def idempotency_key(*parts):
+    """Stable key built from ``parts``, so a retried or double-submitted call replays instead of duplicating."""
+    return hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
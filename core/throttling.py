@@ -0,0 +1,111 @@
+import hashlib
+from functools import lru_cache
+
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+from .people import normalize_email
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """Sliding-window counter kept in the ``throttle`` cache.
+
+    Each fixed window is one counter bumped with ``incr``. The previous
+    window's count is weighted by how much of it still overlaps the sliding
+    window. Rejected attempts are counted as well, so a client that keeps
+    hammering stays blocked.
+
+    The limit is only as wide as the ``throttle`` cache: with the default
+    LocMemCache each worker process counts on its own, so a client gets the
+    rate once per process. Redis or memcached make it global; their ``incr``
+    is atomic. The database backend is shared but its ``incr`` is a get then
+    a set, so concurrent requests can lose counts.
+    """
+
+    cache_alias = "throttle"
+    cache_format = "throttle:%(scope)s:%(ident)s:%(window)d"
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_rate(self):
+        # Read on every instantiation so rates follow settings changes
+        self.THROTTLE_RATES = api_settings.DEFAULT_THROTTLE_RATES
+        return super().get_rate()
+
+    def identify(self, request, data):
+        """Return the identity to count this request against, or None to skip it."""
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        return self.allow(self.identify(request, request.data))
+
+    def allow(self, ident):
+        if self.rate is None or ident is None:
+            return True
+
+        now = self.timer()
+        window, offset = divmod(now, self.duration)
+        key = self.cache_format % {"scope": self.scope, "ident": ident, "window": window}
+        previous_key = self.cache_format % {"scope": self.scope, "ident": ident, "window": window - 1}
+
+        # Keep each counter for two windows so it can serve as "previous"
+        self.cache.add(key, 0, self.duration * 2)
+        try:
+            self.count = self.cache.incr(key)
+        except ValueError:
+            # Evicted between add and incr
+            self.cache.set(key, 1, self.duration * 2)
+            self.count = 1
+        self.previous = self.cache.get(previous_key, 0)
+        self.overlap = 1 - offset / self.duration
+
+        return self.previous * self.overlap + self.count <= self.num_requests
+
+    def wait(self):
+        if self.count <= self.num_requests:
+            # The previous window's share decays below the limit within this window
+            return max(0, self.duration * (self.overlap - (self.num_requests - self.count) / self.previous))
+        # This window alone is over the limit: wait for it to become "previous" and decay
+        return self.duration * (self.overlap + 1 - self.num_requests / self.count)
+
+
+class IPThrottle(SlidingWindowThrottle):
+    def identify(self, request, data):
+        return self.get_ident(request)
+
+
+class SearchIPThrottle(IPThrottle):
+    """Per-IP limit on the public search endpoint; every request runs a full-text query per type."""
+
+    scope = "search.ip"
+
+
+class EmailThrottle(SlidingWindowThrottle):
+    def identify(self, request, data):
+        email = data.get("email") if hasattr(data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        # Hashed so cache keys stay short and key-safe and don't hold addresses
+        return hashlib.sha256(normalize_email(email).encode()).hexdigest()[:32]
+
+
+@lru_cache(maxsize=None)
+def form_throttles(scope):
+    """Per-IP and per-email throttles for one form, rated by "<scope>.ip" and "<scope>.email"."""
+    name = scope.title().replace("_", "")
+    return (
+        type(f"{name}IPThrottle", (IPThrottle,), {"scope": f"{scope}.ip"}),
+        type(f"{name}EmailThrottle", (EmailThrottle,), {"scope": f"{scope}.email"}),
+    )
+
+
+def check_throttles(throttles, request, data):
+    """Apply throttle classes outside DRF. Returns the longest wait in seconds, or None if allowed."""
+    waits = []
+    for throttle in (throttle_class() for throttle_class in throttles):
+        if not throttle.allow(throttle.identify(request, data)):
+            waits.append(throttle.wait())
+    return max(waits) if waits else None
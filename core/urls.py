@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.urls import path
+from core import async_views
 from core.views import (
     event_list,
     volunteer_signup,
@@ -8,15 +10,33 @@ from core.views import (
     contact_submit,
     partner_inquiry_submit,
     newsletter_subscribe,
+    donation_report,
+    donation_totals_summary,
+    data_export,
+    site_search,
+    person_timeline,
 )
 
+if settings.ASYNC_VIEWS:
+    volunteer_signup = async_views.volunteer_signup
+    stripe_webhook = async_views.stripe_webhook
+    create_checkout_session = async_views.create_checkout_session
+    contact_submit = async_views.contact_submit
+    partner_inquiry_submit = async_views.partner_inquiry_submit
+    newsletter_subscribe = async_views.newsletter_subscribe
+
 urlpatterns = [
     path("events/", event_list, name="event-list"),
     path("volunteer-signup/", volunteer_signup),
     path('donations/webhook/', stripe_webhook, name='stripe_webhook'),
     path("donations/checkout/", create_checkout_session),
     path('partners/', get_partners, name='get_partners'),
+    path("search/", site_search, name="site_search"),
+    path("people/<uuid:person_id>/timeline/", person_timeline, name="person_timeline"),
     path("contact/", contact_submit, name="contact_submit"),
     path("partners/inquiry/", partner_inquiry_submit, name="partner_inquiry"),
     path("newsletter/subscribe/", newsletter_subscribe, name="newsletter_subscribe"),
-]
\ No newline at end of file
+    path("reports/donations/", donation_report, name="donation_report"),
+    path("donations/totals/", donation_totals_summary, name="donation_totals"),
+    path("exports/<slug:dataset>.<slug:fmt>", data_export, name="data_export"),
+]
@@ -1,18 +1,34 @@
+import json
 import logging
-import stripe
+from datetime import datetime
 from django.conf import settings
-from django.core.mail import send_mail
-from django.http import HttpResponse, JsonResponse
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_date
+from django.utils.http import http_date
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.throttling import BaseThrottle
 
-import cloudinary.api
-from .models import Event, VolunteerProfile, Donation, Person, Partner
+from .cache import get_events_version
+from .emails import queue_email
+from .exports import EXPORTS, FORMATS, export_response
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page
+from .people import person_timeline_data
+from .reports import created_between, donation_totals, parse_groups
+from .search import SPECS as SEARCH_SPECS, search
+from .rollups import campaign_totals
+from .stripe_client import idempotency_key, stripe_call
+from .throttling import SearchIPThrottle, form_throttles
+from .models import Event, VolunteerProfile, Donation, Partner, WebhookEvent
 from .serializers import (
     EventSerializer, VolunteerProfileSerializer, 
     DonationSerializer, ContactMessageSerializer, 
@@ -21,84 +37,212 @@ from .serializers import (
 )
 
 logger = logging.getLogger(__name__)
-stripe.api_key = settings.STRIPE_SECRET_KEY
+
+
+def client_ip(request):
+    """The client address as DRF's throttles see it, trusting only NUM_PROXIES X-Forwarded-For hops."""
+    return BaseThrottle().get_ident(request)
 
 # ========================
 # EVENTS & VOLUNTEERS 
 # ========================
+def date_param(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    day = parse_date(value)
+    if day is None:
+        raise ValueError(f"{name} must be a YYYY-MM-DD date")
+    return day
+
+
+def filter_events(params):
+    """Build the Event queryset for the feed filters. Returns (queryset, descending)."""
+    events = Event.objects.all()
+    descending = True
+
+    when = params.get("when")
+    if when == "upcoming":
+        events = events.filter(date__gte=timezone.localdate())
+        descending = False
+    elif when == "past":
+        events = events.filter(date__lt=timezone.localdate())
+    elif when:
+        raise ValueError("when must be 'upcoming' or 'past'")
+
+    highlight = params.get("highlight")
+    if highlight is not None:
+        if highlight.lower() not in ("true", "false"):
+            raise ValueError("highlight must be 'true' or 'false'")
+        events = events.filter(is_highlight=highlight.lower() == "true")
+
+    for param, lookup in (("from", "date__gte"), ("to", "date__lte")):
+        day = date_param(params, param)
+        if day:
+            events = events.filter(**{lookup: day})
+
+    return events, descending
+
+
+def event_feed_data(params):
+    events, descending = filter_events(params)
+
+    fields = EventSerializer.parse_fields(params.get("fields"))
+    if fields:
+        # "date" is always loaded because ordering and cursors read it
+        events = events.only(*EventSerializer.only_columns(fields, always=("id", "date")))
+    context = {"fields": fields}
+
+    # Pagination is opt-in so clients that expect the full array keep working
+    if "limit" not in params and "cursor" not in params:
+        events = events.order_by("-date", "-id") if descending else events.order_by("date", "id")
+        return EventSerializer(events, many=True, context=context).data
+
+    try:
+        limit = min(int(params.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be positive")
+
+    page, next_cursor = keyset_page(events, params.get("cursor"), limit, descending)
+    return {"results": EventSerializer(page, many=True, context=context).data, "next": next_cursor}
+
+
 @api_view(["GET"])
 def event_list(request):
-    events = Event.objects.all().order_by("-date")
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    # The version counter lives in the cache, so revalidation never touches the DB
+    version = get_events_version()
+    last_modified = version // 1_000_000_000
+    etag = f'"events-{version}"'
+    if "when" in request.query_params:
+        # upcoming/past roll over at midnight even when no Event was written
+        today = timezone.localdate()
+        midnight = timezone.make_aware(datetime.combine(today, datetime.min.time()))
+        last_modified = max(last_modified, int(midnight.timestamp()))
+        etag = f'"events-{version}-{today.isoformat()}"'
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
+
+    cache_key = f"events:list:{etag}:{request.query_params.urlencode()}"
+    data = cache.get(cache_key)
+    if data is None:
+        try:
+            data = event_feed_data(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+        cache.set(cache_key, data, settings.EVENT_FEED_CACHE_TIMEOUT)
+
+    response = Response(data)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, no_cache=True)
+    return response
+
+def save_submission(serializer, notify):
+    """Save a validated form and queue its emails in the same transaction."""
+    with transaction.atomic():
+        instance = serializer.save()
+        notify(instance)
+    return instance
+
+
+def notify_volunteer_signup(volunteer):
+    queue_email(
+        "New Volunteer Signup",
+        f"New volunteer: {volunteer.full_name}\nEmail: {volunteer.email}\nPhone: {volunteer.phone}\nMotivation: {volunteer.motivation}", 
+        ["volunteer@nourishlaredo.com"],
+        from_email="noreply@nourishlaredo.org",
+    )
+    queue_email(
+        "Welcome to Nourish Laredo!",
+        f"Hi {volunteer.full_name},\n\nThank you for signing up to volunteer with us!",
+        [volunteer.email],
+        from_email="noreply@nourishlaredo.org",
+    )
+
 
 @api_view(['POST'])
+@throttle_classes(form_throttles("volunteer_signup"))
 def volunteer_signup(request):
     serializer = VolunteerProfileSerializer(data=request.data)
     if serializer.is_valid():
-        volunteer = serializer.save()
-        send_mail(
-            "New Volunteer Signup",
-            f"New volunteer: {volunteer.full_name}\nEmail: {volunteer.email}\nPhone: {volunteer.phone}\nMotivation: {volunteer.motivation}", 
-            "noreply@nourishlaredo.org",
-            ["volunteer@nourishlaredo.com"],
-        )
-        send_mail(
-            "Welcome to Nourish Laredo!",
-            f"Hi {volunteer.full_name},\n\nThank you for signing up to volunteer with us!",
-            "noreply@nourishlaredo.org",
-            [volunteer.email],
-        )
+        save_submission(serializer, notify_volunteer_signup)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 # ========================
 # STRIPE CHECKOUT SESSION
 # ========================
+def checkout_session_options(request, data):
+    """Keyword arguments for checkout.Session.create built from the request body."""
+    amount = data.get("amount")
+    email = data.get("email")
+    name = data.get("name")
+    is_recurring = data.get("is_recurring", False)
+
+    price_data = {
+        "currency": "usd",
+        "unit_amount": amount,
+        "product_data": {"name": "Nourish Laredo Donation"},
+    }
+    if is_recurring:
+        price_data["recurring"] = {"interval": "month"}
+
+    # The frontend sends a fresh Idempotency-Key per donate click, so a retried
+    # or double-submitted click replays Stripe's original response instead of
+    # opening a second Checkout Session. Scoped to the client so one visitor
+    # can't replay another's session. Without it every request is a new session.
+    options = {}
+    client_key = request.headers.get("Idempotency-Key")
+    if client_key:
+        options["idempotency_key"] = idempotency_key("checkout", client_key, client_ip(request))
+
+    # PRODUCTION URLs - Replace localhost with your live domain
+    return dict(
+        mode="subscription" if is_recurring else "payment",
+        payment_method_types=["card"],
+        billing_address_collection="required",
+        customer_creation="always",
+        customer_email=email if email else None,
+        metadata={
+            "email": email or "",
+            "name": name or "",
+            "type": "recurring" if is_recurring else "one_time"
+        },
+        line_items=[{"price_data": price_data, "quantity": 1}],
+        success_url="https://www.nourishlaredo.com/donate?success=true",
+        cancel_url="https://www.nourishlaredo.com/donate?canceled=true",
+        **options,
+    )
+
+
+def open_checkout_session(options):
+    with stripe_call("checkout.Session.create") as stripe_api:
+        return stripe_api.checkout.Session.create(**options)
+
+
 @api_view(["POST"])
 def create_checkout_session(request):
     amount = request.data.get("amount")
-    email = request.data.get("email")
-    name = request.data.get("name")
     is_recurring = request.data.get("is_recurring", False)
 
     if not amount:
         return Response({"error": "Amount required"}, status=400)
 
     try:
-        price_data = {
-            "currency": "usd",
-            "unit_amount": amount,
-            "product_data": {"name": "Nourish Laredo Donation"},
-        }
-        if is_recurring:
-            price_data["recurring"] = {"interval": "month"}
-
-        # PRODUCTION URLs - Replace localhost with your live domain
-        session = stripe.checkout.Session.create(
-            mode="subscription" if is_recurring else "payment",
-            payment_method_types=["card"],
-            billing_address_collection="required",
-            customer_creation="always",
-            customer_email=email if email else None,
-            metadata={
-                "email": email or "",
-                "name": name or "",
-                "type": "recurring" if is_recurring else "one_time"
-            },
-            line_items=[{"price_data": price_data, "quantity": 1}],
-            success_url="https://www.nourishlaredo.com/donate?success=true",
-            cancel_url="https://www.nourishlaredo.com/donate?canceled=true",
-        )
+        session = open_checkout_session(checkout_session_options(request, request.data))
 
         if not is_recurring:
-            # We save the session ID so the webhook can find this record later
-            Donation.objects.create(
-                amount=amount,
-                currency="USD",
-                status="pending",
+            # We save the session ID so the webhook can find this record later.
+            # A replayed idempotent request returns the same session, hence get_or_create.
+            Donation.objects.get_or_create(
                 payment_processor="stripe",
                 processor_reference_id=session.id,
+                defaults={"amount": amount, "currency": "USD", "status": "pending"},
             )
 
         return Response({"url": session.url})
@@ -109,9 +253,10 @@ def create_checkout_session(request):
 # ========================
 # STRIPE WEBHOOK
 # ========================
-@csrf_exempt
-@require_POST
-def stripe_webhook(request):
+def verified_webhook_event(request):
+    """Return the WebhookEvent row for a correctly signed delivery, or None."""
+    import stripe
+
     payload = request.body
     sig_header = request.META.get("HTTP_STRIPE_SIGNATURE")
     endpoint_secret = settings.STRIPE_WEBHOOK_SECRET
@@ -119,131 +264,161 @@ def stripe_webhook(request):
     try:
         event = stripe.Webhook.construct_event(payload, sig_header, endpoint_secret)
     except (ValueError, stripe.error.SignatureVerificationError):
-        return HttpResponse(status=400)
+        return None
+    return WebhookEvent(event_id=event["id"], event_type=event["type"], payload=json.loads(payload))
 
-    event_type = event["type"]
 
-    if event_type == "checkout.session.completed":
-        session = event["data"]["object"]
-        if session.get("mode") == "payment":
-            handle_one_time_payment(session)
-    elif event_type == "invoice.payment_succeeded":
-        invoice = event["data"]["object"]
-        if invoice.get("subscription"):
-            handle_recurring_payment(invoice)
-    elif event_type == "customer.subscription.deleted":
-        subscription = event["data"]["object"]
-        handle_subscription_deleted(subscription)
+@csrf_exempt
+@require_POST
+def stripe_webhook(request):
+    webhook_event = verified_webhook_event(request)
+    if webhook_event is None:
+        return HttpResponse(status=400)
 
+    # Only record the event here; process_webhook_events does the work.
+    # Duplicate deliveries hit the primary key and are dropped by the database.
+    WebhookEvent.objects.bulk_create([webhook_event], ignore_conflicts=True)
     return HttpResponse(status=200)
 
-# ========================
-# HELPER FUNCTIONS
-# ========================
-def handle_one_time_payment(session):
-    session_id = session.get("id")
-    try:
-        donation = Donation.objects.get(processor_reference_id=session_id)
-        customer_details = session.get("customer_details") or {}
-        person = get_or_create_person(customer_details.get("email"), customer_details.get("name"))
-        
-        donation.status = "succeeded"
-        if person:
-            donation.person = person
-        donation.save()
-        logger.info(f"One-time donation {donation.id} succeeded.")
-    except Donation.DoesNotExist:
-        logger.error(f"Donation not found for Session ID: {session_id}")
-
-def handle_recurring_payment(invoice):
-    email = invoice.get("customer_email")
-    name = invoice.get("customer_name")
-    amount = invoice.get("amount_paid")
-    invoice_id = invoice.get("id")
-    person = get_or_create_person(email, name)
-
-    Donation.objects.create(
-        amount=amount, currency="USD", status="succeeded",
-        payment_processor="stripe", processor_reference_id=invoice_id, person=person
-    )
-
-def handle_subscription_deleted(subscription):
-    customer_id = subscription.get("customer")
-    try:
-        customer = stripe.Customer.retrieve(customer_id)
-        send_mail(
-            "Recurring Donation Canceled",
-            f"The recurring donation for {customer.email} has been canceled.",
-            settings.DEFAULT_FROM_EMAIL, ["admin@nourishlaredo.com"], fail_silently=True
-        )
-    except Exception as e:
-        logger.error(f"Error handling cancellation: {e}")
-
-def get_or_create_person(email, name):
-    if not email: return None
-    first_name, last_name = "", ""
-    if name:
-        parts = name.strip().split(" ", 1)
-        first_name = parts[0]
-        if len(parts) > 1: last_name = parts[1]
-    person, _ = Person.objects.update_or_create(
-        email=email, defaults={"first_name": first_name, "last_name": last_name}
-    )
-    return person
-
 # ========================
 # PARTNERS & CONTACT
 # ========================
 @api_view(['GET'])
 def get_partners(request):
+    try:
+        fields = PartnerSerializer.parse_fields(request.query_params.get("fields"))
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
     partners = Partner.objects.all().order_by('name')
-    serializer = PartnerSerializer(partners, many=True)
+    if fields:
+        partners = partners.only(*PartnerSerializer.only_columns(fields, always=("id", "name")))
+    serializer = PartnerSerializer(partners, many=True, context={"fields": fields})
     return Response(serializer.data)
 
+def notify_contact_message(contact):
+    queue_email(f"New Contact: {contact.subject}", f"From: {contact.name}\n{contact.message}", ["info@nourishlaredo.com"])
+
+
 @api_view(["POST"])
+@throttle_classes(form_throttles("contact"))
 def contact_submit(request):
     serializer = ContactMessageSerializer(data=request.data)
     if serializer.is_valid():
-        contact = serializer.save()
-        send_mail(f"New Contact: {contact.subject}", f"From: {contact.name}\n{contact.message}", settings.DEFAULT_FROM_EMAIL, ["info@nourishlaredo.com"])
+        save_submission(serializer, notify_contact_message)
         return Response({"message": "Message sent!"}, status=201)
     return Response(serializer.errors, status=400)
 
+
+def notify_partner_inquiry(inquiry):
+    queue_email(f"New Partner Inquiry: {inquiry.organization_name}", f"Contact: {inquiry.contact_name}", ["partners@nourishlaredo.com"])
+
+
 @api_view(["POST"])
+@throttle_classes(form_throttles("partner_inquiry"))
 def partner_inquiry_submit(request):
     serializer = PartnerInquirySerializer(data=request.data)
     if serializer.is_valid():
-        inquiry = serializer.save()
-        send_mail(f"New Partner Inquiry: {inquiry.organization_name}", f"Contact: {inquiry.contact_name}", settings.DEFAULT_FROM_EMAIL, ["partners@nourishlaredo.com"])
+        save_submission(serializer, notify_partner_inquiry)
         return Response({"message": "Inquiry received!"}, status=201)
     return Response(serializer.errors, status=400)
 
+
+def notify_newsletter_subscriber(subscriber):
+    # Queue confirmation email
+    queue_email(
+        "You're Subscribed! - Nourish Laredo",
+        "Hi there!\n\nThank you for subscribing to the Nourish Laredo newsletter. We'll keep you updated on our community impact.",
+        [subscriber.email],
+    )
+
+
 @api_view(['POST'])
+@throttle_classes(form_throttles("newsletter"))
 def newsletter_subscribe(request):
     serializer = NewsletterSubscriberSerializer(data=request.data)
     if serializer.is_valid():
-        subscriber = serializer.save() 
-        
-        # Send confirmation email
-        send_mail(
-            "You're Subscribed! - Nourish Laredo",
-            "Hi there!\n\nThank you for subscribing to the Nourish Laredo newsletter. We'll keep you updated on our community impact.",
-            settings.DEFAULT_FROM_EMAIL,
-            [subscriber.email],
-            fail_silently=False,
-        )
+        save_submission(serializer, notify_newsletter_subscriber)
         return Response({"message": "Subscribed!"}, status=201)
     return Response(serializer.errors, status=400)
 
-@api_view(['GET'])
+# ========================
+# SEARCH
+# ========================
+@api_view(["GET"])
+@throttle_classes([SearchIPThrottle])
+def site_search(request):
+    params = request.query_params
+    q = params.get("q", "").strip()
+    if not q:
+        return Response({"error": "q is required"}, status=400)
+    kinds = [kind.strip() for kind in params.get("type", ",".join(SEARCH_SPECS)).split(",") if kind.strip()]
+    try:
+        limit = min(int(params.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    except ValueError:
+        return Response({"error": "limit must be an integer"}, status=400)
+    if limit < 1:
+        return Response({"error": "limit must be positive"}, status=400)
+
+    try:
+        results = {kind: search(kind, q, limit) for kind in kinds}
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+    return Response({"q": q, **results})
+
+# ========================
+# PEOPLE
+# ========================
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def person_timeline(request, person_id):
+    timeline = person_timeline_data(person_id)
+    if timeline is None:
+        raise Http404("No such person")
+    return Response(timeline)
+
+# ========================
+# REPORTS
+# ========================
+@api_view(["GET"])
 @permission_classes([AllowAny])
-def debug_env(request):
-    import os
-    import cloudinary
-    return Response({
-        'has_cloudinary_url': 'CLOUDINARY_URL' in os.environ,
-        'has_cloud_name': 'CLOUDINARY_CLOUD_NAME' in os.environ,
-        'cloud_name_value': os.environ.get('CLOUDINARY_CLOUD_NAME', 'NOT SET'),
-        'cloudinary_config_cloud_name': cloudinary.config().cloud_name,
-    })
+def donation_totals_summary(request):
+    params = request.query_params
+    event_id = params.get("event")
+    if event_id is not None and not event_id.isdigit():
+        return Response({"error": "event must be an event id"}, status=400)
+    try:
+        start, end = date_param(params, "from"), date_param(params, "to")
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    return Response({"results": list(campaign_totals(event_id, start, end))})
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def donation_report(request):
+    params = request.query_params
+    try:
+        groups = parse_groups(params.get("group"))
+        start, end = date_param(params, "from"), date_param(params, "to")
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    rows = donation_totals(groups, status=params.get("status"), start=start, end=end)
+    return Response({"group": groups, "results": list(rows)})
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def data_export(request, dataset, fmt):
+    if dataset not in EXPORTS or fmt not in FORMATS:
+        raise Http404("Unknown export")
+    params = request.query_params
+    try:
+        start, end = date_param(params, "from"), date_param(params, "to")
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
 
+    queryset = EXPORTS[dataset][0].objects.filter(**created_between(start, end))
+    return export_response(dataset, queryset, fmt)
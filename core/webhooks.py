@@ -0,0 +1,146 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .emails import queue_email, retry_delay
+from .models import Donation, Person, WebhookEvent
+from .people import get_or_create_person, normalize_email
+from .rollups import record_succeeded_donation
+from .stripe_client import stripe_call
+
+logger = logging.getLogger(__name__)
+
+
+# ========================
+# EVENT PROCESSING
+# ========================
+def handle_stripe_event(event):
+    event_type = event["type"]
+
+    if event_type == "checkout.session.completed":
+        session = event["data"]["object"]
+        if session.get("mode") == "payment":
+            handle_one_time_payment(session)
+    elif event_type == "invoice.payment_succeeded":
+        invoice = event["data"]["object"]
+        if invoice.get("subscription"):
+            handle_recurring_payment(invoice)
+    elif event_type == "customer.subscription.deleted":
+        subscription = event["data"]["object"]
+        handle_subscription_deleted(subscription)
+
+
+def process_next_event(max_attempts=5):
+    """Lock and handle the oldest due WebhookEvent. Returns False when none are waiting."""
+    now = timezone.now()
+    with transaction.atomic():
+        webhook_event = (
+            WebhookEvent.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_at__lte=now)
+            .order_by("received_at")
+            .first()
+        )
+        if webhook_event is None:
+            return False
+
+        webhook_event.attempts += 1
+        try:
+            with transaction.atomic():
+                handle_stripe_event(webhook_event.payload)
+        except Exception as e:
+            logger.error(f"Error processing webhook event {webhook_event.event_id}: {e}")
+            webhook_event.last_error = str(e)
+            if webhook_event.attempts >= max_attempts:
+                webhook_event.status = "failed"
+            else:
+                webhook_event.next_attempt_at = now + retry_delay(webhook_event.attempts)
+        else:
+            webhook_event.status = "processed"
+            webhook_event.processed_at = timezone.now()
+        webhook_event.save(update_fields=["status", "attempts", "next_attempt_at", "last_error", "processed_at"])
+    return True
+
+
+# ========================
+# HANDLERS
+# ========================
+def handle_one_time_payment(session):
+    session_id = session.get("id")
+    try:
+        donation = Donation.objects.get(payment_processor="stripe", processor_reference_id=session_id)
+        customer_details = session.get("customer_details") or {}
+        person = get_or_create_person(
+            customer_details.get("email"), customer_details.get("name"), session.get("customer")
+        )
+
+        changes = {"person": person} if person else {}
+        # Conditional UPDATE: of the webhook workers and reconcile_stripe, only the
+        # one that actually moves the row to succeeded adds it to the rollup
+        newly_succeeded = (
+            Donation.objects.filter(pk=donation.pk).exclude(status="succeeded").update(status="succeeded", **changes)
+        )
+        if newly_succeeded:
+            donation.status = "succeeded"
+            record_succeeded_donation(donation)
+        elif changes:
+            Donation.objects.filter(pk=donation.pk).update(**changes)
+        logger.info(f"One-time donation {donation.id} succeeded.")
+    except Donation.DoesNotExist:
+        logger.error(f"Donation not found for Session ID: {session_id}")
+
+def handle_recurring_payment(invoice):
+    email = invoice.get("customer_email")
+    name = invoice.get("customer_name")
+    amount = invoice.get("amount_paid")
+    invoice_id = invoice.get("id")
+    person = get_or_create_person(email, name, invoice.get("customer"))
+
+    # Upsert on (payment_processor, processor_reference_id) so a redelivered invoice is a no-op
+    donation, created = Donation.objects.get_or_create(
+        payment_processor="stripe", processor_reference_id=invoice_id,
+        defaults={
+            "amount": amount, "currency": "USD", "status": "succeeded",
+            "kind": "recurring", "person": person,
+        },
+    )
+    if created:
+        record_succeeded_donation(donation)
+
+def customer_email(customer_id):
+    """Email for a Stripe customer: from Person, else a TTL cache, else one Stripe call."""
+    email = (
+        Person.objects.filter(stripe_customer_id=customer_id)
+        .order_by("-updated_at")
+        .values_list("email", flat=True)
+        .first()
+    )
+    if email:
+        return email
+
+    cache_key = f"stripe:customer-email:{customer_id}"
+    email = cache.get(cache_key)
+    if email is None:
+        with stripe_call("Customer.retrieve") as stripe_api:
+            email = stripe_api.Customer.retrieve(customer_id).email or ""
+        cache.set(cache_key, email, settings.STRIPE_CUSTOMER_CACHE_TTL)
+        # Remember the id on the matching donor so the next lookup stays local
+        Person.objects.filter(email=normalize_email(email), stripe_customer_id__isnull=True).update(
+            stripe_customer_id=customer_id
+        )
+    return email
+
+
+def handle_subscription_deleted(subscription):
+    customer_id = subscription.get("customer")
+    try:
+        email = customer_email(customer_id)
+        queue_email(
+            "Recurring Donation Canceled",
+            f"The recurring donation for {email} has been canceled.",
+            ["admin@nourishlaredo.com"],
+        )
+    except Exception as e:
+        logger.error(f"Error handling cancellation: {e}")
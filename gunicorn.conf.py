@@ -0,0 +1,106 @@
+"""Gunicorn settings for the web process. Gunicorn reads this file from the
+working directory, so the Procfile only names the app.
+
+Every value can be overridden from the environment.
+"""
+import os
+import time
+
+from decouple import config as env
+
+BOOT_STARTED = time.perf_counter()
+
+# Resident memory of one Django worker after the first few requests
+WORKER_MEMORY_MB = env("GUNICORN_WORKER_MEMORY_MB", default=150, cast=int)
+# Memory left for the master process and the platform
+RESERVED_MEMORY_MB = env("GUNICORN_RESERVED_MEMORY_MB", default=64, cast=int)
+
+
+def read_first_line(path):
+    try:
+        with open(path) as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+
+def cpu_limit():
+    """CPUs this container may use: the cgroup quota if one is set, else the affinity mask."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    quota = read_first_line("/sys/fs/cgroup/cpu.max")
+    if quota and not quota.startswith("max"):
+        limit, period = (int(part) for part in quota.split()[:2])
+        cpus = min(cpus, max(1, limit // period))
+    return cpus
+
+
+def memory_limit_mb():
+    """The cgroup memory limit (v2, then v1), else physical memory."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        value = read_first_line(path)
+        # v1 reports "no limit" as a huge number rather than "max"
+        if value and value.isdigit() and int(value) < 1 << 50:
+            return int(value) // 2**20
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 2**20
+
+
+def default_workers():
+    by_cpu = 2 * cpu_limit() + 1
+    by_memory = (memory_limit_mb() - RESERVED_MEMORY_MB) // WORKER_MEMORY_MB
+    return max(1, min(by_cpu, by_memory))
+
+
+# WEB_CONCURRENCY is what Heroku-style platforms set for the dyno size
+workers = env("WEB_CONCURRENCY", default=default_workers(), cast=int)
+# Threads let one worker overlap requests that wait on Stripe, S3 or the database.
+# Each thread holds its own persistent DB connection (CONN_MAX_AGE).
+threads = env("GUNICORN_THREADS", default=4, cast=int)
+worker_class = env("GUNICORN_WORKER_CLASS", default="gthread" if threads > 1 else "sync")
+
+# Import Django, boto3 and stripe once in the master; workers share those pages
+preload_app = env("GUNICORN_PRELOAD", default=True, cast=bool)
+
+# Requests past the router's 30 s limit are already lost to the client
+timeout = env("GUNICORN_TIMEOUT", default=30, cast=int)
+# Finish in-flight requests before the platform's SIGKILL, which follows SIGTERM after 30 s
+graceful_timeout = env("GUNICORN_GRACEFUL_TIMEOUT", default=25, cast=int)
+# Longer than the proxy's idle timeout, so the proxy is the side that closes idle connections
+keepalive = env("GUNICORN_KEEPALIVE", default=75, cast=int)
+
+accesslog = env("GUNICORN_ACCESS_LOG", default=None)
+
+
+def when_ready(server):
+    if preload_app:
+        # The URLconf is loaded on the first request and the SDKs on first use;
+        # importing them here means the workers inherit them instead of each
+        # paying for the imports on its first request.
+        import boto3  # noqa: F401
+        import stripe  # noqa: F401
+        from django.urls import get_resolver
+
+        get_resolver().url_patterns
+        close_master_connections()
+    server.log.info(
+        "Booted in %.2fs: %s %s worker(s) x %s thread(s)",
+        time.perf_counter() - BOOT_STARTED, workers, worker_class, threads,
+    )
+
+
+def close_master_connections():
+    # Close anything preloading opened before a worker can inherit it. Closing
+    # an inherited socket later, in either process, would end the other's session.
+    from django.db import connections
+
+    connections.close_all()
+    for connection in connections.all(initialized_only=True):
+        # DB_CONNECTION_MODE=pool: the pool's idle connections are sockets too
+        if hasattr(connection, "close_pool"):
+            connection.close_pool()
+
+
+def pre_fork(server, worker):
+    # Runs in the master before every fork, including replacement workers;
+    # a no-op unless something reopened a connection since when_ready
+    if preload_app:
+        close_master_connections()
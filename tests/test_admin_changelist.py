@@ -0,0 +1,72 @@
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.models import ContactMessage, Donation, Event, Person
+from core.pagination import EstimatedCountPaginator
+
+
+class AdminChangelistTests(TestCase):
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.create_superuser("staff", password="pw"))
+        event = Event.objects.create(title="Santa Run 5K", description="", date="2025-12-06", location="Laredo")
+        person = Person.objects.create(email="ana@example.com")
+        Donation.objects.bulk_create(
+            Donation(amount=100 * i, status="succeeded", currency="USD" if i % 2 else "MXN",
+                     person=person, event=event, processor_reference_id=f"pi_{i}")
+            for i in range(1, 6)
+        )
+
+    def test_donation_list_joins_person_and_event(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/admin/core/donation/?currency=USD")
+
+        self.assertContains(response, "ana@example.com")
+        self.assertEqual(response.context["cl"].result_count, 3)
+        # Person and event come from the changelist query's joins, not one query per row
+        separate = [q["sql"] for q in queries if q["sql"].startswith(('SELECT "core_person"', 'SELECT "core_event"'))]
+        self.assertEqual(separate, [])
+
+    def test_exact_count_below_the_limit(self):
+        paginator = EstimatedCountPaginator(Donation.objects.order_by("pk"), 2)
+        self.assertEqual(paginator.count, 5)
+        self.assertEqual(paginator.num_pages, 3)
+
+    def test_contact_search(self):
+        ContactMessage.objects.create(name="Rosa", email="rosa@example.com", message="Can I change my volunteer schedule?")
+        ContactMessage.objects.create(name="Luis", email="luis@example.com", message="Thank you!")
+
+        response = self.client.get("/admin/core/contactmessage/?q=schedule")
+
+        self.assertEqual([m.name for m in response.context["cl"].result_list], ["Rosa"])
+
+
+@skipUnless(connection.vendor == "postgresql", "planner estimates and full-text search need Postgres")
+class PostgresChangelistTests(TestCase):
+    def setUp(self):
+        Donation.objects.bulk_create(
+            Donation(amount=100, status="succeeded", processor_reference_id=f"pi_{i}") for i in range(50)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE core_donation")
+
+    @override_settings(ADMIN_EXACT_COUNT_LIMIT=10)
+    def test_planner_estimate_replaces_count_above_the_limit(self):
+        paginator = EstimatedCountPaginator(Donation.objects.order_by("pk"), 20)
+        with CaptureQueriesContext(connection) as queries:
+            count = paginator.count
+        self.assertGreater(count, 10)
+        self.assertFalse([q["sql"] for q in queries if "COUNT(" in q["sql"]])
+
+    def test_contact_search_uses_the_full_text_index(self):
+        self.client.force_login(get_user_model().objects.create_superuser("staff", password="pw"))
+        ContactMessage.objects.create(name="Rosa", email="rosa@example.com", message="Volunteer schedules")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/admin/core/contactmessage/?q=schedule")
+
+        self.assertEqual(len(response.context["cl"].result_list), 1)
+        self.assertTrue([q["sql"] for q in queries if "to_tsvector" in q["sql"]])
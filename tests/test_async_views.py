@@ -0,0 +1,64 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import AsyncRequestFactory, TestCase
+
+from core import async_views
+from core.models import ContactMessage, Donation, NewsletterSubscriber, OutboundEmail, WebhookEvent
+from tests.tests_webhooks import sign
+
+
+class AsyncViewTests(TestCase):
+    factory = AsyncRequestFactory()
+
+    def post(self, data, **extra):
+        return self.factory.post("/", data=data, content_type="application/json", **extra)
+
+    @patch("stripe.checkout.Session.create", return_value=SimpleNamespace(id="cs_async_1", url="https://checkout.stripe.com/cs_async_1"))
+    async def test_checkout_records_pending_donation(self, create):
+        body = json.dumps({"amount": 5000, "email": "donor@example.com", "name": "Jane Doe"})
+        first = await async_views.create_checkout_session(self.post(body, headers={"Idempotency-Key": "click-1"}))
+        second = await async_views.create_checkout_session(self.post(body, headers={"Idempotency-Key": "click-1"}))
+
+        self.assertEqual(json.loads(first.content), {"url": "https://checkout.stripe.com/cs_async_1"})
+        self.assertEqual(second.status_code, 200)
+        keys = {call.kwargs["idempotency_key"] for call in create.call_args_list}
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(await Donation.objects.filter(processor_reference_id="cs_async_1").acount(), 1)
+
+    async def test_checkout_requires_amount(self):
+        response = await async_views.create_checkout_session(self.post(json.dumps({"email": "donor@example.com"})))
+        self.assertEqual(response.status_code, 400)
+
+    async def test_webhook_records_event_once(self):
+        payload = json.dumps({"id": "evt_async_1", "type": "checkout.session.completed", "data": {"object": {}}})
+        for _ in range(2):
+            response = await async_views.stripe_webhook(self.post(payload, headers={"Stripe-Signature": sign(payload)}))
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(await WebhookEvent.objects.filter(event_id="evt_async_1").acount(), 1)
+
+        bad = await async_views.stripe_webhook(self.post(payload, headers={"Stripe-Signature": "t=1,v1=bad"}))
+        self.assertEqual(bad.status_code, 400)
+
+    async def test_contact_saves_row_and_queues_email(self):
+        body = json.dumps({"name": "Ana", "email": "ana@example.com", "subject": "Hi", "message": "Hello"})
+        response = await async_views.contact_submit(self.post(body))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(json.loads(response.content), {"message": "Message sent!"})
+        self.assertTrue(await ContactMessage.objects.filter(email="ana@example.com").aexists())
+        self.assertTrue(await OutboundEmail.objects.filter(subject="New Contact: Hi").aexists())
+
+    async def test_invalid_form_returns_errors(self):
+        await NewsletterSubscriber.objects.acreate(email="taken@example.com")
+        response = await async_views.newsletter_subscribe(self.post(json.dumps({"email": "taken@example.com"})))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email", json.loads(response.content))
+        self.assertFalse(await OutboundEmail.objects.aexists())
+
+    async def test_malformed_json_is_rejected(self):
+        response = await async_views.volunteer_signup(self.post("{not json"))
+        self.assertEqual(response.status_code, 400)
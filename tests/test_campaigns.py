@@ -0,0 +1,73 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.management import CommandError, call_command
+from django.core.mail import EmailMessage
+from django.test import TestCase, override_settings
+
+from core.campaigns import campaign_connection
+from core.models import Campaign, CampaignDelivery, NewsletterSubscriber
+
+
+@override_settings(CAMPAIGN_EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class SendCampaignTests(TestCase):
+    def setUp(self):
+        self.subscribers = NewsletterSubscriber.objects.bulk_create(
+            NewsletterSubscriber(email=f"reader{i}@example.com") for i in range(6)
+        )
+        NewsletterSubscriber.objects.create(email="gone@example.com", is_active=False)
+        self.campaign = Campaign.objects.create(subject="March update", body="Hi {{ email }} & friends")
+
+    def send(self, *args, **options):
+        out = StringIO()
+        call_command("send_campaign", self.campaign.id, *args, batch_size=2, connections=2, stdout=out, **options)
+        return out.getvalue()
+
+    def test_sends_once_to_each_active_subscriber(self):
+        with patch("core.campaigns.campaign_connection", wraps=campaign_connection) as connect:
+            self.send()
+
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), [f"reader{i}@example.com" for i in range(6)])
+        self.assertIn("Hi reader0@example.com & friends", [m.body for m in mail.outbox])
+        self.assertLessEqual(connect.call_count, 2)
+        self.assertEqual(self.campaign.deliveries.filter(status="sent").count(), 6)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, "sent")
+
+        with self.assertRaises(CommandError):
+            self.send()
+
+    def test_interrupted_run_resumes_without_resending(self):
+        CampaignDelivery.objects.create(
+            campaign=self.campaign, subscriber=self.subscribers[0], email="reader0@example.com", status="sent",
+        )
+        # Left behind by a crash between checkpoint and confirmation
+        CampaignDelivery.objects.create(
+            campaign=self.campaign, subscriber=self.subscribers[1], email="reader1@example.com",
+        )
+
+        output = self.send()
+
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), [f"reader{i}@example.com" for i in range(2, 6)])
+        self.assertIn("1 recipient(s) were left unconfirmed", output)
+
+    def test_failed_recipients_are_recorded_and_retried(self):
+        original_send = EmailMessage.send
+
+        def flaky_send(message, *args, **kwargs):
+            if message.to == ["reader3@example.com"]:
+                raise OSError("mailbox unavailable")
+            return original_send(message, *args, **kwargs)
+
+        with patch.object(EmailMessage, "send", flaky_send):
+            self.send()
+
+        failed = CampaignDelivery.objects.get(status="failed")
+        self.assertEqual(failed.email, "reader3@example.com")
+        self.assertIn("mailbox unavailable", failed.last_error)
+        self.assertEqual(len(mail.outbox), 5)
+
+        self.send("--retry-failed")
+        self.assertEqual(len(mail.outbox), 6)
+        self.assertEqual(self.campaign.deliveries.filter(status="sent").count(), 6)
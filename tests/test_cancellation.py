@@ -27,6 +27,8 @@ django.setup()
 
 from django.test import Client
 from django.conf import settings
+from django.core.management import call_command
+from core.models import WebhookEvent
 
 # 2. THE TEST
 # We use @patch to mock the Stripe API call so we don't actually hit the internet
@@ -39,6 +41,7 @@ def run_cancellation_test(mock_stripe_retrieve):
     mock_stripe_retrieve.return_value = mock_customer
 
     secret = settings.STRIPE_WEBHOOK_SECRET
+    WebhookEvent.objects.filter(event_id="evt_test_cancel").delete()
     
     # Payload for 'customer.subscription.deleted'
     payload = {
@@ -67,6 +70,9 @@ def run_cancellation_test(mock_stripe_retrieve):
     )
 
     print(f"📡 Webhook Status Code: {response.status_code}")
+
+    # The endpoint only records the event; run the worker to apply it
+    call_command("process_webhook_events", workers=1)
     
     if response.status_code == 200:
         print("✅ SUCCESS: Webhook processed the cancellation.")
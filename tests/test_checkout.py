@@ -0,0 +1,55 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import stripe
+from django.test import TestCase
+
+from core.models import Donation
+from core.stripe_client import get_stripe
+
+
+class CheckoutSessionTests(TestCase):
+    def post_checkout(self, **extra):
+        return self.client.post(
+            "/api/donations/checkout/",
+            data=json.dumps({"amount": 5000, "email": "donor@example.com", "name": "Jane Doe"}),
+            content_type="application/json",
+            **extra,
+        )
+
+    @patch("stripe.checkout.Session.create", return_value=SimpleNamespace(id="cs_test_1", url="https://checkout.stripe.com/cs_test_1"))
+    def test_retried_request_reuses_idempotency_key(self, create):
+        first = self.post_checkout(HTTP_IDEMPOTENCY_KEY="donate-click-42")
+        second = self.post_checkout(HTTP_IDEMPOTENCY_KEY="donate-click-42")
+
+        self.assertEqual(first.json(), {"url": "https://checkout.stripe.com/cs_test_1"})
+        self.assertEqual(second.status_code, 200)
+        keys = [call.kwargs["idempotency_key"] for call in create.call_args_list]
+        self.assertEqual(len(set(keys)), 1)
+        self.assertEqual(Donation.objects.filter(processor_reference_id="cs_test_1").count(), 1)
+
+    @patch("stripe.checkout.Session.create", return_value=SimpleNamespace(id="cs_test_2", url="https://checkout.stripe.com/cs_test_2"))
+    def test_only_a_client_supplied_key_makes_requests_idempotent(self, create):
+        # Same donor details twice without a key: two separate donations
+        self.post_checkout()
+        self.post_checkout()
+        self.assertNotIn("idempotency_key", create.call_args_list[0].kwargs)
+        self.assertNotIn("idempotency_key", create.call_args_list[1].kwargs)
+
+        # The same key from another client (by the proxy-appended address) is a different request
+        self.post_checkout(HTTP_IDEMPOTENCY_KEY="donate-click-42", HTTP_X_FORWARDED_FOR="10.0.0.1, 203.0.113.7")
+        self.post_checkout(HTTP_IDEMPOTENCY_KEY="donate-click-42", HTTP_X_FORWARDED_FOR="203.0.113.7, 198.51.100.9")
+        spoofed = self.post_checkout(HTTP_IDEMPOTENCY_KEY="donate-click-42", HTTP_X_FORWARDED_FOR="198.51.100.9, 203.0.113.7")
+        keys = [call.kwargs["idempotency_key"] for call in create.call_args_list[2:]]
+        self.assertNotEqual(keys[0], keys[1])
+        # A forged first hop doesn't change who the client is
+        self.assertEqual(keys[0], keys[2])
+        self.assertEqual(spoofed.status_code, 200)
+
+    def test_shared_client_has_pool_and_timeouts(self):
+        client = get_stripe().default_http_client
+        self.assertIsInstance(client, stripe.RequestsClient)
+        self.assertEqual(client._timeout, (3.0, 10.0))
+        self.assertIs(get_stripe().default_http_client, client)
+        self.assertEqual(client._session.get_adapter("https://api.stripe.com")._pool_maxsize, 10)
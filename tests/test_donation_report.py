@@ -0,0 +1,65 @@
+from datetime import date, datetime, timezone as dt_timezone
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import Donation, Event
+from core.reports import donation_totals
+
+
+class DonationReportTests(TestCase):
+    def setUp(self):
+        self.event = Event.objects.create(title="Santa Run 5K", description="", date=date(2025, 12, 6), location="Laredo")
+        rows = [
+            (5000, "succeeded", "one_time", self.event, datetime(2025, 11, 3, 18, tzinfo=dt_timezone.utc)),
+            (2500, "succeeded", "recurring", None, datetime(2025, 11, 20, 18, tzinfo=dt_timezone.utc)),
+            (2500, "succeeded", "recurring", None, datetime(2025, 12, 20, 18, tzinfo=dt_timezone.utc)),
+            (1000, "pending", "one_time", self.event, datetime(2025, 12, 21, 18, tzinfo=dt_timezone.utc)),
+        ]
+        for index, (amount, status, kind, event, created_at) in enumerate(rows):
+            donation = Donation.objects.create(
+                amount=amount, status=status, kind=kind, event=event, processor_reference_id=f"ref_{index}"
+            )
+            Donation.objects.filter(pk=donation.pk).update(created_at=created_at)
+
+        staff = get_user_model().objects.create_user("staff", password="pw", is_staff=True)
+        self.client.force_login(staff)
+
+    def test_monthly_totals_by_kind_in_one_query(self):
+        with self.assertNumQueries(1):
+            rows = list(donation_totals(["month", "kind"], status="succeeded"))
+        totals = {(row["period"].month, row["kind"]): (row["total_amount"], row["donation_count"]) for row in rows}
+        self.assertEqual(totals, {(11, "one_time"): (5000, 1), (11, "recurring"): (2500, 1), (12, "recurring"): (2500, 1)})
+
+    def test_date_range_includes_both_end_days_without_casting_created_at(self):
+        rows = donation_totals(["kind"], status="succeeded", start=date(2025, 11, 20), end=date(2025, 12, 20))
+        self.assertEqual([(row["kind"], row["total_amount"]) for row in rows], [("recurring", 5000)])
+        sql = str(rows.query).lower()
+        self.assertNotIn("cast_date", sql)
+        self.assertNotIn("::date", sql)
+
+    def test_api_groups_by_event_and_status(self):
+        response = self.client.get("/api/reports/donations/?group=event,status")
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertIn(
+            {"event_id": self.event.id, "event__title": "Santa Run 5K", "status": "pending",
+             "currency": "USD", "total_amount": 1000, "donation_count": 1},
+            results,
+        )
+
+    def test_api_rejects_bad_params_and_anonymous_users(self):
+        self.assertEqual(self.client.get("/api/reports/donations/?group=year").status_code, 400)
+        self.assertEqual(self.client.get("/api/reports/donations/?group=day,month").status_code, 400)
+        self.assertEqual(self.client.get("/api/reports/donations/?from=soon").status_code, 400)
+        self.client.logout()
+        self.assertIn(self.client.get("/api/reports/donations/").status_code, (401, 403))
+
+    def test_management_command(self):
+        out = StringIO()
+        call_command("donation_report", "--group", "kind", "--status", "succeeded", stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "kind\tcurrency\ttotal_amount\tdonation_count")
+        self.assertIn("recurring\tUSD\t5000\t2", lines)
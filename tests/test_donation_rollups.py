@@ -0,0 +1,71 @@
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import Donation, DonationDailyRollup, Event
+from core.rollups import record_succeeded_donation
+from core.webhooks import handle_one_time_payment, handle_recurring_payment
+
+
+class DonationRollupTests(TestCase):
+    def setUp(self):
+        self.event = Event.objects.create(title="Santa Run 5K", description="", date=date(2025, 12, 6), location="Laredo")
+
+    def pay_checkout(self, session_id, amount, event=None):
+        Donation.objects.create(amount=amount, status="pending", processor_reference_id=session_id, event=event)
+        handle_one_time_payment({"id": session_id, "customer_details": {"email": "donor@example.com", "name": "Jane Doe"}})
+
+    def test_handlers_increment_rollups(self):
+        self.pay_checkout("cs_1", 5000, self.event)
+        self.pay_checkout("cs_2", 1500, self.event)
+        handle_recurring_payment({"id": "in_1", "amount_paid": 2500, "customer_email": "donor@example.com"})
+        # A repeated checkout.session.completed must not count twice
+        handle_one_time_payment({"id": "cs_1", "customer_details": {}})
+
+        event_row = DonationDailyRollup.objects.get(event=self.event)
+        self.assertEqual((event_row.kind, event_row.total_amount, event_row.donation_count), ("one_time", 6500, 2))
+        recurring_row = DonationDailyRollup.objects.get(event__isnull=True)
+        self.assertEqual((recurring_row.kind, recurring_row.total_amount, recurring_row.donation_count), ("recurring", 2500, 1))
+
+    def test_payment_confirmed_by_another_worker_meanwhile_counts_once(self):
+        Donation.objects.create(amount=5000, status="pending", processor_reference_id="cs_1", event=self.event)
+
+        def other_worker_confirms(*args):
+            # Another worker (or reconcile_stripe) flips the row after this one read it
+            donation = Donation.objects.get(processor_reference_id="cs_1")
+            Donation.objects.filter(pk=donation.pk).update(status="succeeded")
+            record_succeeded_donation(donation)
+            return None
+
+        with patch("core.webhooks.get_or_create_person", side_effect=other_worker_confirms):
+            handle_one_time_payment({"id": "cs_1", "customer_details": {}})
+
+        event_row = DonationDailyRollup.objects.get(event=self.event)
+        self.assertEqual((event_row.total_amount, event_row.donation_count), (5000, 1))
+
+    def test_rebuild_matches_incremental_rollups(self):
+        self.pay_checkout("cs_1", 5000, self.event)
+        handle_recurring_payment({"id": "in_1", "amount_paid": 2500, "customer_email": "donor@example.com"})
+        Donation.objects.create(amount=999, status="pending", processor_reference_id="cs_pending")
+        before = set(DonationDailyRollup.objects.values_list("date", "event_id", "kind", "currency", "total_amount", "donation_count"))
+
+        DonationDailyRollup.objects.update(total_amount=1)
+        call_command("rebuild_donation_rollups", stdout=StringIO())
+
+        after = set(DonationDailyRollup.objects.values_list("date", "event_id", "kind", "currency", "total_amount", "donation_count"))
+        self.assertEqual(before, after)
+
+    def test_public_totals_endpoint(self):
+        self.pay_checkout("cs_1", 5000, self.event)
+        handle_recurring_payment({"id": "in_1", "amount_paid": 2500, "customer_email": "donor@example.com"})
+
+        with self.assertNumQueries(1):
+            overall = self.client.get("/api/donations/totals/").json()
+        self.assertEqual(overall["results"], [{"currency": "USD", "total_amount": 7500, "donation_count": 2}])
+
+        per_event = self.client.get(f"/api/donations/totals/?event={self.event.id}").json()
+        self.assertEqual(per_event["results"], [{"currency": "USD", "total_amount": 5000, "donation_count": 1}])
+        self.assertEqual(self.client.get("/api/donations/totals/?event=abc").status_code, 400)
@@ -0,0 +1,151 @@
+import tempfile
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.cache import bump_events_version, get_events_version
+from core.models import Event, Partner
+
+
+class EventFeedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Event.objects.create(title="Santa Run 5K", description="Annual run", date=date(2025, 12, 6), location="Laredo")
+
+    def test_repeat_requests_skip_the_database(self):
+        first = self.client.get("/api/events/")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(len(first.json()), 1)
+        self.assertIn("ETag", first)
+        self.assertIn("Last-Modified", first)
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/events/")
+        self.assertEqual(second.json(), first.json())
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_event_write_invalidates_feed(self):
+        first = self.client.get("/api/events/")
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Event.objects.create(title="Thanksgiving Giving", description="Meals", date=date(2025, 11, 20), location="Laredo")
+            # Nothing changes for readers until the write commits
+            self.assertEqual(self.client.get("/api/events/")["ETag"], first["ETag"])
+        self.assertEqual(len(callbacks), 1)
+
+        response = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(len(response.json()), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Event.objects.get(title="Thanksgiving Giving").delete()
+        self.assertEqual(len(self.client.get("/api/events/").json()), 1)
+
+    def test_version_outlives_the_feed_cache_on_a_shared_backend(self):
+        location = tempfile.TemporaryDirectory()
+        self.addCleanup(location.cleanup)
+        shared = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location.name}
+        with override_settings(CACHES={"default": shared, "throttle": settings.CACHES["throttle"]}):
+            first = self.client.get("/api/events/")
+            later = time.time() + settings.EVENT_FEED_CACHE_TIMEOUT + 1
+            with patch("time.time", return_value=later):
+                response = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_per_process_caches_expire_a_version_bumped_elsewhere(self):
+        workers = [LocMemCache(f"worker-{i}", {}) for i in range(2)]
+
+        def on(worker, call):
+            with patch("core.cache.caches", {"default": workers[worker]}):
+                return call()
+
+        stale = on(1, get_events_version)
+        on(0, bump_events_version)
+        # Worker 1 never sees worker 0's bump...
+        self.assertEqual(on(1, get_events_version), stale)
+        # ...but its version expires along with the feed cache
+        later = time.time() + settings.EVENT_FEED_CACHE_TIMEOUT + 1
+        with patch("time.time", return_value=later):
+            self.assertNotEqual(on(1, get_events_version), stale)
+
+
+class EventFeedPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        today = timezone.localdate()
+        for offset in range(-5, 5):
+            Event.objects.create(
+                title=f"Event {offset}",
+                description="",
+                date=today + timedelta(days=offset),
+                location="Laredo",
+                is_highlight=offset % 2 == 0,
+            )
+
+    def test_cursor_walks_every_event_once(self):
+        seen = []
+        url = "/api/events/?limit=3"
+        while url:
+            page = self.client.get(url).json()
+            self.assertLessEqual(len(page["results"]), 3)
+            seen.extend(event["id"] for event in page["results"])
+            url = f"/api/events/?limit=3&cursor={page['next']}" if page["next"] else None
+
+        self.assertEqual(seen, list(Event.objects.order_by("-date", "-id").values_list("id", flat=True)))
+
+    def test_filters(self):
+        today = timezone.localdate()
+        upcoming = self.client.get("/api/events/?when=upcoming").json()
+        self.assertEqual(len(upcoming), 5)
+        self.assertEqual(upcoming[0]["date"], today.isoformat())
+
+        highlights = self.client.get("/api/events/?when=past&highlight=true&limit=2").json()
+        self.assertEqual([e["title"] for e in highlights["results"]], ["Event -2", "Event -4"])
+        self.assertIsNone(highlights["next"])
+
+        window = self.client.get(f"/api/events/?from={today - timedelta(days=1)}&to={today + timedelta(days=1)}").json()
+        self.assertEqual(len(window), 3)
+
+    def test_invalid_params_are_rejected(self):
+        for query in ("when=soon", "highlight=maybe", "from=yesterday", "limit=abc", "cursor=bogus"):
+            self.assertEqual(self.client.get(f"/api/events/?{query}").status_code, 400, query)
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Event.objects.create(title="Santa Run 5K", description="A long description", date=date(2025, 12, 6), location="Laredo")
+        Partner.objects.create(name="Bethany House", description="Shelter", website="https://example.com")
+
+    def test_event_fields(self):
+        events = self.client.get("/api/events/?fields=id,title,date").json()
+        self.assertEqual(events, [{"id": events[0]["id"], "title": "Santa Run 5K", "date": "2025-12-06"}])
+
+        page = self.client.get("/api/events/?fields=title&limit=1").json()
+        self.assertEqual(page["results"], [{"title": "Santa Run 5K"}])
+
+    def test_only_fetches_requested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/events/?fields=title")
+        select = queries.captured_queries[-1]["sql"]
+        self.assertIn('"title"', select)
+        self.assertNotIn('"description"', select)
+
+    def test_partner_fields(self):
+        partners = self.client.get("/api/partners/?fields=name,logo").json()
+        self.assertEqual(partners, [{"name": "Bethany House", "logo": None}])
+
+    def test_unknown_field_is_rejected(self):
+        self.assertEqual(self.client.get("/api/events/?fields=title,secret").status_code, 400)
+        self.assertEqual(self.client.get("/api/partners/?fields=secret").status_code, 400)
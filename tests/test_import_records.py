@@ -0,0 +1,146 @@
+import csv
+import os
+import tempfile
+from datetime import date, datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.imports import import_records
+from core.models import Donation, DonationDailyRollup, Event, Person, VolunteerProfile
+
+DONATION_HEADER = "email,first_name,last_name,amount,currency,status,kind,payment_processor,processor_reference_id,event,created_at\n"
+
+
+def donations_csv(*rows):
+    return StringIO(DONATION_HEADER + "".join(row + "\n" for row in rows))
+
+
+class ImportDonationsTests(TestCase):
+    def setUp(self):
+        self.event = Event.objects.create(title="Santa Run 5K", description="", date=date(2019, 12, 6), location="Laredo")
+        self.ana = Person.objects.create(email="ana@example.com", first_name="Ana")
+
+    def test_rows_are_upserted_with_people_and_rollups(self):
+        rows = [
+            f"Ana@Example.com,,,5000,USD,succeeded,one_time,check,1001,{self.event.id},2019-03-04",
+            "luis@example.com,Luis,Peña,2500,USD,succeeded,one_time,check,1002,,2019-03-05T10:00:00",
+            ",,,700,USD,succeeded,one_time,cash,r-17,,2019-03-05",
+        ]
+        errors = []
+        counts = import_records("donations", donations_csv(*rows), on_error=lambda *args: errors.append(args))
+
+        self.assertEqual(counts, {"imported": 3, "invalid": 0})
+        self.assertEqual(errors, [])
+        first = Donation.objects.get(processor_reference_id="1001")
+        self.assertEqual((first.person, first.event), (self.ana, self.event))
+        self.assertEqual(timezone.localdate(first.created_at), date(2019, 3, 4))
+        self.assertEqual(Person.objects.get(email="luis@example.com").last_name, "Peña")
+        self.assertIsNone(Donation.objects.get(processor_reference_id="r-17").person)
+        self.assertEqual(
+            dict(DonationDailyRollup.objects.values_list("date", "total_amount")),
+            {date(2019, 3, 4): 5000, date(2019, 3, 5): 3200},
+        )
+
+        # Re-running with a corrected amount updates in place
+        rows[0] = rows[0].replace(",5000,", ",6000,")
+        import_records("donations", donations_csv(*rows))
+        self.assertEqual(Donation.objects.count(), 3)
+        self.assertEqual(Donation.objects.get(processor_reference_id="1001").amount, 6000)
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        errors = []
+        counts = import_records(
+            "donations",
+            donations_csv(
+                "ana@example.com,,,5000,USD,succeeded,one_time,check,1,,2019-03-04",
+                "not-an-email,,,abc,USD,succeeded,one_time,check,2,,",
+                "ana@example.com,,,100,USD,succeeded,one_time,check,3,999,",
+            ),
+            on_error=lambda line, row, row_errors: errors.append((line, sorted(row_errors))),
+        )
+
+        self.assertEqual(counts, {"imported": 1, "invalid": 2})
+        self.assertEqual(errors, [(3, ["amount", "email"]), (4, ["event"])])
+        self.assertEqual(list(Donation.objects.values_list("processor_reference_id", flat=True)), ["1"])
+
+    def test_repeated_keys_in_a_chunk_are_written_once(self):
+        errors = []
+        counts = import_records(
+            "donations",
+            donations_csv(
+                "ana@example.com,,,5000,USD,succeeded,one_time,check,1,,2019-03-04",
+                "ana@example.com,,,6000,USD,succeeded,one_time,check,1,,2019-03-04",
+            ),
+            on_error=lambda line, row, row_errors: errors.append((line, row_errors)),
+        )
+
+        self.assertEqual(counts, {"imported": 1, "invalid": 1})
+        self.assertEqual([line for line, _ in errors], [2])
+        self.assertIn("line 3", errors[0][1]["non_field_errors"][0])
+        self.assertEqual(Donation.objects.get().amount, 6000)
+
+    def test_queries_per_chunk_do_not_grow_with_rows(self):
+        def queries(count, offset):
+            rows = [
+                f"donor{i}@example.com,,,100,USD,pending,one_time,check,{offset + i},,2019-03-04"
+                for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as captured:
+                import_records("donations", donations_csv(*rows), chunk_size=50)
+            return len(captured)
+
+        self.assertEqual(queries(3, offset=0), queries(40, offset=100))
+
+    def test_dry_run_writes_nothing(self):
+        counts = import_records(
+            "donations", donations_csv("new@example.com,,,100,USD,succeeded,one_time,check,1,,"), dry_run=True
+        )
+
+        self.assertEqual(counts["imported"], 1)
+        self.assertFalse(Donation.objects.exists())
+        self.assertFalse(Person.objects.filter(email="new@example.com").exists())
+
+
+class ImportRecordsCommandTests(TestCase):
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return path
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_volunteers_keep_historical_dates_and_report_errors(self):
+        source = self.write(
+            "volunteers.csv",
+            "full_name,email,phone,availability,created_at\n"
+            "Rosa Diaz,Rosa@Example.com,956-555-0100,Weekends,2018-06-01\n"
+            "No Phone,np@example.com,,,2018-06-02\n"
+            "No Date,nd@example.com,956-555-0101,,\n",
+        )
+        report = os.path.join(self.tmp.name, "errors.csv")
+        out = StringIO()
+
+        call_command("import_records", "volunteers", source, errors=report, stdout=out)
+        call_command("import_records", "volunteers", source, errors=report, stdout=StringIO())
+
+        volunteer = VolunteerProfile.objects.get()
+        self.assertEqual(volunteer.email, "rosa@example.com")
+        self.assertEqual((volunteer.person.email, volunteer.person.last_name), ("rosa@example.com", "Diaz"))
+        self.assertEqual(volunteer.created_at, timezone.make_aware(datetime(2018, 6, 1)))
+        self.assertIn("Imported 1 and rejected 2 of 3 volunteers row(s)", out.getvalue())
+        with open(report, newline="") as f:
+            rejected = list(csv.DictReader(f))
+        self.assertEqual(
+            [(row["line"], row["email"]) for row in rejected], [("3", "np@example.com"), ("4", "nd@example.com")]
+        )
+        self.assertIn("phone", rejected[0]["errors"])
+        # The date is part of the upsert key, so a dateless row would duplicate on every re-run
+        self.assertIn("created_at", rejected[1]["errors"])
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# What a web worker imports before serving its first request
+STARTUP = """
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+"""
+
+# SDKs that must only load when a request actually needs them
+LAZY_MODULES = {"stripe", "boto3", "botocore", "cloudinary", "PIL"}
+
+# Total import time on a developer laptop is 745-815 ms, ~140 ms of it psycopg
+# and ~125 ms requests (both loaded by rest_framework.compat); override on
+# slow CI runners
+BUDGET_MS = int(os.environ.get("STARTUP_IMPORT_BUDGET_MS", 900))
+
+
+class StartupImportTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE="backend.settings")
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", STARTUP],
+            cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        # "import time: <self us> | <cumulative us> | <indent><module>"
+        cls.imports = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, _, module = line[len("import time:"):].split("|")
+            cls.imports[module.strip()] = int(self_us)
+
+    def test_heavy_sdks_are_not_imported_at_startup(self):
+        loaded = {module.split(".")[0] for module in self.imports} & LAZY_MODULES
+        self.assertFalse(loaded, f"imported at startup: {sorted(loaded)}")
+
+    def test_startup_import_time_is_within_budget(self):
+        total_ms = sum(self.imports.values()) / 1000
+        slowest = sorted(self.imports.items(), key=lambda item: -item[1])[:5]
+        self.assertLessEqual(
+            total_ms, BUDGET_MS,
+            f"startup imports took {total_ms:.0f} ms; slowest: {slowest}",
+        )
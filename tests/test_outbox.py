@@ -0,0 +1,78 @@
+from io import StringIO
+import json
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.emails import dispatch_pending, queue_email
+from core.models import ContactMessage, OutboundEmail
+
+
+class OutboxTests(TestCase):
+    def submit_contact(self):
+        return self.client.post(
+            "/api/contact/",
+            data=json.dumps({
+                "name": "Test Submitter",
+                "email": "tester@example.com",
+                "subject": "Holiday Drive",
+                "message": "Hello!",
+            }),
+            content_type="application/json",
+        )
+
+    def test_form_submit_only_enqueues(self):
+        response = self.submit_contact()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(ContactMessage.objects.filter(email="tester@example.com").exists())
+        self.assertEqual(len(mail.outbox), 0)
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.status, "pending")
+        self.assertEqual(queued.recipients, ["info@nourishlaredo.com"])
+
+    def test_dispatcher_sends_pending_email(self):
+        self.submit_contact()
+        call_command("send_queued_email", stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "New Contact: Holiday Drive")
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.status, "sent")
+        self.assertIsNotNone(queued.sent_at)
+
+    def test_failed_send_is_retried_with_backoff(self):
+        self.submit_contact()
+        with patch("django.core.mail.EmailMessage.send", side_effect=OSError("SMTP down")):
+            dispatch_pending(max_attempts=2)
+
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.status, "pending")
+        self.assertEqual(queued.attempts, 1)
+        self.assertGreater(queued.next_attempt_at, queued.created_at)
+        self.assertEqual(dispatch_pending(), 0)  # not due yet
+
+        OutboundEmail.objects.update(next_attempt_at=queued.created_at)
+        with patch("django.core.mail.EmailMessage.send", side_effect=OSError("SMTP down")):
+            dispatch_pending(max_attempts=2)
+        self.assertEqual(OutboundEmail.objects.get().status, "failed")
+
+    def test_crash_mid_batch_keeps_sent_messages_sent(self):
+        queue_email("First", "Hello!", ["a@example.com"])
+        queue_email("Second", "Hello!", ["b@example.com"])
+        with patch("django.core.mail.EmailMessage.send", side_effect=[1, KeyboardInterrupt]):
+            with self.assertRaises(KeyboardInterrupt):
+                dispatch_pending()
+
+        first, second = OutboundEmail.objects.order_by("id")
+        self.assertEqual(first.status, "sent")
+        self.assertEqual(second.status, "sending")
+        self.assertEqual(dispatch_pending(), 0)  # still leased
+
+        OutboundEmail.objects.filter(pk=second.pk).update(next_attempt_at=second.created_at)
+        dispatch_pending()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(OutboundEmail.objects.get(pk=second.pk).status, "sent")
+
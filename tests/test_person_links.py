@@ -0,0 +1,151 @@
+import json
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.models import ContactMessage, Donation, Event, NewsletterSubscriber, PartnerInquiry, Person, VolunteerProfile
+from core.people import link_people
+
+
+class SubmissionLinkTests(TestCase):
+    def setUp(self):
+        caches["throttle"].clear()
+        self.addCleanup(caches["throttle"].clear)
+
+    def post(self, url, data):
+        response = self.client.post(url, data=json.dumps(data), content_type="application/json")
+        self.assertEqual(response.status_code, 201, response.content)
+        return response
+
+    def test_every_form_links_the_same_person(self):
+        volunteer = self.post("/api/volunteer-signup/", {
+            "full_name": "Rosa Diaz", "email": "Rosa@Example.com", "phone": "956-555-0100",
+        })
+        self.post("/api/contact/", {"name": "Rosa", "email": "rosa@example.com ", "message": "Hello!"})
+        self.post("/api/partners/inquiry/", {
+            "organization_name": "H-E-B", "contact_name": "Rosa Diaz", "email": "ROSA@example.com",
+            "partnership_type": "in_kind", "message": "We can donate produce.",
+        })
+        self.post("/api/newsletter/subscribe/", {"email": "rosa@example.com"})
+
+        person = Person.objects.get()
+        self.assertEqual((person.email, person.first_name, person.last_name), ("rosa@example.com", "Rosa", "Diaz"))
+        for model in (VolunteerProfile, ContactMessage, PartnerInquiry, NewsletterSubscriber):
+            self.assertEqual(model.objects.get().person, person)
+        # The link is internal; submitters can't see or set it
+        self.assertNotIn("person", volunteer.json())
+
+    def test_submissions_do_not_rename_a_known_person(self):
+        donor = Person.objects.create(email="rosa@example.com", first_name="Rosa", last_name="Diaz")
+        updated_at = donor.updated_at
+
+        self.post("/api/contact/", {"name": "Someone Else", "email": "Rosa@example.com", "message": "Hello!"})
+        self.post("/api/volunteer-signup/", {"full_name": "Mallory", "email": "rosa@example.com", "phone": "1"})
+
+        donor.refresh_from_db()
+        self.assertEqual((donor.first_name, donor.last_name, donor.updated_at), ("Rosa", "Diaz", updated_at))
+        self.assertEqual(ContactMessage.objects.get().person, donor)
+        self.assertEqual(VolunteerProfile.objects.get().person, donor)
+
+
+class LinkPeopleTests(TestCase):
+    def test_backfill_links_by_normalized_email_in_batches(self):
+        ana = Person.objects.create(email="ana@example.com", first_name="Ana")
+        for i, email in enumerate(["Ana@Example.com", "luis@example.com", "LUIS@example.com ", "maria@example.com"]):
+            ContactMessage.objects.create(name=f"Sender {i}", email=email, message="Hi")
+        NewsletterSubscriber.objects.create(email="ana@example.com")
+
+        out = StringIO()
+        call_command("link_people", "--batch-size", "2", stdout=out)
+
+        self.assertIn("Linked 4 contacts row(s).", out.getvalue())
+        self.assertIn("Linked 1 subscribers row(s).", out.getvalue())
+        links = dict(ContactMessage.objects.values_list("email", "person__email"))
+        self.assertEqual(links, {
+            "Ana@Example.com": "ana@example.com",
+            "luis@example.com": "luis@example.com",
+            "LUIS@example.com ": "luis@example.com",
+            "maria@example.com": "maria@example.com",
+        })
+        self.assertEqual(Person.objects.get(email="ana@example.com").first_name, "Ana")
+        self.assertEqual(Person.objects.get(email="luis@example.com").first_name, "Sender")
+        self.assertEqual(NewsletterSubscriber.objects.get().person, ana)
+
+        # Linked rows are skipped on the next run
+        self.assertEqual(link_people(ContactMessage, "name"), 0)
+
+    def test_queries_per_batch_do_not_grow_with_rows(self):
+        def queries(count, offset):
+            ContactMessage.objects.bulk_create(
+                ContactMessage(name="Sender", email=f"sender{offset + i}@example.com", message="Hi") for i in range(count)
+            )
+            with CaptureQueriesContext(connection) as captured:
+                link_people(ContactMessage, "name", batch_size=50)
+            return len(captured)
+
+        self.assertEqual(queries(3, offset=0), queries(40, offset=100))
+
+
+class PersonTimelineTests(TestCase):
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.create_superuser("staff", password="pw"))
+        self.person = Person.objects.create(email="rosa@example.com", first_name="Rosa")
+        self.event = Event.objects.create(title="Santa Run 5K", description="", date=date(2025, 12, 6), location="Laredo")
+        self.now = timezone.now()
+
+    def add_history(self, count, offset=0):
+        for i in range(offset, offset + count):
+            at = self.now - timedelta(days=i)
+            Donation.objects.create(
+                person=self.person, event=self.event, amount=100, status="succeeded",
+                processor_reference_id=f"pi_{i}", created_at=at,
+            )
+            VolunteerProfile.objects.create(
+                person=self.person, full_name="Rosa", email="rosa@example.com", phone="1", created_at=at,
+            )
+            ContactMessage.objects.create(person=self.person, name="Rosa", email="rosa@example.com", message=f"Hi {i}")
+            PartnerInquiry.objects.create(
+                person=self.person, organization_name="H-E-B", contact_name="Rosa", email="rosa@example.com",
+                partnership_type="other", message="Hi",
+            )
+
+    def timeline(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/api/people/{self.person.pk}/timeline/")
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(queries)
+
+    def test_everything_is_fetched_in_a_constant_number_of_queries(self):
+        self.add_history(1)
+        NewsletterSubscriber.objects.create(person=self.person, email="rosa@example.com")
+        data, few = self.timeline()
+
+        self.assertEqual(data["person"]["email"], "rosa@example.com")
+        self.assertEqual(
+            sorted(entry["type"] for entry in data["timeline"]),
+            ["contact_message", "donation", "newsletter_subscription", "partner_inquiry", "volunteer_signup"],
+        )
+        donation = next(entry for entry in data["timeline"] if entry["type"] == "donation")
+        self.assertEqual(donation["event"], "Santa Run 5K")
+
+        self.add_history(5, offset=1)
+        data, many = self.timeline()
+        self.assertEqual(len(data["timeline"]), 25)
+        self.assertEqual(many, few)
+        created = [parse_datetime(entry["created_at"]) for entry in data["timeline"]]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_staff_only_and_unknown_people(self):
+        self.assertEqual(
+            self.client.get("/api/people/00000000-0000-0000-0000-000000000000/timeline/").status_code, 404
+        )
+        self.client.logout()
+        self.assertEqual(self.client.get(f"/api/people/{self.person.pk}/timeline/").status_code, 403)
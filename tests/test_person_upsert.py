@@ -0,0 +1,74 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import Client, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Donation, Person, WebhookEvent
+from core.people import get_or_create_person, upsert_person
+from tests_webhooks import sign
+
+
+class PersonUpsertTests(TestCase):
+    def test_insert_is_one_statement_and_email_is_case_folded(self):
+        with CaptureQueriesContext(connection) as queries:
+            person = get_or_create_person("  Jane.Doe@Example.COM ", "Jane Doe")
+        self.assertEqual(len(queries), 1)
+        self.assertEqual((person.email, person.first_name, person.last_name), ("jane.doe@example.com", "Jane", "Doe"))
+
+        self.assertEqual(get_or_create_person("JANE.DOE@example.com", "Jane Doe").pk, person.pk)
+        self.assertEqual(Person.objects.count(), 1)
+
+    def test_unchanged_row_is_not_rewritten(self):
+        person = upsert_person("donor@example.com", "Jane", "Doe")
+        Person.objects.filter(pk=person.pk).update(updated_at=person.created_at)
+
+        self.assertEqual(upsert_person("donor@example.com", "Jane", "Doe").updated_at, person.created_at)
+        # Blank names never erase known ones
+        self.assertEqual(upsert_person("donor@example.com").last_name, "Doe")
+
+        changed = upsert_person("donor@example.com", "Janet")
+        self.assertEqual((changed.first_name, changed.last_name), ("Janet", "Doe"))
+        self.assertGreater(changed.updated_at, person.created_at)
+
+
+# SQLite's shared in-memory test database locks whole tables, so real
+# concurrent writers need Postgres (run with DATABASE_URL set)
+@skipUnlessDBFeature("has_select_for_update_skip_locked")
+class ConcurrentWebhookPersonTests(TransactionTestCase):
+    parallel = 8
+
+    def post_invoice(self, index):
+        payload = json.dumps({
+            "id": f"evt_parallel_{index}",
+            "type": "invoice.payment_succeeded",
+            "data": {"object": {
+                "id": f"in_parallel_{index}",
+                "amount_paid": 2500,
+                "customer_email": "Monthly.Donor@example.com" if index % 2 else "monthly.donor@example.com",
+                "customer_name": "Monthly Donor",
+                "subscription": "sub_parallel",
+            }},
+        })
+        try:
+            return Client().post(
+                "/api/donations/webhook/", data=payload, content_type="application/json",
+                HTTP_STRIPE_SIGNATURE=sign(payload),
+            ).status_code
+        finally:
+            connections.close_all()
+
+    def test_parallel_invoices_for_one_donor_create_one_person(self):
+        with ThreadPoolExecutor(max_workers=self.parallel) as pool:
+            statuses = list(pool.map(self.post_invoice, range(self.parallel)))
+        self.assertEqual(statuses, [200] * self.parallel)
+
+        call_command("process_webhook_events", workers=self.parallel, stdout=StringIO())
+
+        self.assertEqual(WebhookEvent.objects.filter(status="processed").count(), self.parallel)
+        person = Person.objects.get()
+        self.assertEqual(person.email, "monthly.donor@example.com")
+        self.assertEqual(Donation.objects.filter(person=person).count(), self.parallel)
@@ -0,0 +1,119 @@
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models import Donation, DonationDailyRollup, Person, SyncWatermark
+from core.rollups import record_succeeded_donation
+
+
+class StubList:
+    """Stands in for a Stripe ListObject: lazily yields objects like auto_paging_iter()."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.consumed = 0
+
+    def auto_paging_iter(self):
+        for obj in self.objects:
+            self.consumed += 1
+            yield obj
+
+
+# 2025-03-04 12:00 UTC, weeks before any test runs
+PAID = 1741089600
+
+
+def session(session_id, payment_status="paid", status="complete", amount=5000):
+    return {"id": session_id, "mode": "payment", "payment_status": payment_status,
+            "status": status, "amount_total": amount, "currency": "usd", "created": PAID,
+            "customer": "cus_1", "customer_details": {"email": "Donor@Example.com", "name": "Jane Doe"}}
+
+
+def invoice(invoice_id, email="monthly@example.com"):
+    return {"id": invoice_id, "subscription": "sub_1", "amount_paid": 2500, "currency": "usd",
+            "customer_email": email, "customer_name": "Monthly Donor",
+            "created": PAID - 3600, "status_transitions": {"paid_at": PAID}}
+
+
+class ReconcileStripeTests(TestCase):
+    def run_command(self, sessions, invoices, *args):
+        with patch("stripe.checkout.Session.list", return_value=StubList(sessions)) as session_list, \
+                patch("stripe.Invoice.list", return_value=StubList(invoices)):
+            out = StringIO()
+            call_command("reconcile_stripe", *args, stdout=out)
+        return session_list, out.getvalue()
+
+    def test_repairs_and_backfills_donations(self):
+        Donation.objects.create(amount=5000, status="pending", processor_reference_id="cs_paid")
+        Donation.objects.create(amount=1000, status="pending", processor_reference_id="cs_expired")
+        Donation.objects.create(amount=2500, status="succeeded", kind="recurring", processor_reference_id="in_known")
+
+        self.run_command(
+            [session("cs_paid"), session("cs_expired", "unpaid", "expired"), session("cs_orphan", amount=7500)],
+            [invoice("in_known"), invoice("in_lost")],
+            "--since", "2025-03-01",
+        )
+
+        statuses = dict(Donation.objects.values_list("processor_reference_id", "status"))
+        self.assertEqual(statuses, {
+            "cs_paid": "succeeded", "cs_expired": "failed", "cs_orphan": "succeeded",
+            "in_known": "succeeded", "in_lost": "succeeded",
+        })
+        self.assertEqual(Donation.objects.get(processor_reference_id="in_lost").person, Person.objects.get(email="monthly@example.com"))
+        donor = Person.objects.get(email="donor@example.com")
+        self.assertEqual(donor.stripe_customer_id, "cus_1")
+        self.assertEqual(Donation.objects.get(processor_reference_id="cs_paid").person, donor)
+        orphan = Donation.objects.get(processor_reference_id="cs_orphan")
+        self.assertEqual((orphan.person, orphan.created_at), (donor, datetime.fromtimestamp(PAID, tz=dt_timezone.utc)))
+        self.assertEqual(Donation.objects.get(processor_reference_id="in_lost").created_at, orphan.created_at)
+        # Backfilled payments count on the day they were paid, not the day of the repair
+        paid_day = DonationDailyRollup.objects.filter(date=timezone.localdate(orphan.created_at))
+        self.assertEqual(sorted(paid_day.values_list("kind", "total_amount")), [("one_time", 7500), ("recurring", 2500)])
+        # Only donations the run repaired are added; in_known was never pending or missing
+        self.assertEqual(sum(DonationDailyRollup.objects.values_list("total_amount", flat=True)), 5000 + 7500 + 2500)
+        self.assertTrue(SyncWatermark.objects.filter(name="stripe_reconcile").exists())
+
+    def test_a_webhook_landing_mid_run_wins(self):
+        Donation.objects.create(amount=5000, status="pending", processor_reference_id="cs_paid")
+        Donation.objects.create(amount=1000, status="pending", processor_reference_id="cs_expired")
+
+        def webhook_meanwhile(session):
+            # The webhooks succeed both rows after reconcile read them as pending
+            for donation in Donation.objects.filter(status="pending"):
+                Donation.objects.filter(pk=donation.pk).update(status="succeeded")
+                donation.status = "succeeded"
+                record_succeeded_donation(donation)
+            return None
+
+        with patch("core.reconcile.session_donor", side_effect=webhook_meanwhile):
+            _, out = self.run_command(
+                [session("cs_paid"), session("cs_expired", "unpaid", "expired")], [], "--since", "2025-03-01",
+            )
+
+        self.assertIn("0 donation(s) updated, 0 created", out)
+        self.assertEqual(set(Donation.objects.values_list("status", flat=True)), {"succeeded"})
+        self.assertEqual(sum(DonationDailyRollup.objects.values_list("total_amount", flat=True)), 5000 + 1000)
+
+    def test_one_lookup_query_per_page(self):
+        sessions = [session(f"cs_{i}") for i in range(250)]
+        Donation.objects.bulk_create(
+            Donation(amount=5000, status="succeeded", processor_reference_id=s["id"]) for s in sessions
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.run_command(sessions, [], "--page-size", "100")
+        lookups = [q for q in queries.captured_queries if 'FROM "core_donation"' in q["sql"] and " IN (" in q["sql"]]
+        self.assertEqual(len(lookups), 3)
+
+    def test_dry_run_writes_nothing(self):
+        Donation.objects.create(amount=5000, status="pending", processor_reference_id="cs_paid")
+        _, out = self.run_command([session("cs_paid"), session("cs_orphan")], [invoice("in_lost")], "--dry-run", "--since", "2025-01-01")
+
+        self.assertIn("1 donation(s) updated, 2 created (dry run)", out)
+        self.assertEqual(Donation.objects.get().status, "pending")
+        self.assertFalse(SyncWatermark.objects.exists())
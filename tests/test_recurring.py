@@ -21,7 +21,8 @@ django.setup()
 # 3. NOW WE CAN IMPORT DJANGO TOOLS
 from django.test import Client
 from django.conf import settings
-from core.models import Donation, Person
+from django.core.management import call_command
+from core.models import Donation, Person, WebhookEvent
 
 def run_recurring_test():
     print("\n--- 🔄 SIMULATING RECURRING PAYMENT WEBHOOK ---")
@@ -32,6 +33,7 @@ def run_recurring_test():
     
     # Pre-test cleanup
     Donation.objects.filter(processor_reference_id=FAKE_INVOICE_ID).delete()
+    WebhookEvent.objects.filter(event_id="evt_test_recurring").delete()
 
     # Construct the Stripe Invoice Payload
     # This simulates what Stripe sends every month for a subscription
@@ -66,6 +68,9 @@ def run_recurring_test():
     )
 
     print(f"📡 Webhook Status Code: {response.status_code}")
+
+    # The endpoint only records the event; run the worker to apply it
+    call_command("process_webhook_events", workers=1)
     
     # Final Verification
     donation_exists = Donation.objects.filter(processor_reference_id=FAKE_INVOICE_ID).exists()
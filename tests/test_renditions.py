@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+from datetime import date
+from io import BytesIO, StringIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.test import TestCase
+from PIL import Image
+
+from core.models import Event
+
+
+def jpeg(width, height):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "orange").save(buffer, format="JPEG")
+    return ContentFile(buffer.getvalue(), name="Santa_Run_5K.jpg")
+
+
+class RenditionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.field = Event._meta.get_field("image")
+        self.original_storage = self.field.storage
+        self.field.storage = FileSystemStorage(location=self.media_root, base_url="https://media.example.com/")
+
+    def tearDown(self):
+        self.field.storage = self.original_storage
+        shutil.rmtree(self.media_root)
+
+    def test_upload_is_queued_then_rendered_off_request(self):
+        event = Event.objects.create(title="Santa Run", description="", date=date(2025, 12, 6), location="Laredo", image=jpeg(800, 400))
+        event.refresh_from_db()
+        self.assertEqual(event.image_renditions, {})
+        self.assertIsNone(self.client.get("/api/events/").json()[0]["image_srcset"])
+
+        call_command("generate_renditions", stdout=StringIO())
+
+        event.refresh_from_db()
+        manifest = event.image_renditions
+        self.assertEqual(manifest["source"], event.image.name)
+        self.assertEqual(sorted(manifest["formats"]["webp"], key=int), ["320", "640", "800"])
+        for key in manifest["formats"]["webp"].values():
+            self.assertTrue(self.field.storage.exists(key))
+            self.assertTrue(key.startswith("events/Santa_Run_5K_"))
+
+        srcset = self.client.get("/api/events/").json()[0]["image_srcset"]
+        self.assertIn("https://media.example.com/events/Santa_Run_5K_320w.webp 320w", srcset["webp"])
+
+    def test_replacing_image_deletes_old_renditions(self):
+        event = Event.objects.create(title="Santa Run", description="", date=date(2025, 12, 6), location="Laredo", image=jpeg(400, 200))
+        call_command("generate_renditions", stdout=StringIO())
+        event.refresh_from_db()
+        old_keys = list(event.image_renditions["formats"]["webp"].values())
+
+        event.title = "Santa Run 5K"
+        event.save()
+        event.refresh_from_db()
+        self.assertNotEqual(event.image_renditions, {})
+
+        event.image = jpeg(300, 300)
+        event.save()
+        event.refresh_from_db()
+        self.assertEqual(event.image_renditions, {})
+        for key in old_keys:
+            self.assertFalse(self.field.storage.exists(key))
+
+    def test_forced_rebuild_replaces_rendition_files(self):
+        Event.objects.create(title="Santa Run", description="", date=date(2025, 12, 6), location="Laredo", image=jpeg(400, 200))
+        call_command("generate_renditions", stdout=StringIO())
+        call_command("generate_renditions", "--force", stdout=StringIO())
+
+        keys = list(Event.objects.get().image_renditions["formats"]["webp"].values())
+        webp = [name for name in os.listdir(os.path.join(self.media_root, "events")) if name.endswith(".webp")]
+        self.assertEqual(sorted(webp), sorted(os.path.basename(key) for key in keys))
@@ -0,0 +1,84 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from core.models import Event, Partner
+from core.search import search
+
+
+class SiteSearchTests(TestCase):
+    def setUp(self):
+        caches["throttle"].clear()
+        self.addCleanup(caches["throttle"].clear)
+        self.run = Event.objects.create(
+            title="Santa Run 5K", description="Run with Santa <b>downtown</b> to fight hunger.",
+            date=date(2025, 12, 6), location="Laredo",
+        )
+        self.drive = Event.objects.create(
+            title="Food Drive", description="Bring canned food. Running shoes optional.",
+            date=date(2025, 11, 6), location="Laredo College",
+        )
+        self.partner = Partner.objects.create(name="H-E-B", description="Grocery partner for the food drive")
+
+    def search(self, query):
+        response = self.client.get(f"/api/search/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_title_matches_rank_above_description_matches(self):
+        data = self.search("q=running")
+
+        self.assertEqual([event["id"] for event in data["events"]], [self.run.id, self.drive.id])
+        self.assertEqual(data["events"][0]["highlight"], "Santa <mark>Run</mark> 5K")
+        self.assertIn("<mark>Running</mark>", data["events"][1]["snippet"])
+        self.assertEqual(data["partners"], [])
+
+    def test_highlights_escape_stored_markup(self):
+        snippet = self.search("q=downtown&type=events")["events"][0]["snippet"]
+
+        self.assertNotIn("<b>", snippet)
+        self.assertIn("<mark>downtown</mark>", snippet)
+
+    def test_index_follows_writes(self):
+        self.drive.description = "Bring rice and beans."
+        self.drive.save()
+        Partner.objects.filter(pk=self.partner.pk).update(description="Sponsors the rice drive")
+        self.run.delete()
+
+        data = self.search("q=rice")
+        self.assertEqual([event["id"] for event in data["events"]], [self.drive.id])
+        self.assertEqual([partner["id"] for partner in data["partners"]], [self.partner.id])
+        self.assertEqual(self.search("q=santa")["events"], [])
+
+    def test_query_syntax_in_user_input_is_literal(self):
+        for q in ['"unbalanced', "food OR", "NEAR(food drive)", "*", "food -drive"]:
+            with self.subTest(q=q):
+                response = self.client.get("/api/search/", {"q": q})
+                self.assertEqual(response.status_code, 200)
+
+    def test_bad_params(self):
+        self.assertEqual(self.client.get("/api/search/").status_code, 400)
+        self.assertEqual(self.client.get("/api/search/?q=food&type=donations").status_code, 400)
+        self.assertEqual(self.client.get("/api/search/?q=food&limit=x").status_code, 400)
+        self.assertEqual(len(self.search("q=food&type=events&limit=1")["events"]), 1)
+
+    def test_unknown_types_are_rejected_by_search_itself(self):
+        with self.assertRaisesMessage(ValueError, "Unknown search type: donations"):
+            search("donations", "food", 5)
+
+    def test_other_backends_fall_back_to_substring_matches(self):
+        with patch("core.search.connection") as connection, self.assertLogs("core.search", "WARNING"):
+            connection.vendor = "mysql"
+            rows = search("events", "canned", 5)
+
+        self.assertEqual([row["id"] for row in rows], [self.drive.id])
+        self.assertEqual(rows[0]["highlight"], "Food Drive")
+
+    @override_settings(REST_FRAMEWORK={"NUM_PROXIES": 1, "DEFAULT_THROTTLE_RATES": {"search.ip": "2/min"}})
+    def test_searches_are_throttled_per_ip(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get("/api/search/?q=food", REMOTE_ADDR="203.0.113.7").status_code, 200)
+        self.assertEqual(self.client.get("/api/search/?q=food", REMOTE_ADDR="203.0.113.7").status_code, 429)
+        self.assertEqual(self.client.get("/api/search/?q=food", REMOTE_ADDR="203.0.113.8").status_code, 200)
@@ -0,0 +1,23 @@
+from django.test import SimpleTestCase
+
+from core.models import Event, Partner
+from core.s3 import MediaStorage
+from core.storage import get_media_storage
+
+
+class MediaStorageTests(SimpleTestCase):
+    def test_media_fields_share_one_storage(self):
+        self.assertIs(Event._meta.get_field("image").storage, get_media_storage())
+        self.assertIs(Partner._meta.get_field("logo").storage, get_media_storage())
+
+    def test_public_urls_are_built_without_boto3(self):
+        storage = MediaStorage(custom_domain="media.example.com")
+        self.assertEqual(storage.url("events/Santa Run.jpg"), "https://media.example.com/events/Santa%20Run.jpg")
+
+        storage = MediaStorage(custom_domain=None, bucket_name="bucket", region_name="us-east-1")
+        self.assertEqual(storage.url("partners/logo.png"), "https://bucket.s3.us-east-1.amazonaws.com/partners/logo.png")
+
+    def test_connections_reuse_the_process_session(self):
+        first, second = MediaStorage(), MediaStorage()
+        self.assertIs(first._create_session(), second._create_session())
+        self.assertIsNotNone(first.connection)
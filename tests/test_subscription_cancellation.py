@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.models import OutboundEmail, Person
+from core.webhooks import handle_recurring_payment, handle_subscription_deleted
+
+
+class SubscriptionCancellationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("stripe.Customer.retrieve")
+    def test_known_customer_is_resolved_locally(self, retrieve):
+        handle_recurring_payment({
+            "id": "in_1", "amount_paid": 2500, "subscription": "sub_1",
+            "customer": "cus_local", "customer_email": "Monthly@example.com", "customer_name": "Monthly Donor",
+        })
+        self.assertEqual(Person.objects.get().stripe_customer_id, "cus_local")
+
+        handle_subscription_deleted({"id": "sub_1", "customer": "cus_local"})
+
+        retrieve.assert_not_called()
+        self.assertIn("monthly@example.com", OutboundEmail.objects.get().body)
+
+    @patch("stripe.Customer.retrieve", return_value=SimpleNamespace(email="Legacy@example.com"))
+    def test_unknown_customer_falls_back_to_cached_stripe_lookup(self, retrieve):
+        legacy = Person.objects.create(email="legacy@example.com")
+
+        handle_subscription_deleted({"id": "sub_2", "customer": "cus_remote"})
+        handle_subscription_deleted({"id": "sub_3", "customer": "cus_remote"})
+
+        retrieve.assert_called_once_with("cus_remote")
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.stripe_customer_id, "cus_remote")
+
+    @patch("stripe.Customer.retrieve", return_value=SimpleNamespace(email="stranger@example.com"))
+    def test_stripe_lookup_is_cached_without_a_person(self, retrieve):
+        for _ in range(3):
+            handle_subscription_deleted({"id": "sub_4", "customer": "cus_stranger"})
+
+        retrieve.assert_called_once_with("cus_stranger")
+        self.assertEqual(OutboundEmail.objects.count(), 3)
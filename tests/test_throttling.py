@@ -0,0 +1,112 @@
+import json
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import AsyncRequestFactory, TestCase, override_settings
+
+from core import async_views
+from core.models import ContactMessage, OutboundEmail
+from core.throttling import IPThrottle
+
+RATES = {
+    "contact.ip": "3/hour",
+    "contact.email": "2/hour",
+    "volunteer_signup.ip": "3/hour",
+    "volunteer_signup.email": "2/hour",
+    "partner_inquiry.ip": "3/hour",
+    "partner_inquiry.email": "2/hour",
+    "newsletter.ip": "3/hour",
+    "newsletter.email": "2/hour",
+}
+
+
+@override_settings(REST_FRAMEWORK={"NUM_PROXIES": 1, "DEFAULT_THROTTLE_RATES": RATES})
+class FormThrottleTests(TestCase):
+    def setUp(self):
+        caches["throttle"].clear()
+        self.addCleanup(caches["throttle"].clear)
+
+    def post_contact(self, email, ip="203.0.113.7"):
+        return self.client.post(
+            "/api/contact/",
+            data=json.dumps({"name": "Ana", "email": email, "subject": "Hi", "message": "Hello"}),
+            content_type="application/json",
+            REMOTE_ADDR=ip,
+        )
+
+    def test_ip_limit_rejects_before_any_work(self):
+        for i in range(3):
+            self.assertEqual(self.post_contact(f"person{i}@example.com").status_code, 201)
+
+        with patch("core.views.ContactMessageSerializer") as serializer:
+            response = self.post_contact("person9@example.com")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        serializer.assert_not_called()
+        self.assertEqual(ContactMessage.objects.count(), 3)
+        self.assertEqual(OutboundEmail.objects.count(), 3)
+
+    def test_email_limit_applies_across_addresses(self):
+        self.assertEqual(self.post_contact("Ana@Example.com", ip="198.51.100.1").status_code, 201)
+        self.assertEqual(self.post_contact("ana@example.com", ip="198.51.100.2").status_code, 201)
+        self.assertEqual(self.post_contact(" ana@example.com", ip="198.51.100.3").status_code, 429)
+
+    def test_scopes_are_counted_separately(self):
+        for i in range(3):
+            self.post_contact(f"person{i}@example.com")
+
+        response = self.client.post(
+            "/api/newsletter/subscribe/", data=json.dumps({"email": "reader@example.com"}),
+            content_type="application/json", REMOTE_ADDR="203.0.113.7",
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def test_client_address_comes_from_the_proxy_hop(self):
+        # A client-supplied X-Forwarded-For entry must not mint a fresh identity
+        for i in range(4):
+            response = self.client.post(
+                "/api/contact/",
+                data=json.dumps({"name": "Ana", "email": f"p{i}@example.com", "subject": "", "message": "x"}),
+                content_type="application/json",
+                HTTP_X_FORWARDED_FOR=f"10.0.0.{i}, 203.0.113.7",
+            )
+        self.assertEqual(response.status_code, 429)
+
+    async def test_async_views_share_the_limits(self):
+        factory = AsyncRequestFactory()
+        statuses = []
+        for i in range(4):
+            request = factory.post(
+                "/", data=json.dumps({"name": "Ana", "email": f"p{i}@example.com", "subject": "", "message": "x"}),
+                content_type="application/json",
+            )
+            statuses.append((await async_views.contact_submit(request)).status_code)
+
+        self.assertEqual(statuses, [201, 201, 201, 429])
+        self.assertEqual(await ContactMessage.objects.acount(), 3)
+
+
+@override_settings(REST_FRAMEWORK={"DEFAULT_THROTTLE_RATES": {"test": "10/min"}})
+class SlidingWindowTests(TestCase):
+    def setUp(self):
+        caches["throttle"].clear()
+        self.addCleanup(caches["throttle"].clear)
+
+    def throttle(self, now):
+        throttle = type("TestThrottle", (IPThrottle,), {"scope": "test"})()
+        throttle.timer = lambda: now
+        return throttle
+
+    def test_previous_window_is_weighted_by_overlap(self):
+        for _ in range(10):
+            self.assertTrue(self.throttle(now=600 + 50).allow("client"))
+
+        # 15 s into the next window, 3/4 of the previous one still counts: 7.5 + 1
+        throttle = self.throttle(now=660 + 15)
+        self.assertTrue(throttle.allow("client"))
+        self.assertTrue(self.throttle(now=660 + 15).allow("client"))
+        blocked = self.throttle(now=660 + 15)
+        self.assertFalse(blocked.allow("client"))
+        # 7.5 + 3 = 10.5 drops to 10 once the previous share is down to 7
+        self.assertAlmostEqual(blocked.wait(), 3.0)
@@ -12,7 +12,8 @@ django.setup()
 
 from django.conf import settings
 from django.test import Client
-from core.models import Donation, Person  # Update 'donations' to your app name
+from django.core.management import call_command
+from core.models import Donation, Person, WebhookEvent  # Update 'donations' to your app name
 
 def run_test():
     print("--- STARTING WEBHOOK TEST ---")
@@ -24,6 +25,7 @@ def run_test():
     # Clean up previous test runs
     Donation.objects.filter(processor_reference_id=FAKE_SESSION_ID).delete()
     Person.objects.filter(email="test_donor@example.com").delete()
+    WebhookEvent.objects.filter(event_id="evt_test_webhook").delete()
 
     # Create a Pending Donation
     donation = Donation.objects.create(
@@ -78,6 +80,9 @@ def run_test():
 
     print(f"📡 Webhook Response Code: {response.status_code}")
 
+    # The endpoint only records the event; run the worker to apply it
+    call_command("process_webhook_events", workers=1)
+
     if response.status_code != 200:
         print("❌ FAILED: Webhook did not return 200 OK.")
         print("   Check if STRIPE_WEBHOOK_SECRET in settings matches what you used here.")
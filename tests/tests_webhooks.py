@@ -1,32 +1,88 @@
 from django.test import TestCase, Client
 from django.urls import reverse
+from django.conf import settings
+from django.core.management import call_command
+from io import StringIO
+import hashlib
+import hmac
 import json
+import time
+
+
+def sign(payload):
+    timestamp = str(int(time.time()))
+    signature = hmac.new(
+        settings.STRIPE_WEBHOOK_SECRET.encode(), f"{timestamp}.{payload}".encode(), hashlib.sha256
+    ).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
 
 class WebhookTests(TestCase):
-    def test_recurring_payment_webhook(self):
-        client = Client()
-        # Mocking the JSON payload Stripe sends for a subscription payment
-        fake_payload = {
-            "type": "invoice.payment_succeeded",
-            "data": {
-                "object": {
-                    "customer_email": "test@example.com",
-                    "customer_name": "Test User",
-                    "amount_paid": 2500,
-                    "id": "in_test_123",
-                    "subscription": "sub_test_123"
-                }
+    fake_payload = {
+        "id": "evt_test_recurring",
+        "type": "invoice.payment_succeeded",
+        "data": {
+            "object": {
+                "customer_email": "test@example.com",
+                "customer_name": "Test User",
+                "amount_paid": 2500,
+                "id": "in_test_123",
+                "subscription": "sub_test_123"
             }
         }
-        
-        response = client.post(
-            reverse('stripe_webhook'), 
-            data=json.dumps(fake_payload),
+    }
+
+    def post_event(self, payload):
+        client = Client()
+        payload = json.dumps(payload)
+        return client.post(
+            reverse('stripe_webhook'),
+            data=payload,
             content_type="application/json",
-            HTTP_STRIPE_SIGNATURE="mock_signature" # You'll need to bypass signature check for local unit tests
+            HTTP_STRIPE_SIGNATURE=sign(payload),
         )
-        
+
+    def test_recurring_payment_webhook(self):
+        response = self.post_event(self.fake_payload)
         self.assertEqual(response.status_code, 200)
+
+        from core.models import Donation, WebhookEvent
+        self.assertEqual(WebhookEvent.objects.get().status, "pending")
+        self.assertFalse(Donation.objects.filter(processor_reference_id="in_test_123").exists())
+
+        call_command("process_webhook_events", workers=1, stdout=StringIO())
+        self.assertEqual(WebhookEvent.objects.get().status, "processed")
         # Check if the donation was actually created in your test database
-        from core.models import Donation
-        self.assertTrue(Donation.objects.filter(processor_reference_id="in_test_123").exists())
\ No newline at end of file
+        self.assertTrue(Donation.objects.filter(processor_reference_id="in_test_123").exists())
+
+    def test_duplicate_delivery_is_ignored(self):
+        for _ in range(3):
+            self.assertEqual(self.post_event(self.fake_payload).status_code, 200)
+        call_command("process_webhook_events", workers=1, stdout=StringIO())
+
+        from core.models import Donation, WebhookEvent
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+        self.assertEqual(Donation.objects.filter(processor_reference_id="in_test_123").count(), 1)
+
+    def test_same_invoice_under_new_event_id_is_recorded_once(self):
+        retry = json.loads(json.dumps(self.fake_payload))
+        retry["id"] = "evt_test_recurring_retry"
+        self.post_event(self.fake_payload)
+        self.post_event(retry)
+        call_command("process_webhook_events", workers=1, stdout=StringIO())
+
+        from core.models import Donation, WebhookEvent
+        self.assertEqual(WebhookEvent.objects.filter(status="processed").count(), 2)
+        self.assertEqual(Donation.objects.filter(processor_reference_id="in_test_123").count(), 1)
+
+    def test_bad_signature_is_rejected(self):
+        response = Client().post(
+            reverse('stripe_webhook'),
+            data=json.dumps(self.fake_payload),
+            content_type="application/json",
+            HTTP_STRIPE_SIGNATURE="mock_signature",
+        )
+        self.assertEqual(response.status_code, 400)
+
+        from core.models import WebhookEvent
+        self.assertFalse(WebhookEvent.objects.exists())